@@ -2,54 +2,84 @@
 # -*- coding: utf-8 -*-
 
 from __future__ import annotations
-from typing import Dict, Set, Tuple, List, Optional
+from typing import Dict, FrozenSet, Iterable, Set, Tuple, List, Optional
 from collections import deque
 import math
 import sys
 
 Pos = Tuple[int, int]  # (linha, coluna)
 
-DIGITOS = set(range(1, 10))
+ORDEM = 3  # lado do bloco; o tabuleiro tem ORDEM² x ORDEM² casas
+ORDEM_MAXIMA = 5
+SIMBOLOS = '123456789ABCDEFGHIJKLMNOP'  # valores 1..25 na forma de texto
 
 
-def bloco_id(l: int, c: int) -> int:
-    """Retorna o índice do bloco 3x3 (0..8) para a posição (l,c)."""
-    return (l // 3) * 3 + (c // 3)
+def bloco_id(l: int, c: int, ordem: int = ORDEM) -> int:
+    """Retorna o índice do bloco ordem x ordem (0..ordem²-1) para a posição (l,c)."""
+    return (l // ordem) * ordem + (c // ordem)
 
 
-def vizinhos_de(pos: Pos) -> Set[Pos]:
-    """Todos os vizinhos (mesma linha, coluna ou bloco 3x3)."""
+def vizinhos_de(pos: Pos, ordem: int = ORDEM) -> Set[Pos]:
+    """Todos os vizinhos (mesma linha, coluna ou bloco ordem x ordem)."""
     l, c = pos
+    lado = ordem * ordem
     v: Set[Pos] = set()
     # linha e coluna
-    for j in range(9):
+    for j in range(lado):
         if j != c:
             v.add((l, j))
-    for i in range(9):
+    for i in range(lado):
         if i != l:
             v.add((i, c))
     # bloco
-    bi, bj = (l // 3) * 3, (c // 3) * 3
-    for i in range(bi, bi + 3):
-        for j in range(bj, bj + 3):
+    bi, bj = (l // ordem) * ordem, (c // ordem) * ordem
+    for i in range(bi, bi + ordem):
+        for j in range(bj, bj + ordem):
             if (i, j) != pos:
                 v.add((i, j))
     return v
 
 
+_VIZINHOS: Dict[int, Dict[Pos, FrozenSet[Pos]]] = {}
+
+def tabela_vizinhos(ordem: int = ORDEM) -> Dict[Pos, FrozenSet[Pos]]:
+    """Vizinhos de todas as casas, calculados uma vez por tamanho."""
+    if ordem not in _VIZINHOS:
+        lado = ordem * ordem
+        _VIZINHOS[ordem] = {(i, j): frozenset(vizinhos_de((i, j), ordem))
+                            for i in range(lado) for j in range(lado)}
+    return _VIZINHOS[ordem]
+
+
+def ordem_do_lado(lado: int) -> int:
+    """Lado do bloco para um tabuleiro lado x lado (ValueError se não for N²)."""
+    ordem = math.isqrt(lado)
+    if ordem * ordem != lado or not 1 <= ordem <= ORDEM_MAXIMA:
+        raise ValueError(f"Tabuleiro {lado}x{lado} não é N²xN² (N até {ORDEM_MAXIMA}).")
+    return ordem
+
+
 class SudokuCSP:
-    def __init__(self, tabuleiro: List[List[int]]) -> None:
-        self.variaveis: List[Pos] = [(i, j) for i in range(9) for j in range(9)]
-        self.vizinhos: Dict[Pos, Set[Pos]] = {p: vizinhos_de(p) for p in self.variaveis}
+    def __init__(self, tabuleiro: List[List[int]], lcv: bool = True) -> None:
+        self.lado = len(tabuleiro)
+        self.ordem = ordem_do_lado(self.lado)
+        self.lcv = lcv  # False: valores em ordem crescente (só MRV)
+        self.variaveis: List[Pos] = [(i, j) for i in range(self.lado) for j in range(self.lado)]
+        self.vizinhos: Dict[Pos, FrozenSet[Pos]] = tabela_vizinhos(self.ordem)
+        digitos = range(1, self.lado + 1)
         # Domínios: {posição -> conjunto de valores possíveis}
         self.dominios: Dict[Pos, Set[int]] = {}
-        for i in range(9):
-            for j in range(9):
+        for i in range(self.lado):
+            for j in range(self.lado):
                 v = tabuleiro[i][j]
                 if v == 0:
-                    self.dominios[(i, j)] = set(DIGITOS)
+                    self.dominios[(i, j)] = set(digitos)
                 else:
                     self.dominios[(i, j)] = {v}
+        self.nos = 0  # nós visitados pelo backtracking
+        self.retrocessos = 0  # valores tentados que não levaram a solução
+        self.revisoes = 0  # chamadas de _revisar (AC-3)
+        self.valores_removidos = 0  # valores retirados pelo AC-3
         # Restrições binárias padrão de Sudoku: todos vizinhos devem ser diferentes
         self._aplicar_restricoes_iniciais()
 
@@ -68,33 +98,47 @@ class SudokuCSP:
 
     # -------------------- AC-3 -------------------- #
 
-    def ac3(self) -> bool:
-        """Propagação de restrições (arc-consistency)."""
+    def ac3(self, alteradas: Optional[Iterable[Pos]] = None,
+            remocoes: Optional[Dict[Pos, Set[int]]] = None) -> bool:
+        """Propagação de restrições (arc-consistency).
+
+        Sem `alteradas` parte de todos os arcos; com elas, só dos arcos que
+        chegam nas variáveis alteradas (uso incremental no backtracking).
+        Com `remocoes`, cada valor retirado é registrado para _desfazer.
+        """
+        if alteradas is None:
+            alteradas = self.variaveis
         fila = deque()  # fila de arcos (Xi, Xj)
-        for Xi in self.variaveis:
-            for Xj in self.vizinhos[Xi]:
+        for Xj in alteradas:
+            for Xi in self.vizinhos[Xj]:
                 fila.append((Xi, Xj))
         while fila:
             Xi, Xj = fila.popleft()
-            if self._revisar(Xi, Xj):
+            if self._revisar(Xi, Xj, remocoes):
                 if len(self.dominios[Xi]) == 0:
                     return False
-                for Xk in self.vizinhos[Xi] - {Xj}:
-                    fila.append((Xk, Xi))
+                for Xk in self.vizinhos[Xi]:
+                    if Xk != Xj:
+                        fila.append((Xk, Xi))
         return True
 
-    def _revisar(self, Xi: Pos, Xj: Pos) -> bool:
+    def _revisar(self, Xi: Pos, Xj: Pos,
+                 remocoes: Optional[Dict[Pos, Set[int]]] = None) -> bool:
         """Remove valores de Dom(Xi) que não têm suporte em Dom(Xj)."""
-        removidos = False
-        valores_remover = set()
-        for x in self.dominios[Xi]:
-            # em Sudoku: x tem suporte em Xj se existe y != x em Dom(Xj)
-            if not any((y != x) for y in self.dominios[Xj]):
-                valores_remover.add(x)
-        if valores_remover:
-            self.dominios[Xi] -= valores_remover
-            removidos = True
-        return removidos
+        self.revisoes += 1
+        # em Sudoku: x tem suporte em Xj se existe y != x em Dom(Xj), então
+        # só falta suporte quando Dom(Xj) == {x}
+        dominio_j = self.dominios[Xj]
+        if len(dominio_j) != 1:
+            return False
+        x = next(iter(dominio_j))
+        if x not in self.dominios[Xi]:
+            return False
+        self.dominios[Xi].remove(x)
+        self.valores_removidos += 1
+        if remocoes is not None:
+            remocoes.setdefault(Xi, set()).add(x)
+        return True
 
     # -------------------- Backtracking com heurísticas -------------------- #
 
@@ -115,7 +159,8 @@ class SudokuCSP:
                 if v in self.dominios[w] and len(self.dominios[w]) > 1:
                     s += 1
             return s
-        return sorted(self.dominios[pos], key=impacto)
+        # empate pelo próprio valor: a ordem não depende da iteração do conjunto
+        return sorted(self.dominios[pos], key=lambda v: (impacto(v), v))
 
     def _atribuir(self, pos: Pos, valor: int,
                   remocoes: Dict[Pos, Set[int]]) -> bool:
@@ -161,28 +206,32 @@ class SudokuCSP:
 
     def backtracking(self) -> bool:
         """Resolve por backtracking com MRV + LCV + forward checking."""
+        self.nos += 1
         if self.resolvido():
             return True
         pos = self._selecionar_variavel_MRV()
-        for valor in self._ordenar_valores_LCV(pos):
+        valores = self._ordenar_valores_LCV(pos) if self.lcv else sorted(self.dominios[pos])
+        for valor in valores:
             remocoes: Dict[Pos, Set[int]] = {}
             if self._atribuir(pos, valor, remocoes):
-                # Pequena propagação adicional via AC-3 local (opcional, caro porém robusto)
-                snapshot = {p: set(self.dominios[p]) for p in self.variaveis}
-                if self.ac3() and self.backtracking():
+                # AC-3 incremental: só os arcos que chegam nas variáveis que
+                # mudaram, com as remoções na mesma trilha do forward checking
+                if self.ac3(list(remocoes), remocoes) and self.backtracking():
                     return True
-                # restaura snapshot (mais rápido do que desfazer AC-3 valor a valor)
-                for p in self.variaveis:
-                    self.dominios[p] = snapshot[p]
+            self.retrocessos += 1
             self._desfazer(remocoes)
         return False
 
+    def resolver(self) -> bool:
+        """AC-3 seguido de backtracking (mesma interface dos motores de sudoku_motor)."""
+        return self.ac3() and self.backtracking()
+
     # -------------------- utilidades -------------------- #
 
     def como_matriz(self) -> List[List[int]]:
-        M = [[0]*9 for _ in range(9)]
-        for i in range(9):
-            for j in range(9):
+        M = [[0]*self.lado for _ in range(self.lado)]
+        for i in range(self.lado):
+            for j in range(self.lado):
                 dom = self.dominios[(i, j)]
                 M[i][j] = next(iter(dom)) if len(dom) == 1 else 0
         return M
@@ -192,32 +241,48 @@ def ler_tabuleiro_de_string(s: str) -> List[List[int]]:
     """
     Lê 81 caracteres (dígitos ou '.'/ '0' como vazio) em linhas 9x9.
     Ex.: "530070000600195000098000060800060003..." (81 chars)
+    Com 256 ou 625 caracteres lê 16x16 ou 25x25, com os valores acima de 9
+    escritos como letras (A = 10, B = 11, ... P = 25; ver SIMBOLOS).
     """
     s = ''.join(ch for ch in s if not ch.isspace())
-    if len(s) != 81:
-        raise ValueError("A string do Sudoku deve ter exatamente 81 caracteres.")
-    M = [[0]*9 for _ in range(9)]
+    lado = math.isqrt(len(s))
+    try:
+        if lado * lado != len(s):
+            raise ValueError
+        ordem_do_lado(lado)
+    except ValueError:
+        raise ValueError("A string do Sudoku deve ter 81, 256 ou 625 caracteres.") from None
+    M = [[0]*lado for _ in range(lado)]
     k = 0
-    for i in range(9):
-        for j in range(9):
+    for i in range(lado):
+        for j in range(lado):
             ch = s[k]; k += 1
+            v = SIMBOLOS.find(ch.upper()) + 1
             if ch in '0.':
                 M[i][j] = 0
-            elif ch.isdigit() and ch != '0':
-                M[i][j] = int(ch)
+            elif 1 <= v <= lado:
+                M[i][j] = v
             else:
                 raise ValueError(f"Caractere inválido: {ch}")
     return M
 
 
+def para_string(M: List[List[int]]) -> str:
+    """Inverso de ler_tabuleiro_de_string ('.' nas casas vazias)."""
+    return ''.join(SIMBOLOS[v - 1] if v else '.' for linha in M for v in linha)
+
+
 def imprimir(M: List[List[int]]) -> None:
+    ordem = ordem_do_lado(len(M))
+    separador = '+'.join(['-' * (2 * ordem)] + ['-' * (2 * ordem + 1)] * (ordem - 2)
+                         + ['-' * (2 * ordem)])
     for i, linha in enumerate(M):
-        if i % 3 == 0 and i != 0:
-            print("------+-------+------")
+        if i % ordem == 0 and i != 0:
+            print(separador)
         partes = []
         for j, v in enumerate(linha):
-            sep = " | " if j % 3 == 0 and j != 0 else ""
-            partes.append(sep + (str(v) if v != 0 else "."))
+            sep = " | " if j % ordem == 0 and j != 0 else ""
+            partes.append(sep + (SIMBOLOS[v - 1] if v != 0 else "."))
         print(' '.join(partes))
 
 
@@ -236,10 +301,39 @@ if __name__ == "__main__":
     )
     # Você pode passar um sudoku por argumento (81 chars):
     # python sudoku_csp.py 53..7....6..195....98....6.8...6...3...
-    if len(sys.argv) > 1:
-        exemplo = sys.argv[1]
-
-    tab = ler_tabuleiro_de_string(exemplo)
+    # ou um arquivo com um por linha (modo em lote, em vários processos):
+    # python algoritmoSoduku_python.py --arquivo quebra_cabecas.txt --saida solucoes.txt
+    import argparse
+    parser = argparse.ArgumentParser(description="Sudoku por CSP (AC-3 + backtracking)")
+    parser.add_argument('sudoku', nargs='?', default=exemplo,
+                        help="81, 256 ou 625 caracteres ('.' ou '0' = vazio)")
+    parser.add_argument('--arquivo', help="modo em lote: um quebra-cabeça por linha ('-' = entrada padrão)")
+    parser.add_argument('--saida', help="soluções do modo em lote (padrão: saída padrão)")
+    parser.add_argument('--motor', choices=('bits', 'dlx', 'csp'), default='bits',
+                        help="motor do modo em lote")
+    parser.add_argument('--processos', type=int, help="processos do pool (padrão: núcleos)")
+    parser.add_argument('--lote', type=int, default=256, help="quebra-cabeças por tarefa")
+    parser.add_argument('--desordenado', action='store_true',
+                        help="escreve cada lote assim que fica pronto")
+    args = parser.parse_args()
+
+    if args.arquivo:
+        # importado só aqui: sudoku_motor importa este módulo
+        from sudoku_motor import resolver_arquivo, imprimir_resumo
+        entrada = sys.stdin if args.arquivo == '-' else open(args.arquivo, encoding='utf-8')
+        saida = open(args.saida, 'w', encoding='utf-8') if args.saida else sys.stdout
+        try:
+            resumo = resolver_arquivo(entrada, saida, args.motor, args.processos,
+                                      args.lote, ordenado=not args.desordenado)
+        finally:
+            if entrada is not sys.stdin:
+                entrada.close()
+            if saida is not sys.stdout:
+                saida.close()
+        imprimir_resumo(resumo)
+        sys.exit(1 if resumo['erros'] else 0)
+
+    tab = ler_tabuleiro_de_string(args.sudoku)
     print("Sudoku (entrada):")
     imprimir(tab)
 
@@ -252,5 +346,7 @@ if __name__ == "__main__":
     if csp.backtracking():
         print("\nSolução:")
         imprimir(csp.como_matriz())
+        print(f"\n{csp.nos} nós, {csp.retrocessos} retrocessos, "
+              f"{csp.revisoes} revisões e {csp.valores_removidos} remoções do AC-3")
     else:
         print("\nNenhuma solução encontrada.")
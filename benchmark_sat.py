@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bateria de testes para o solucionador SAT (solucao.py)
+
+Roda cada instância em um processo próprio (até N ao mesmo tempo), com
+limite de tempo, e registra: tempo de parede, pico de memória (RSS),
+resultado, contadores do solver e a verificação do modelo contra as
+cláusulas originais. No fim imprime o PAR-2 (instâncias não resolvidas
+contam 2x o limite) geral e por família (diretório).
+
+Uso:
+  python3 benchmark_sat.py instancias/ --tempo 60 --processos 4
+  python3 benchmark_sat.py 'bench/**/*.cnf.xz' --csv res.csv --json res.json
+"""
+
+import sys, time
+import argparse, csv, glob, json, multiprocessing, os, resource
+from collections import defaultdict
+from multiprocessing.connection import wait
+
+from solucao import CDCL, EstatisticasCDCL, ler_dimacs_arquivo
+
+EXTENSOES = ('.cnf', '.cnf.gz', '.cnf.xz')
+FOLGA = 5.0   # segundos além do limite antes de matar o processo
+
+CAMPOS = ('arquivo', 'familia', 'resultado', 'verificado', 'tempo', 'rss_kb',
+          'variaveis', 'clausulas', 'conflitos', 'decisoes', 'propagacoes',
+          'reinicios', 'reducoes', 'variaveis_eliminadas', 'erro')
+
+# ----------------- Seleção das instâncias -----------------
+def listar_instancias(entradas):
+    """Expande diretórios (recursivo) e globs em uma lista ordenada de CNFs."""
+    arquivos = set()
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            for raiz, _, nomes in os.walk(entrada):
+                arquivos.update(os.path.join(raiz, n) for n in nomes if n.endswith(EXTENSOES))
+        else:
+            arquivos.update(c for c in glob.glob(entrada, recursive=True)
+                            if os.path.isfile(c))
+    return sorted(arquivos)
+
+def verificar_modelo(clausulas, modelo):
+    """True se o modelo (literais DIMACS) satisfaz todas as cláusulas."""
+    verdade = set(modelo)
+    return all(any(l in verdade for l in c) for c in clausulas)
+
+# ----------------- Execução de uma instância -----------------
+def _executar(caminho, tempo_max, opcoes, conexao):
+    """Corpo do processo filho: lê, resolve, verifica e devolve uma linha."""
+    linha = {'arquivo': caminho, 'resultado': 'UNKNOWN', 'erro': ''}
+    inicio = time.perf_counter()
+    try:
+        numero_variaveis, clausulas = ler_dimacs_arquivo(caminho)
+        linha['variaveis'] = numero_variaveis
+        linha['clausulas'] = len(clausulas)
+        estatisticas = EstatisticasCDCL()
+        try:
+            solver = CDCL(numero_variaveis, clausulas, estatisticas=estatisticas, **opcoes)
+            resultado = solver.resolver(tempo_max)
+        except RuntimeError:   # contradição já no pré-processamento
+            solver, resultado = None, False
+        if resultado is True:
+            linha['resultado'] = 'SAT'
+            linha['verificado'] = verificar_modelo(clausulas, solver.modelo())
+            if not linha['verificado']:
+                linha['erro'] = 'modelo não satisfaz a fórmula'
+        elif resultado is False:
+            linha['resultado'] = 'UNSAT'
+        if solver is not None:
+            resumo = estatisticas.resumo(solver)
+            for campo in ('conflitos', 'decisoes', 'propagacoes', 'reinicios',
+                          'reducoes', 'variaveis_eliminadas'):
+                linha[campo] = resumo[campo]
+    except Exception as e:  # registra e segue para a próxima instância
+        linha['erro'] = f"{type(e).__name__}: {e}"
+    linha['tempo'] = time.perf_counter() - inicio
+    linha['rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    conexao.send(linha)
+    conexao.close()
+
+def executar_bateria(instancias, tempo_max, processos=1, opcoes=None, ao_terminar=None):
+    """Roda as instâncias em até `processos` filhos; devolve as linhas na ordem de entrada.
+
+    Cada instância tem processo próprio, então o pico de RSS é só dela e um
+    filho que estoure `tempo_max + FOLGA` (p.ex. preso no pré-processamento)
+    é morto e registrado como UNKNOWN.
+    """
+    opcoes = opcoes or {}
+    pendentes = list(reversed(instancias))
+    ativos = {}   # sentinela -> (processo, conexão, caminho, início)
+    linhas = {}
+    while pendentes or ativos:
+        while pendentes and len(ativos) < processos:
+            caminho = pendentes.pop()
+            receptor, emissor = multiprocessing.Pipe(duplex=False)
+            p = multiprocessing.Process(target=_executar,
+                                        args=(caminho, tempo_max, opcoes, emissor))
+            p.start()
+            emissor.close()
+            ativos[p.sentinel] = (p, receptor, caminho, time.perf_counter())
+        prazo = None
+        if tempo_max:
+            agora = time.perf_counter()
+            prazo = max(0.0, min(t0 + tempo_max + FOLGA - agora for *_, t0 in ativos.values()))
+        prontos = wait(list(ativos), timeout=prazo)
+        agora = time.perf_counter()
+        for sentinela in list(ativos):
+            p, receptor, caminho, t0 = ativos[sentinela]
+            if sentinela in prontos:
+                try:
+                    linha = receptor.recv()
+                except EOFError:   # filho morreu sem responder (p.ex. falta de memória)
+                    linha = {'arquivo': caminho, 'resultado': 'UNKNOWN',
+                             'tempo': agora - t0, 'erro': f'código de saída {p.exitcode}'}
+            elif tempo_max and agora - t0 > tempo_max + FOLGA:
+                p.kill()
+                linha = {'arquivo': caminho, 'resultado': 'UNKNOWN',
+                         'tempo': agora - t0, 'erro': 'morto por tempo'}
+            else:
+                continue
+            p.join()
+            receptor.close()
+            del ativos[sentinela]
+            linha['familia'] = os.path.basename(os.path.dirname(caminho)) or '.'
+            linhas[caminho] = linha
+            if ao_terminar is not None:
+                ao_terminar(linha)
+    return [linhas[c] for c in instancias]
+
+# ----------------- Pontuação e saída -----------------
+def par2(linhas, tempo_max):
+    """Média do PAR-2: tempo se resolvida (e correta), 2*limite caso contrário."""
+    if not linhas:
+        return 0.0
+    total = 0.0
+    for linha in linhas:
+        resolvida = linha['resultado'] in ('SAT', 'UNSAT') and not linha.get('erro')
+        if resolvida and (not tempo_max or linha['tempo'] <= tempo_max):
+            total += linha['tempo']
+        else:
+            total += 2 * tempo_max if tempo_max else float('inf')
+    return total / len(linhas)
+
+def resumo_por_familia(linhas, tempo_max):
+    familias = defaultdict(list)
+    for linha in linhas:
+        familias[linha['familia']].append(linha)
+    resumo = {}
+    for familia, grupo in sorted(familias.items()):
+        contagem = defaultdict(int)
+        for linha in grupo:
+            contagem[linha['resultado']] += 1
+        resumo[familia] = {'instancias': len(grupo), 'SAT': contagem['SAT'],
+                           'UNSAT': contagem['UNSAT'], 'UNKNOWN': contagem['UNKNOWN'],
+                           'erros': sum(1 for l in grupo if l.get('erro')),
+                           'par2': par2(grupo, tempo_max)}
+    return resumo
+
+def salvar_csv(linhas, caminho):
+    with open(caminho, 'w', newline='', encoding='utf-8') as f:
+        escritor = csv.DictWriter(f, fieldnames=CAMPOS, extrasaction='ignore')
+        escritor.writeheader()
+        escritor.writerows(linhas)
+
+def salvar_json(linhas, resumo, caminho):
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump({'instancias': linhas, 'familias': resumo}, f, indent=2, ensure_ascii=False)
+
+def main():
+    parser = argparse.ArgumentParser(description="Bateria de testes do solucionador SAT")
+    parser.add_argument('entradas', nargs='+', help="diretórios, arquivos ou globs de CNFs")
+    parser.add_argument('--tempo', type=float, default=60.0, help="limite por instância (s)")
+    parser.add_argument('--processos', type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="instâncias simultâneas")
+    parser.add_argument('--sem-simplificar', action='store_true',
+                        help="desliga o pré-processamento SatELite")
+    parser.add_argument('--reinicio', choices=('luby', 'ema'), default='luby')
+    parser.add_argument('--csv', metavar='ARQUIVO', help="grava uma linha por instância")
+    parser.add_argument('--json', metavar='ARQUIVO', help="grava instâncias e resumo")
+    args = parser.parse_args()
+
+    instancias = listar_instancias(args.entradas)
+    if not instancias:
+        parser.error("nenhuma instância encontrada")
+    opcoes = {'simplificar': not args.sem_simplificar, 'reinicio': args.reinicio}
+
+    def ao_terminar(linha):
+        extra = f"  [{linha['erro']}]" if linha.get('erro') else ''
+        print(f"{linha['resultado']:8} {linha['tempo']:8.2f}s {linha.get('rss_kb', 0):>9} KB  "
+              f"{linha['arquivo']}{extra}", flush=True)
+
+    linhas = executar_bateria(instancias, args.tempo, args.processos, opcoes, ao_terminar)
+    resumo = resumo_por_familia(linhas, args.tempo)
+
+    print()
+    print(f"{'família':24} {'inst':>5} {'SAT':>5} {'UNSAT':>5} {'UNK':>5} {'erros':>5} {'PAR-2':>10}")
+    for familia, r in resumo.items():
+        print(f"{familia:24} {r['instancias']:5} {r['SAT']:5} {r['UNSAT']:5} "
+              f"{r['UNKNOWN']:5} {r['erros']:5} {r['par2']:10.2f}")
+    print(f"PAR-2 geral: {par2(linhas, args.tempo):.2f}")
+
+    if args.csv:
+        salvar_csv(linhas, args.csv)
+    if args.json:
+        salvar_json(linhas, resumo, args.json)
+    return 1 if any(l.get('erro') for l in linhas) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bateria de testes dos solucionadores de Sudoku
+
+Roda cada estratégia sobre o corpus (sudoku_corpus/, um arquivo por
+categoria: fácil, difícil, 17 pistas, 16x16, ...) e informa, por categoria
+e estratégia, quantos resolveu, o tempo (médio, mediana, máximo) e os nós
+de busca. Cada execução roda num processo próprio, morto ao passar do
+limite de tempo. Toda solução é conferida contra as pistas.
+
+Estratégias: mrv+lcv (SudokuCSP), mrv (SudokuCSP sem LCV), dlx
+(SudokuDLX) e bits (SudokuBits).
+
+Também gera quebra-cabeças de solução única para o corpus: uma grade
+aleatória de que se tiram pistas enquanto a solução continuar única.
+
+Uso:
+  python3 benchmark_sudoku.py                          # corpus inteiro
+  python3 benchmark_sudoku.py sudoku_corpus/16x16.txt --estrategias dlx,bits
+  python3 benchmark_sudoku.py --gerar 4 -n 10 --pistas 120 --semente 1 > novos.txt
+"""
+
+import sys, time
+import argparse, json, multiprocessing, os, random
+from collections import defaultdict
+from statistics import median
+
+from algoritmoSoduku_python import SudokuCSP, ler_tabuleiro_de_string, para_string
+from sudoku_motor import SudokuBits, SudokuDLX, ler_quebra_cabecas, solucao_valida
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'sudoku_corpus')
+
+ESTRATEGIAS = {
+    'mrv+lcv': lambda tab: SudokuCSP(tab),
+    'mrv': lambda tab: SudokuCSP(tab, lcv=False),
+    'dlx': SudokuDLX,
+    'bits': SudokuBits,
+}
+
+# ----------------- Geração -----------------
+def grade_aleatoria(ordem, gerador):
+    """Grade completa válida: o padrão canônico com símbolos, linhas dentro das
+    faixas, faixas, colunas dentro das pilhas e pilhas embaralhados."""
+    lado = ordem * ordem
+    def embaralhar(seq):
+        seq = list(seq)
+        gerador.shuffle(seq)
+        return seq
+    grupos = range(ordem)
+    linhas = [g * ordem + r for g in embaralhar(grupos) for r in embaralhar(grupos)]
+    colunas = [g * ordem + c for g in embaralhar(grupos) for c in embaralhar(grupos)]
+    simbolos = embaralhar(range(1, lado + 1))
+    return [[simbolos[(ordem * (l % ordem) + l // ordem + c) % lado] for c in colunas]
+            for l in linhas]
+
+def gerar_quebra_cabeca(ordem, pistas, gerador):
+    """Tira pistas de uma grade aleatória, em ordem aleatória, enquanto a
+    solução for única; para ao chegar a `pistas` (ou quando nenhuma sai)."""
+    M = grade_aleatoria(ordem, gerador)
+    lado = ordem * ordem
+    restantes = lado * lado
+    casas = [(l, c) for l in range(lado) for c in range(lado)]
+    gerador.shuffle(casas)
+    for l, c in casas:
+        if restantes <= pistas:
+            break
+        valor, M[l][c] = M[l][c], 0
+        if SudokuBits(M).contar_solucoes(2) == 1:
+            restantes -= 1
+        else:
+            M[l][c] = valor
+    return M
+
+# ----------------- Execução -----------------
+def _executar(estrategia, texto, conexao):
+    """Corpo do processo filho: resolve, confere e devolve uma linha."""
+    linha = {'resolvido': False, 'erro': ''}
+    try:
+        tab = ler_tabuleiro_de_string(texto)
+        inicio = time.perf_counter()
+        solucionador = ESTRATEGIAS[estrategia](tab)
+        resolvido = solucionador.resolver()
+        linha['tempo'] = time.perf_counter() - inicio
+        linha['nos'] = solucionador.nos
+        linha['retrocessos'] = solucionador.retrocessos
+        if resolvido:
+            linha['resolvido'] = solucao_valida(tab, solucionador.como_matriz())
+            if not linha['resolvido']:
+                linha['erro'] = 'solução inválida'
+        else:
+            linha['erro'] = 'sem solução'
+    except Exception as e:  # registra e segue para o próximo
+        linha['erro'] = f"{type(e).__name__}: {e}"
+    conexao.send(linha)
+    conexao.close()
+
+def medir(estrategia, texto, tempo_max):
+    """Resolve `texto` com a estratégia num processo próprio; devolve a linha de resultado."""
+    receptor, emissor = multiprocessing.Pipe(duplex=False)
+    p = multiprocessing.Process(target=_executar, args=(estrategia, texto, emissor))
+    p.start()
+    emissor.close()
+    if receptor.poll(tempo_max):
+        try:
+            linha = receptor.recv()
+        except EOFError:   # filho morreu sem responder
+            linha = {'resolvido': False, 'erro': f'código de saída {p.exitcode}'}
+    else:
+        p.kill()
+        linha = {'resolvido': False, 'tempo': tempo_max, 'erro': 'morto por tempo'}
+    p.join()
+    receptor.close()
+    return linha
+
+def carregar_corpus(entradas):
+    """{categoria: [quebra-cabeças]} a partir de arquivos ou diretórios."""
+    arquivos = []
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            arquivos.extend(sorted(os.path.join(entrada, n) for n in os.listdir(entrada)
+                                   if n.endswith('.txt')))
+        else:
+            arquivos.append(entrada)
+    corpus = {}
+    for caminho in arquivos:
+        categoria = os.path.splitext(os.path.basename(caminho))[0]
+        with open(caminho, encoding='utf-8') as f:
+            corpus[categoria] = [texto for _, texto in ler_quebra_cabecas(f)]
+    return corpus
+
+def executar_bateria(corpus, estrategias, tempo_max, ao_medir=None):
+    """Mede cada estratégia em cada quebra-cabeça; devolve as linhas."""
+    linhas = []
+    for categoria, quebra_cabecas in corpus.items():
+        for estrategia in estrategias:
+            for indice, texto in enumerate(quebra_cabecas):
+                linha = medir(estrategia, texto, tempo_max)
+                linha.update(categoria=categoria, estrategia=estrategia, indice=indice)
+                linhas.append(linha)
+                if ao_medir is not None:
+                    ao_medir(linha)
+    return linhas
+
+# ----------------- Resumo -----------------
+def resumir(linhas):
+    """{(categoria, estrategia): estatísticas} na ordem em que apareceram."""
+    grupos = defaultdict(list)
+    for linha in linhas:
+        grupos[linha['categoria'], linha['estrategia']].append(linha)
+    resumo = {}
+    for chave, grupo in grupos.items():
+        resolvidos = [l for l in grupo if l['resolvido']]
+        tempos = [l['tempo'] for l in resolvidos]
+        resumo[chave] = {
+            'quebra_cabecas': len(grupo), 'resolvidos': len(resolvidos),
+            'estourados': sum(1 for l in grupo if l['erro'] == 'morto por tempo'),
+            'tempo_medio': sum(tempos) / len(tempos) if tempos else None,
+            'tempo_mediano': median(tempos) if tempos else None,
+            'tempo_maximo': max(tempos) if tempos else None,
+            'nos_medios': (sum(l['nos'] for l in resolvidos) / len(resolvidos)
+                           if resolvidos else None),
+        }
+    return resumo
+
+def _numero(valor, escala=1.0, largura=10):
+    return f"{'-':>{largura}}" if valor is None else f"{valor * escala:{largura}.1f}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Bateria de testes dos solucionadores de Sudoku")
+    parser.add_argument('entradas', nargs='*', default=[CORPUS],
+                        help="arquivos (um quebra-cabeça por linha) ou diretórios")
+    parser.add_argument('--estrategias', default=','.join(ESTRATEGIAS),
+                        help="lista separada por vírgulas (%(default)s)")
+    parser.add_argument('--tempo', type=float, default=30.0, help="limite por quebra-cabeça (s)")
+    parser.add_argument('--json', metavar='ARQUIVO', help="grava as medições e o resumo")
+    parser.add_argument('--gerar', type=int, metavar='ORDEM',
+                        help="em vez de medir, gera quebra-cabeças ORDEM²xORDEM²")
+    parser.add_argument('-n', type=int, default=10, help="quantos gerar")
+    parser.add_argument('--pistas', type=int, default=0, help="pistas desejadas ao gerar")
+    parser.add_argument('--semente', type=int, default=0)
+    args = parser.parse_args()
+
+    if args.gerar:
+        gerador = random.Random(args.semente)
+        for _ in range(args.n):
+            print(para_string(gerar_quebra_cabeca(args.gerar, args.pistas, gerador)), flush=True)
+        return 0
+
+    estrategias = [e for e in args.estrategias.split(',') if e]
+    desconhecidas = set(estrategias) - set(ESTRATEGIAS)
+    if desconhecidas:
+        parser.error(f"estratégias desconhecidas: {', '.join(sorted(desconhecidas))}")
+    corpus = carregar_corpus(args.entradas)
+    if not any(corpus.values()):
+        parser.error("corpus vazio")
+
+    def ao_medir(linha):
+        if linha['erro']:
+            print(f"{linha['categoria']} #{linha['indice']} {linha['estrategia']}: "
+                  f"{linha['erro']}", file=sys.stderr, flush=True)
+
+    linhas = executar_bateria(corpus, estrategias, args.tempo, ao_medir)
+    resumo = resumir(linhas)
+
+    print(f"{'categoria':14} {'estratégia':10} {'resolv.':>8} {'estour.':>7} "
+          f"{'médio ms':>10} {'mediana ms':>10} {'máx ms':>10} {'nós médios':>11}")
+    for (categoria, estrategia), r in resumo.items():
+        print(f"{categoria:14} {estrategia:10} {r['resolvidos']:>4}/{r['quebra_cabecas']:<3} "
+              f"{r['estourados']:7} {_numero(r['tempo_medio'], 1000)} "
+              f"{_numero(r['tempo_mediano'], 1000)} {_numero(r['tempo_maximo'], 1000)} "
+              f"{_numero(r['nos_medios'], largura=11)}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'medicoes': linhas,
+                       'resumo': [{'categoria': c, 'estrategia': e, **r}
+                                  for (c, e), r in resumo.items()]},
+                      f, indent=2, ensure_ascii=False)
+    return 1 if any(l['erro'] and l['erro'] != 'morto por tempo' for l in linhas) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,218 +1,857 @@
-# jogo_go.py
-
-import tkinter as tk
-import random
-import math
-import copy
-
-
-TAMANHO_TABULEIRO = 9
-VIDAS_MAX = 1000  
-
-
-VAZIO = 0
-PRETO = 1
-BRANCO = 2
-
-class Tabuleiro:
-    def __init__(self, tamanho=TAMANHO_TABULEIRO):
-        self.tamanho = tamanho
-        self.grade = [[VAZIO for _ in range(tamanho)] for _ in range(tamanho)]
-        self.jogador_atual = PRETO
-        self.passes = 0  # Contador de passes consecutivos
-
-    def fazer_jogada(self, linha, coluna):
-        if self.grade[linha][coluna] == VAZIO:
-            self.grade[linha][coluna] = self.jogador_atual
-            self.jogador_atual = BRANCO if self.jogador_atual == PRETO else PRETO
-            self.passes = 0  # Resetar contador de passes
-            return True
-        return False
-
-    def passar_turno(self):
-        self.jogador_atual = BRANCO if self.jogador_atual == PRETO else PRETO
-        self.passes += 1
-
-    def obter_jogadas_possiveis(self):
-        jogadas = []
-        for i in range(self.tamanho):
-            for j in range(self.tamanho):
-                if self.grade[i][j] == VAZIO:
-                    jogadas.append((i, j))
-        jogadas.append(('passar', 'passar'))  # Opção de passar
-        return jogadas
-
-    def is_finalizado(self):
-        # Finaliza o jogo se ambos os jogadores passarem consecutivamente
-        return self.passes >= 2
-
-    def copiar(self):
-        return copy.deepcopy(self)
-
-class NodoMCTS:
-    def __init__(self, tabuleiro, pai=None, movimento=None):
-        self.tabuleiro = tabuleiro
-        self.pai = pai
-        self.movimento = movimento
-        self.filhos = []
-        self.visitas = 0
-        self.vitorias = 0
-
-    def selecionar_filho(self):
-        # Usar a fórmula UCT
-        melhor_valor = -float('inf')
-        melhor_filho = None
-        for filho in self.filhos:
-            if filho.visitas == 0:
-                valor = float('inf')
-            else:
-                valor = (filho.vitorias / filho.visitas) + math.sqrt(2 * math.log(self.visitas) / filho.visitas)
-            if valor > melhor_valor:
-                melhor_valor = valor
-                melhor_filho = filho
-        return melhor_filho
-
-    def expandir(self):
-        jogadas_possiveis = self.tabuleiro.obter_jogadas_possiveis()
-        for jogada in jogadas_possiveis:
-            novo_tabuleiro = self.tabuleiro.copiar()
-            if jogada == ('passar', 'passar'):
-                novo_tabuleiro.passar_turno()
-            else:
-                novo_tabuleiro.fazer_jogada(*jogada)
-            filho = NodoMCTS(novo_tabuleiro, pai=self, movimento=jogada)
-            self.filhos.append(filho)
-
-    def simular(self):
-        tabuleiro_sim = self.tabuleiro.copiar()
-        while not tabuleiro_sim.is_finalizado():
-            jogadas = tabuleiro_sim.obter_jogadas_possiveis()
-            if not jogadas:
-                break
-            jogada = random.choice(jogadas)
-            if jogada == ('passar', 'passar'):
-                tabuleiro_sim.passar_turno()
-            else:
-                tabuleiro_sim.fazer_jogada(*jogada)
-        # Simplificação: considerar empate
-        # Em uma implementação completa, calcular a pontuação real
-        if tabuleiro_sim.jogador_atual == PRETO:
-            return 1  # Vitória para Branco
-        else:
-            return 0  # Vitória para Preto
-
-    def backpropagar(self, resultado):
-        self.visitas += 1
-        self.vitorias += resultado
-        if self.pai:
-            self.pai.backpropagar(resultado)
-
-def mcts(root, iteracoes=VIDAS_MAX):
-    for _ in range(iteracoes):
-        nodo = root
-        # Seleção
-        while nodo.filhos:
-            nodo = nodo.selecionar_filho()
-        # Expansão
-        if nodo.visitas > 0:
-            nodo.expandir()
-            if nodo.filhos:
-                nodo = random.choice(nodo.filhos)
-        # Simulação
-        resultado = nodo.simular()
-        # Retropropagação
-        nodo.backpropagar(resultado)
-    # Escolher o filho com mais visitas
-    melhor_filho = max(root.filhos, key=lambda f: f.visitas)
-    return melhor_filho.movimento
-
-class InterfaceGo:
-    def __init__(self, master):
-        self.master = master
-        self.master.title("Jogo de Go com MCTS")
-        self.tabuleiro = Tabuleiro()
-        self.canvas = tk.Canvas(master, width=450, height=450, bg="#DEB887")
-        self.canvas.pack()
-        self.desenhar_tabuleiro()
-        self.canvas.bind("<Button-1>", self.clique_mouse)
-        self.atualizar_interface()
-        self.jogador_humano = PRETO  # Define o humano como jogador Preto
-        self.jogador_computador = BRANCO  # Computador joga Branco
-
-    def desenhar_tabuleiro(self):
-        passo = 450 / (self.tabuleiro.tamanho + 1)
-        self.passo = passo
-        self.linhas = self.tabuleiro.tamanho
-        # Desenhar linhas horizontais e verticais
-        for i in range(1, self.linhas + 1):
-            self.canvas.create_line(passo, passo * i, 450 - passo, passo * i)
-            self.canvas.create_line(passo * i, passo, passo * i, 450 - passo)
-        # Desenhar pontos de estrela (opcional para 9x9)
-        pontos_estrela = [(3,3), (3,7), (7,3), (7,7), (5,5)]
-        for (i, j) in pontos_estrela:
-            x = passo * j
-            y = passo * i
-            self.canvas.create_oval(x - 5, y - 5, x + 5, y + 5, fill="black")
-
-    def atualizar_interface(self):
-        self.canvas.delete("peca")
-        for i in range(self.tabuleiro.tamanho):
-            for j in range(self.tabuleiro.tamanho):
-                if self.tabuleiro.grade[i][j] != VAZIO:
-                    x = self.passo * (j + 1)
-                    y = self.passo * (i + 1)
-                    cor = "black" if self.tabuleiro.grade[i][j] == PRETO else "white"
-                    self.canvas.create_oval(x - 15, y - 15, x + 15, y + 15, fill=cor, tags="peca")
-        self.master.update()
-
-    def clique_mouse(self, evento):
-        if self.tabuleiro.jogador_atual != self.jogador_humano:
-            return  # Não é a vez do humano
-
-        passo = self.passo
-        j = int(round((evento.x) / passo)) - 1
-        i = int(round((evento.y) / passo)) - 1
-        if 0 <= i < self.tabuleiro.tamanho and 0 <= j < self.tabuleiro.tamanho:
-            jogada_valida = self.tabuleiro.fazer_jogada(i, j)
-            if jogada_valida:
-                self.atualizar_interface()
-                if self.tabuleiro.is_finalizado():
-                    self.finalizar_jogo()
-                else:
-                    self.jogada_computador()
-        else:
-            # Clique fora do tabuleiro, considerar como passar
-            self.tabuleiro.passar_turno()
-            self.atualizar_interface()
-            if self.tabuleiro.is_finalizado():
-                self.finalizar_jogo()
-            else:
-                self.jogada_computador()
-
-    def jogada_computador(self):
-        if self.tabuleiro.jogador_atual != self.jogador_computador:
-            return
-        root_nodo = NodoMCTS(self.tabuleiro.copiar())
-        movimento = mcts(root_nodo)
-        if movimento:
-            if movimento == ('passar', 'passar'):
-                self.tabuleiro.passar_turno()
-            else:
-                self.tabuleiro.fazer_jogada(*movimento)
-            self.atualizar_interface()
-            if self.tabuleiro.is_finalizado():
-                self.finalizar_jogo()
-
-    def finalizar_jogo(self):
-      
-        print("Jogo finalizado!")
-     
-        self.master.quit()
-
-def main():
-    root = tk.Tk()
-    jogo = InterfaceGo(root)
-    root.mainloop()
-
-if __name__ == "__main__":
-    main()
+# jogo_go.py
+
+import tkinter as tk
+import argparse
+import random
+import math
+import multiprocessing, os, queue, threading, time
+from array import array
+
+
+TAMANHO_TABULEIRO = 9
+VIDAS_MAX = 1000  
+TEMPO_JOGADA = 5.0  # segundos de MCTS por jogada do computador
+KOMI = 7.5
+
+
+VAZIO = 0
+PRETO = 1
+BRANCO = 2
+BORDA = 3
+
+PASSE = 0  # o ponto 0 é sempre borda, então serve para representar o passe
+
+_ZOBRIST = {}
+
+def tabela_zobrist(tamanho):
+    """Chaves aleatórias por cor e ponto (semente fixa: iguais entre processos)."""
+    if tamanho not in _ZOBRIST:
+        gerador = random.Random(tamanho)
+        n = (tamanho + 2) * (tamanho + 1)
+        _ZOBRIST[tamanho] = (None,
+                             tuple(gerador.getrandbits(64) for _ in range(n)),
+                             tuple(gerador.getrandbits(64) for _ in range(n)))
+    return _ZOBRIST[tamanho]
+
+class Tabuleiro:
+    """Tabuleiro em array 1-D com borda.
+
+    O ponto (linha, coluna) é p = (linha + 1) * largura + coluna, com
+    largura = tamanho + 1: a coluna extra e as linhas de cima e de baixo são
+    BORDA, então os vizinhos são sempre p-1, p+1, p-largura e p+largura.
+    Grupos em union-find (pai/tamanho_grupo) com um anel de pedras (proximo)
+    e as liberdades de cada grupo num inteiro usado como conjunto de bits.
+    copiar() só copia arrays e listas; o conjunto de hashes (superko
+    posicional) é compartilhado até uma das cópias jogar.
+    """
+
+    def __init__(self, tamanho=TAMANHO_TABULEIRO, superko=True, komi=KOMI):
+        self.tamanho = tamanho
+        self.largura = largura = tamanho + 1
+        n = (tamanho + 2) * largura
+        self.cores = array('b', [BORDA]) * n
+        self.pai = array('i', range(n))
+        self.proximo = array('i', range(n))
+        self.tamanho_grupo = array('i', [0]) * n
+        self.liberdades = [0] * n
+        self.vazios = []  # pontos vazios, com remoção O(1) via indice_vazio
+        self.indice_vazio = array('i', [-1]) * n
+        for linha in range(tamanho):
+            for coluna in range(tamanho):
+                p = (linha + 1) * largura + coluna
+                self.cores[p] = VAZIO
+                self._adicionar_vazio(p)
+        self.jogador_atual = PRETO
+        self.passes = 0  # Contador de passes consecutivos
+        self.ko = 0
+        self.capturas = [0, 0, 0]  # pedras capturadas por cada cor
+        self.komi = komi
+        self.zobrist = tabela_zobrist(tamanho)
+        self.hash = 0
+        self.superko = superko
+        self.hashes = {0}
+        self._hashes_compartilhados = False
+
+    # ---------- coordenadas ----------
+    def ponto(self, linha, coluna):
+        return (linha + 1) * self.largura + coluna
+
+    def coordenadas(self, p):
+        return p // self.largura - 1, p % self.largura
+
+    @property
+    def grade(self):
+        """Matriz tamanho x tamanho de cores (para a interface)."""
+        cores, largura = self.cores, self.largura
+        return [[cores[(i + 1) * largura + j] for j in range(self.tamanho)]
+                for i in range(self.tamanho)]
+
+    # ---------- grupos ----------
+    def grupo(self, p):
+        """Raiz do grupo da pedra em p (com compressão de caminho)."""
+        pai = self.pai
+        while pai[p] != p:
+            pai[p] = pai[pai[p]]
+            p = pai[p]
+        return p
+
+    def pedras(self, p):
+        """Pedras do grupo que contém p."""
+        proximo = self.proximo
+        q = p
+        while True:
+            yield q
+            q = proximo[q]
+            if q == p:
+                break
+
+    def num_liberdades(self, p):
+        return self.liberdades[self.grupo(p)].bit_count()
+
+    def _adicionar_vazio(self, p):
+        self.indice_vazio[p] = len(self.vazios)
+        self.vazios.append(p)
+
+    def _remover_vazio(self, p):
+        vazios, indice = self.vazios, self.indice_vazio
+        i = indice[p]
+        ultimo = vazios.pop()
+        if ultimo != p:
+            vazios[i] = ultimo
+            indice[ultimo] = i
+        indice[p] = -1
+
+    def _unir(self, a, b):
+        tamanho = self.tamanho_grupo
+        if tamanho[a] < tamanho[b]:
+            a, b = b, a
+        self.pai[b] = a
+        tamanho[a] += tamanho[b]
+        self.liberdades[a] |= self.liberdades[b]
+        proximo = self.proximo
+        proximo[a], proximo[b] = proximo[b], proximo[a]  # junta os anéis
+        return a
+
+    def _capturar(self, raiz, capturadora):
+        cores, liberdades, largura = self.cores, self.liberdades, self.largura
+        chaves = self.zobrist[3 - capturadora]
+        pedras = list(self.pedras(raiz))
+        for s in pedras:
+            cores[s] = VAZIO
+            self.hash ^= chaves[s]
+            self._adicionar_vazio(s)
+        for s in pedras:
+            bit = 1 << s
+            for t in (s - 1, s + 1, s - largura, s + largura):
+                if cores[t] == capturadora:
+                    liberdades[self.grupo(t)] |= bit
+        self.capturas[capturadora] += len(pedras)
+        return len(pedras)
+
+    # ---------- regras ----------
+    def _tem_liberdade(self, p, cor):
+        """A pedra em p ficaria viva: vizinho vazio, grupo amigo com outra
+        liberdade ou grupo inimigo capturado."""
+        cores, liberdades, largura = self.cores, self.liberdades, self.largura
+        bit = 1 << p
+        for q in (p - 1, p + 1, p - largura, p + largura):
+            c = cores[q]
+            if c == VAZIO:
+                return True
+            if c == BORDA:
+                continue
+            libs = liberdades[self.grupo(q)]
+            if c == cor:
+                if libs != bit:
+                    return True
+            elif libs == bit:
+                return True
+        return False
+
+    def _hash_apos(self, p, cor):
+        """Hash da posição depois de jogar em p (inclui as capturas)."""
+        liberdades, largura = self.liberdades, self.largura
+        h = self.hash ^ self.zobrist[cor][p]
+        oponente = 3 - cor
+        chaves = self.zobrist[oponente]
+        bit = 1 << p
+        capturados = set()
+        for q in (p - 1, p + 1, p - largura, p + largura):
+            if self.cores[q] == oponente:
+                r = self.grupo(q)
+                if liberdades[r] == bit and r not in capturados:
+                    capturados.add(r)
+                    for s in self.pedras(r):
+                        h ^= chaves[s]
+        return h
+
+    def legal(self, p, cor=None):
+        """Ponto vazio, fora do ko, sem suicídio e (com superko) sem repetir posição."""
+        if p == PASSE:
+            return True
+        cor = cor or self.jogador_atual
+        if self.cores[p] != VAZIO or p == self.ko or not self._tem_liberdade(p, cor):
+            return False
+        return not (self.superko and self._hash_apos(p, cor) in self.hashes)
+
+    def _colocar(self, p, cor):
+        """Põe a pedra (já verificada como legal), une grupos e captura."""
+        cores, pai, proximo = self.cores, self.pai, self.proximo
+        liberdades, largura = self.liberdades, self.largura
+        oponente = 3 - cor
+        self._remover_vazio(p)
+        cores[p] = cor
+        pai[p] = p
+        proximo[p] = p
+        self.tamanho_grupo[p] = 1
+        self.hash ^= self.zobrist[cor][p]
+        vizinhos = (p - 1, p + 1, p - largura, p + largura)
+        libs = 0
+        for q in vizinhos:
+            if cores[q] == VAZIO:
+                libs |= 1 << q
+        liberdades[p] = libs
+        raiz = p
+        bit = 1 << p
+        capturadas = 0
+        ponto_capturado = 0
+        for q in vizinhos:
+            c = cores[q]
+            if c == cor:
+                r = self.grupo(q)
+                if r != raiz:
+                    raiz = self._unir(raiz, r)
+            elif c == oponente:
+                r = self.grupo(q)
+                liberdades[r] &= ~bit
+                if not liberdades[r]:
+                    ponto_capturado = r
+                    capturadas += self._capturar(r, cor)
+        liberdades[raiz] &= ~bit
+        # ko simples: capturou uma pedra e a nova pedra ficou sozinha em atari
+        if capturadas == 1 and self.tamanho_grupo[raiz] == 1 \
+                and liberdades[raiz] == 1 << ponto_capturado:
+            self.ko = ponto_capturado
+        else:
+            self.ko = 0
+
+    def jogar(self, p):
+        """Joga no ponto p (ou PASSE) pelo jogador atual; False se ilegal."""
+        if p == PASSE:
+            self.passar_turno()
+            return True
+        if not self.legal(p):
+            return False
+        self._colocar(p, self.jogador_atual)
+        if self.superko:
+            if self._hashes_compartilhados:
+                self.hashes = set(self.hashes)
+                self._hashes_compartilhados = False
+            self.hashes.add(self.hash)
+        self.jogador_atual = BRANCO if self.jogador_atual == PRETO else PRETO
+        self.passes = 0  # Resetar contador de passes
+        return True
+
+    def fazer_jogada(self, linha, coluna):
+        return self.jogar(self.ponto(linha, coluna))
+
+    def passar_turno(self):
+        self.jogador_atual = BRANCO if self.jogador_atual == PRETO else PRETO
+        self.passes += 1
+        self.ko = 0
+
+    def obter_jogadas_possiveis(self):
+        jogadas = [self.coordenadas(p) for p in self.vazios if self.legal(p)]
+        jogadas.append(('passar', 'passar'))  # Opção de passar
+        return jogadas
+
+    def is_finalizado(self):
+        # Finaliza o jogo se ambos os jogadores passarem consecutivamente
+        return self.passes >= 2
+
+    def olho(self, p, cor):
+        """p vazio cercado pela cor (ou borda), com no máximo uma diagonal
+        inimiga (nenhuma se estiver na borda)."""
+        cores, largura = self.cores, self.largura
+        for q in (p - 1, p + 1, p - largura, p + largura):
+            c = cores[q]
+            if c != cor and c != BORDA:
+                return False
+        inimigas = 0
+        na_borda = 0
+        # p - largura - 1 pode ser -1 no canto: o último índice também é borda
+        for q in (p - largura - 1, p - largura + 1, p + largura - 1, p + largura + 1):
+            c = cores[q]
+            if c == BORDA:
+                na_borda = 1
+            elif c == 3 - cor:
+                inimigas += 1
+        return inimigas + na_borda < 2
+
+    def pontuacao(self):
+        """Área (Tromp-Taylor): pedras + vazios que só alcançam uma cor.
+        Devolve pretas - brancas - komi."""
+        cores, largura = self.cores, self.largura
+        pontos = [0, 0, 0, 0]
+        visitado = bytearray(len(cores))
+        for p in range(len(cores)):
+            c = cores[p]
+            if c == PRETO or c == BRANCO:
+                pontos[c] += 1
+            elif c == VAZIO and not visitado[p]:
+                visitado[p] = 1
+                pilha = [p]
+                regiao = 0
+                alcanca = 0  # bits: 1 = preto, 2 = branco
+                while pilha:
+                    x = pilha.pop()
+                    regiao += 1
+                    for q in (x - 1, x + 1, x - largura, x + largura):
+                        cq = cores[q]
+                        if cq == VAZIO:
+                            if not visitado[q]:
+                                visitado[q] = 1
+                                pilha.append(q)
+                        elif cq != BORDA:
+                            alcanca |= cq
+                if alcanca == PRETO or alcanca == BRANCO:
+                    pontos[alcanca] += regiao
+        return pontos[PRETO] - pontos[BRANCO] - self.komi
+
+    def vencedor(self):
+        """PRETO ou BRANCO; VAZIO no empate (komi inteiro)."""
+        diferenca = self.pontuacao()
+        if diferenca == 0:
+            return VAZIO
+        return PRETO if diferenca > 0 else BRANCO
+
+    def copiar(self):
+        novo = Tabuleiro.__new__(Tabuleiro)
+        novo.__dict__.update(self.__dict__)
+        novo.cores = self.cores[:]
+        novo.pai = self.pai[:]
+        novo.proximo = self.proximo[:]
+        novo.tamanho_grupo = self.tamanho_grupo[:]
+        novo.liberdades = self.liberdades[:]
+        novo.vazios = self.vazios[:]
+        novo.indice_vazio = self.indice_vazio[:]
+        novo.capturas = self.capturas[:]
+        # copia preguiçosa: quem jogar primeiro duplica o conjunto
+        self._hashes_compartilhados = novo._hashes_compartilhados = True
+        return novo
+
+# ---------- MCTS ----------
+EXPLORACAO = 1.0  # constante do UCT para taxas de vitória em [0, 1]
+NIVEIS_FUSAO = 4  # níveis das árvores do modo RAIZ somados à árvore principal
+
+def simular(tabuleiro, gerador=random):
+    """Partida aleatória leve até dois passes, sem preencher os próprios
+    olhos; devolve o vencedor pela pontuação de área (VAZIO no empate)."""
+    t = tabuleiro.copiar()
+    t.superko = False  # nos playouts basta o ko simples
+    vazios = t.vazios
+    randrange = gerador.randrange
+    limite = 3 * t.tamanho * t.tamanho
+    jogadas = 0
+    while t.passes < 2 and jogadas < limite:
+        cor = t.jogador_atual
+        n = len(vazios)
+        escolhido = PASSE
+        if n:
+            inicio = randrange(n)
+            for k in range(n):
+                p = vazios[(inicio + k) % n]
+                if p != t.ko and not t.olho(p, cor) and t._tem_liberdade(p, cor):
+                    escolhido = p
+                    break
+        if escolhido:
+            t._colocar(escolhido, cor)
+            t.jogador_atual = 3 - cor
+            t.passes = 0
+        else:
+            t.passar_turno()
+        jogadas += 1
+    return t.vencedor()
+
+def jogadas_candidatas(tabuleiro):
+    """Jogadas legais que não preenchem olho próprio, mais o passe."""
+    cor = tabuleiro.jogador_atual
+    jogadas = [p for p in tabuleiro.vazios
+               if tabuleiro.legal(p) and not tabuleiro.olho(p, cor)]
+    jogadas.append(PASSE)
+    return jogadas
+
+class NodoMCTS:
+    __slots__ = ('pai', 'movimento', 'jogador', 'filhos', 'nao_expandidas', 'visitas', 'vitorias')
+
+    def __init__(self, pai=None, movimento=None, jogador=None):
+        self.pai = pai
+        self.movimento = movimento  # ponto (ou PASSE) que levou a este nó
+        self.jogador = jogador      # quem fez o movimento; vitorias contam para ele
+        self.filhos = []
+        self.nao_expandidas = None  # preenchida na primeira visita
+        self.visitas = 0
+        self.vitorias = 0
+
+    def selecionar_filho(self, exploracao=EXPLORACAO):
+        # Usar a fórmula UCT
+        log_visitas = math.log(self.visitas)
+        melhor_valor = -float('inf')
+        melhor_filho = None
+        for filho in self.filhos:
+            valor = (filho.vitorias / filho.visitas
+                     + exploracao * math.sqrt(log_visitas / filho.visitas))
+            if valor > melhor_valor:
+                melhor_valor = valor
+                melhor_filho = filho
+        return melhor_filho
+
+    def backpropagar(self, vencedor, contar_visitas=True):
+        # iterativo: sem limite de recursão em árvores profundas;
+        # com perda virtual as visitas já foram contadas na descida
+        nodo = self
+        while nodo is not None:
+            if contar_visitas:
+                nodo.visitas += 1
+            if nodo.jogador == vencedor:
+                nodo.vitorias += 1
+            elif vencedor == VAZIO:
+                nodo.vitorias += 0.5  # empate vale meia vitória para os dois
+            nodo = nodo.pai
+
+class MCTS:
+    """Árvore de busca que sobrevive entre jogadas.
+
+    Os nós guardam só o movimento; o tabuleiro de cada iteração é uma cópia
+    do tabuleiro da raiz com os movimentos do caminho refeitos. `avancar`
+    desce a raiz para o filho jogado, aproveitando as visitas já feitas.
+    """
+
+    def __init__(self, tabuleiro, exploracao=EXPLORACAO, gerador=None):
+        self.tabuleiro = tabuleiro.copiar()
+        self.exploracao = exploracao
+        self.gerador = gerador or random.Random()
+        self.raiz = NodoMCTS(jogador=3 - tabuleiro.jogador_atual)
+        self.playouts = 0
+
+    def _descer(self, perda_virtual=False):
+        """Seleção e expansão; devolve o nó escolhido e o tabuleiro nele.
+
+        Com `perda_virtual` a visita de cada nó do caminho é contada já na
+        descida, sem vitória: até o playout voltar, o caminho parece pior e
+        as outras threads tendem a escolher outro.
+        """
+        nodo = self.raiz
+        t = self.tabuleiro.copiar()
+        if perda_virtual:
+            nodo.visitas += 1
+        # Seleção
+        while nodo.filhos and not nodo.nao_expandidas:
+            nodo = nodo.selecionar_filho(self.exploracao)
+            t.jogar(nodo.movimento)
+            if perda_virtual:
+                nodo.visitas += 1
+        # Expansão
+        if not t.is_finalizado():
+            if nodo.nao_expandidas is None:
+                nodo.nao_expandidas = jogadas_candidatas(t)
+            if nodo.nao_expandidas:
+                candidatas = nodo.nao_expandidas
+                i = self.gerador.randrange(len(candidatas))
+                candidatas[i], candidatas[-1] = candidatas[-1], candidatas[i]
+                movimento = candidatas.pop()
+                filho = NodoMCTS(nodo, movimento, t.jogador_atual)
+                nodo.filhos.append(filho)
+                t.jogar(movimento)
+                nodo = filho
+                if perda_virtual:
+                    nodo.visitas += 1
+        return nodo, t
+
+    def _simular(self, t):
+        return t.vencedor() if t.is_finalizado() else simular(t, self.gerador)
+
+    def iterar(self):
+        nodo, t = self._descer()
+        # Simulação
+        vencedor = self._simular(t)
+        self.playouts += 1
+        # Retropropagação
+        nodo.backpropagar(vencedor)
+
+    def iterar_compartilhada(self, trava):
+        """Iteração para várias threads na mesma árvore: descida e
+        retropropagação sob `trava`, playout fora dela."""
+        with trava:
+            nodo, t = self._descer(perda_virtual=True)
+        vencedor = self._simular(t)
+        with trava:
+            self.playouts += 1
+            nodo.backpropagar(vencedor, contar_visitas=False)
+
+    def buscar(self, iteracoes=VIDAS_MAX):
+        for _ in range(iteracoes):
+            self.iterar()
+
+    def melhor_jogada(self):
+        """Filho da raiz com mais visitas (PASSE se a árvore estiver vazia)."""
+        if not self.raiz.filhos:
+            return PASSE
+        return max(self.raiz.filhos, key=lambda f: f.visitas).movimento
+
+    def estatisticas_raiz(self, niveis=NIVEIS_FUSAO):
+        """{movimento: (visitas, vitorias, {...})}: os filhos da raiz, cada um
+        com os seus filhos no mesmo formato, até `niveis` níveis."""
+        def exportar(nodo, niveis):
+            if not niveis:
+                return {}
+            return {f.movimento: (f.visitas, f.vitorias, exportar(f, niveis - 1))
+                    for f in nodo.filhos}
+        return exportar(self.raiz, niveis)
+
+    def _filho(self, nodo, movimento, t):
+        """Filho de `nodo` pelo movimento (t: tabuleiro em `nodo`), criado se faltar."""
+        for filho in nodo.filhos:
+            if filho.movimento == movimento:
+                return filho
+        if nodo.nao_expandidas is None:
+            nodo.nao_expandidas = jogadas_candidatas(t)
+        if movimento in nodo.nao_expandidas:
+            nodo.nao_expandidas.remove(movimento)
+        filho = NodoMCTS(nodo, movimento, t.jogador_atual)
+        nodo.filhos.append(filho)
+        return filho
+
+    def incorporar(self, estatisticas):
+        """Soma na árvore as estatísticas (formato de `estatisticas_raiz`) de
+        outra busca a partir da mesma posição, criando os nós que faltarem."""
+        pendentes = [(self.raiz, self.tabuleiro, estatisticas)]
+        while pendentes:
+            nodo, t, filhos = pendentes.pop()
+            for movimento, (visitas, vitorias, netos) in filhos.items():
+                filho = self._filho(nodo, movimento, t)
+                filho.visitas += visitas
+                filho.vitorias += vitorias
+                if netos:
+                    tf = t.copiar()
+                    tf.jogar(movimento)
+                    pendentes.append((filho, tf, netos))
+        self.raiz.visitas += sum(v for v, _, _ in estatisticas.values())
+
+    def avancar(self, movimento, tabuleiro):
+        """Reaproveita a subárvore do movimento jogado; `tabuleiro` é o jogo já atualizado."""
+        for filho in self.raiz.filhos:
+            if filho.movimento == movimento:
+                filho.pai = None
+                self.raiz = filho
+                break
+        else:
+            self.raiz = NodoMCTS(jogador=3 - tabuleiro.jogador_atual)
+        self.tabuleiro = tabuleiro.copiar()
+
+def mcts(arvore, iteracoes=VIDAS_MAX):
+    """Roda as iterações e devolve a jogada como (linha, coluna) ou ('passar', 'passar')."""
+    arvore.buscar(iteracoes)
+    # Escolher o filho com mais visitas
+    movimento = arvore.melhor_jogada()
+    if movimento == PASSE:
+        return ('passar', 'passar')
+    return arvore.tabuleiro.coordenadas(movimento)
+
+# ---------- MCTS paralelo ----------
+RAIZ = 'raiz'        # paralelismo de raiz: um processo por árvore
+ARVORE = 'arvore'    # paralelismo de árvore: threads com perda virtual
+INTERVALO_PROGRESSO = 0.25  # segundos entre avisos de progresso
+FOLGA = 1.0  # segundos além do prazo antes de abandonar os trabalhadores
+
+def _trabalhador_mcts(indice, tabuleiro, tempo, semente, fila, parar):
+    arvore = MCTS(tabuleiro, gerador=random.Random(semente))
+    inicio = time.perf_counter()
+    prazo = inicio + tempo
+    aviso = inicio + INTERVALO_PROGRESSO
+    while not parar.is_set():
+        agora = time.perf_counter()
+        if agora >= prazo:
+            break
+        if agora >= aviso:
+            fila.put((indice, arvore.playouts, None))
+            aviso = agora + INTERVALO_PROGRESSO
+        arvore.iterar()
+    fila.put((indice, arvore.playouts, arvore.estatisticas_raiz()))   # terminou
+
+
+class MCTSParalelo:
+    """MCTS com prazo, fora do laço da interface.
+
+    Modo RAIZ: cada processo cresce uma árvore própria a partir do
+    tabuleiro da raiz; as visitas e vitórias dos filhos e netos da raiz são
+    somadas em `arvore` e ganha o filho mais visitado. Assim a subárvore
+    reaproveitada por `avancar` chega à próxima jogada com estatísticas.
+    Modo ARVORE: threads iteram a própria `arvore` (reaproveitada entre
+    jogadas) com perda virtual. Com o GIL os playouts não rodam ao mesmo
+    tempo, então o ganho é só tirar a busca do laço da interface.
+
+    `iniciar` volta na hora; (movimento, visitas, playouts) aparece em
+    `resultados`. `ao_progredir(playouts, decorrido)` é chamado da thread
+    coordenadora, não do Tk: a interface deve só guardar os valores.
+    `cancelar` interrompe tudo sem publicar nada.
+    """
+
+    def __init__(self, trabalhadores=None, modo=RAIZ):
+        if modo not in (RAIZ, ARVORE):
+            raise ValueError(f"modo desconhecido: {modo}")
+        self.trabalhadores = trabalhadores or os.cpu_count() or 1
+        self.modo = modo
+        self.resultados = queue.Queue()
+        self._thread = None
+        self._parar = None
+        self._cancelada = False
+
+    def em_andamento(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def iniciar(self, arvore, tempo, ao_progredir=None):
+        if self.em_andamento():
+            raise RuntimeError("já existe uma busca em andamento")
+        self._cancelada = False
+        self._parar = multiprocessing.Event()
+        alvo = self._coordenar_raiz if self.modo == RAIZ else self._coordenar_arvore
+        self._thread = threading.Thread(target=alvo, args=(arvore, tempo, ao_progredir),
+                                        daemon=True)
+        self._thread.start()
+
+    def resultado(self):
+        """Resultado pronto ou None (não bloqueia)."""
+        try:
+            return self.resultados.get_nowait()
+        except queue.Empty:
+            return None
+
+    def esperar(self):
+        """Bloqueia até o resultado da busca iniciada (uso sem interface)."""
+        resultado = self.resultados.get()
+        self._thread.join()
+        self._thread = None
+        return resultado
+
+    def cancelar(self):
+        self._cancelada = True
+        if self._parar is not None:
+            self._parar.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _coordenar_raiz(self, arvore, tempo, ao_progredir):
+        inicio = time.perf_counter()
+        fila = multiprocessing.Queue()
+        n = self.trabalhadores
+        sementes = [random.getrandbits(64) for _ in range(n)]
+        processos = [multiprocessing.Process(target=_trabalhador_mcts, daemon=True,
+                                             args=(i, arvore.tabuleiro, tempo, sementes[i],
+                                                   fila, self._parar))
+                     for i in range(n)]
+        for p in processos:
+            p.start()
+
+        playouts = [0] * n
+        coletadas = []
+        ativos = n
+        prazo = inicio + tempo + FOLGA
+        while ativos and not self._cancelada:
+            try:
+                i, contagem, estatisticas = fila.get(
+                    timeout=max(0.01, prazo - time.perf_counter()))
+            except queue.Empty:
+                if time.perf_counter() > prazo:
+                    break
+                continue
+            playouts[i] = contagem
+            if estatisticas is not None:
+                ativos -= 1
+                coletadas.append(estatisticas)
+            if ao_progredir is not None:
+                ao_progredir(sum(playouts), time.perf_counter() - inicio)
+        self._parar.set()
+        for p in processos:
+            p.join(FOLGA)
+            if p.is_alive():
+                p.terminate()
+        if self._cancelada:
+            return
+
+        for estatisticas in coletadas:
+            arvore.incorporar(estatisticas)
+        arvore.playouts += sum(playouts)
+        self.resultados.put((arvore.melhor_jogada(), arvore.raiz.visitas, sum(playouts)))
+
+    def _coordenar_arvore(self, arvore, tempo, ao_progredir):
+        inicio = time.perf_counter()
+        prazo = inicio + tempo
+        iniciais = arvore.playouts
+        trava = threading.Lock()
+        parar = self._parar
+
+        def trabalhar():
+            while not parar.is_set() and time.perf_counter() < prazo:
+                arvore.iterar_compartilhada(trava)
+
+        threads = [threading.Thread(target=trabalhar, daemon=True)
+                   for _ in range(self.trabalhadores)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            while t.is_alive():
+                t.join(INTERVALO_PROGRESSO)
+                if ao_progredir is not None and not self._cancelada:
+                    ao_progredir(arvore.playouts - iniciais, time.perf_counter() - inicio)
+        if self._cancelada:
+            return
+        self.resultados.put((arvore.melhor_jogada(), arvore.raiz.visitas,
+                             arvore.playouts - iniciais))
+
+def pontos_estrela(tamanho):
+    """Pontos de estrela (linha, coluna), contados a partir de 1.
+
+    Cantos na 3ª linha (na 4ª a partir do 13x13) e centro nos tamanhos
+    ímpares; do 15x15 em diante também os pontos laterais.
+    """
+    if tamanho < 7:
+        return [(tamanho // 2 + 1,) * 2] if tamanho % 2 else []
+    margem = 3 if tamanho < 13 else 4
+    linhas = [margem, tamanho + 1 - margem]
+    pontos = [(i, j) for i in linhas for j in linhas]
+    if tamanho % 2:
+        meio = tamanho // 2 + 1
+        pontos.append((meio, meio))
+        if tamanho >= 15:
+            pontos += [(meio, l) for l in linhas] + [(l, meio) for l in linhas]
+    return pontos
+
+class InterfaceGo:
+    def __init__(self, master, tamanho=TAMANHO_TABULEIRO):
+        self.master = master
+        self.master.title("Jogo de Go com MCTS")
+        self.tabuleiro = Tabuleiro(tamanho)
+        self.arvore = MCTS(self.tabuleiro)  # reaproveitada de uma jogada para a outra
+        self.busca = MCTSParalelo()
+        self.progresso = None  # (playouts, decorrido), escrito pela thread da busca
+        self.canvas = tk.Canvas(master, width=450, height=450, bg="#DEB887")
+        self.canvas.pack()
+        self.situacao = tk.Label(master, text="")
+        self.situacao.pack()
+        self.master.protocol("WM_DELETE_WINDOW", self.fechar)
+        self.desenhar_tabuleiro()
+        self.canvas.bind("<Button-1>", self.clique_mouse)
+        self.atualizar_interface()
+        self.jogador_humano = PRETO  # Define o humano como jogador Preto
+        self.jogador_computador = BRANCO  # Computador joga Branco
+
+    def desenhar_tabuleiro(self):
+        passo = 450 / (self.tabuleiro.tamanho + 1)
+        self.passo = passo
+        self.linhas = self.tabuleiro.tamanho
+        # Desenhar linhas horizontais e verticais
+        for i in range(1, self.linhas + 1):
+            self.canvas.create_line(passo, passo * i, 450 - passo, passo * i)
+            self.canvas.create_line(passo * i, passo, passo * i, 450 - passo)
+        # Desenhar pontos de estrela
+        raio = passo / 9
+        for (i, j) in pontos_estrela(self.linhas):
+            x = passo * j
+            y = passo * i
+            self.canvas.create_oval(x - raio, y - raio, x + raio, y + raio, fill="black")
+
+    def atualizar_interface(self):
+        self.canvas.delete("peca")
+        grade = self.tabuleiro.grade  # monta a matriz inteira; lida uma vez só
+        raio = self.passo / 3
+        for i in range(self.tabuleiro.tamanho):
+            for j in range(self.tabuleiro.tamanho):
+                if grade[i][j] != VAZIO:
+                    x = self.passo * (j + 1)
+                    y = self.passo * (i + 1)
+                    cor = "black" if grade[i][j] == PRETO else "white"
+                    self.canvas.create_oval(x - raio, y - raio, x + raio, y + raio, fill=cor, tags="peca")
+        self.master.update()
+
+    def clique_mouse(self, evento):
+        if self.tabuleiro.jogador_atual != self.jogador_humano:
+            return  # Não é a vez do humano
+
+        passo = self.passo
+        j = int(round((evento.x) / passo)) - 1
+        i = int(round((evento.y) / passo)) - 1
+        if 0 <= i < self.tabuleiro.tamanho and 0 <= j < self.tabuleiro.tamanho:
+            jogada_valida = self.tabuleiro.fazer_jogada(i, j)
+            if jogada_valida:
+                self.arvore.avancar(self.tabuleiro.ponto(i, j), self.tabuleiro)
+                self.atualizar_interface()
+                if self.tabuleiro.is_finalizado():
+                    self.finalizar_jogo()
+                else:
+                    self.jogada_computador()
+        else:
+            # Clique fora do tabuleiro, considerar como passar
+            self.tabuleiro.passar_turno()
+            self.arvore.avancar(PASSE, self.tabuleiro)
+            self.atualizar_interface()
+            if self.tabuleiro.is_finalizado():
+                self.finalizar_jogo()
+            else:
+                self.jogada_computador()
+
+    def jogada_computador(self):
+        if self.tabuleiro.jogador_atual != self.jogador_computador:
+            return
+        # a busca roda em segundo plano; a janela continua respondendo
+        self.progresso = None
+        self.busca.iniciar(self.arvore, TEMPO_JOGADA, self.ao_progredir)
+        self.master.after(50, self.verificar_busca)
+
+    def ao_progredir(self, playouts, decorrido):
+        self.progresso = (playouts, decorrido)
+
+    def verificar_busca(self):
+        resultado = self.busca.resultado()
+        if resultado is None:
+            if self.progresso is not None:
+                playouts, decorrido = self.progresso
+                taxa = playouts / decorrido if decorrido > 0 else 0.0
+                self.situacao.config(text=f"Pensando... {playouts} playouts ({taxa:.0f}/s)")
+            self.master.after(50, self.verificar_busca)
+            return
+        movimento, visitas, playouts = resultado
+        self.situacao.config(text=f"{playouts} playouts, {visitas} visitas na raiz")
+        self.tabuleiro.jogar(movimento)  # PASSE também
+        self.arvore.avancar(movimento, self.tabuleiro)
+        self.atualizar_interface()
+        if self.tabuleiro.is_finalizado():
+            self.finalizar_jogo()
+
+    def fechar(self):
+        self.busca.cancelar()
+        self.master.destroy()
+
+    def finalizar_jogo(self):
+      
+        diferenca = self.tabuleiro.pontuacao()
+        if diferenca == 0:
+            print(f"Jogo finalizado! Empate (área, komi {self.tabuleiro.komi})")
+        else:
+            vencedor = "Pretas" if diferenca > 0 else "Brancas"
+            print(f"Jogo finalizado! {vencedor} vencem por {abs(diferenca)} pontos (área, komi {self.tabuleiro.komi})")
+     
+        self.master.quit()
+
+def main():
+    parser = argparse.ArgumentParser(description="Go contra o MCTS")
+    parser.add_argument('--tamanho', type=int, default=TAMANHO_TABULEIRO,
+                        help="linhas do tabuleiro (p.ex. 9, 13 ou 19)")
+    args = parser.parse_args()
+    root = tk.Tk()
+    jogo = InterfaceGo(root, args.tamanho)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
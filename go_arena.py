@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Arena de autojogo para o MCTS de go.py, sem janela
+
+Joga N partidas entre duas configurações (A e B) em processos paralelos,
+alternando as cores, e informa a taxa de vitória de A com intervalo de
+confiança de 95% (Wilson), playouts/s e tempo médio por jogada de cada
+lado. Empates (possíveis com komi inteiro) contam meia vitória para A.
+Serve de portão para mudanças de desempenho do MCTS: com o mesmo
+orçamento de tempo, uma versão mais rápida deve vencer a anterior.
+
+Configuração: pares chave=valor separados por vírgula, com as chaves
+iteracoes (por jogada), tempo (segundos por jogada; tem precedência) e
+exploracao (constante do UCT).
+
+Uso:
+  python3 go_arena.py -n 20 --a iteracoes=1000 --b iteracoes=300
+  python3 go_arena.py -n 40 --tamanho 9 --a tempo=1 --b tempo=1,exploracao=1.4 --json res.json
+"""
+
+import sys, time
+import argparse, json, math, multiprocessing, os, random
+
+from go import TAMANHO_TABULEIRO, VIDAS_MAX, KOMI, PRETO, PASSE, EXPLORACAO, Tabuleiro, MCTS
+
+CHAVES = {'iteracoes': int, 'tempo': float, 'exploracao': float}
+Z_95 = 1.959964
+
+# ----------------- Configurações -----------------
+def ler_configuracao(texto):
+    """'iteracoes=500,exploracao=1.4' -> dict com todas as chaves."""
+    configuracao = {'iteracoes': VIDAS_MAX, 'tempo': None, 'exploracao': EXPLORACAO}
+    for par in filter(None, texto.split(',')):
+        chave, _, valor = par.partition('=')
+        chave = chave.strip()
+        if chave not in CHAVES:
+            raise ValueError(f"chave desconhecida: {chave}")
+        configuracao[chave] = CHAVES[chave](valor)
+    return configuracao
+
+def descrever(configuracao):
+    if configuracao['tempo']:
+        orcamento = f"{configuracao['tempo']:g}s"
+    else:
+        orcamento = f"{configuracao['iteracoes']} it"
+    return f"{orcamento}, c={configuracao['exploracao']:g}"
+
+# ----------------- Uma partida -----------------
+def _pensar(arvore, configuracao):
+    """Roda o orçamento da configuração na árvore; devolve o movimento."""
+    if configuracao['tempo']:
+        prazo = time.perf_counter() + configuracao['tempo']
+        while time.perf_counter() < prazo:
+            arvore.iterar()
+    else:
+        arvore.buscar(configuracao['iteracoes'])
+    return arvore.melhor_jogada()
+
+def jogar_partida(indice, configuracoes, tamanho, komi, semente):
+    """Partida completa; A é preto nas partidas pares. Devolve uma linha de resultado."""
+    preto = 'A' if indice % 2 == 0 else 'B'
+    branco = 'B' if preto == 'A' else 'A'
+    tabuleiro = Tabuleiro(tamanho, komi=komi)
+    arvores = {}
+    for lado in 'AB':
+        configuracao = configuracoes[lado]
+        arvores[lado] = MCTS(tabuleiro, configuracao['exploracao'],
+                             random.Random(f"{semente}-{indice}-{lado}"))
+    tempo = {'A': 0.0, 'B': 0.0}
+    jogadas = {'A': 0, 'B': 0}
+    limite = 3 * tamanho * tamanho
+    total = 0
+    while not tabuleiro.is_finalizado() and total < limite:
+        lado = preto if tabuleiro.jogador_atual == PRETO else branco
+        inicio = time.perf_counter()
+        movimento = _pensar(arvores[lado], configuracoes[lado])
+        tempo[lado] += time.perf_counter() - inicio
+        jogadas[lado] += 1
+        total += 1
+        if not tabuleiro.jogar(movimento):   # não deve ocorrer; passa por segurança
+            movimento = PASSE
+            tabuleiro.jogar(PASSE)
+        for arvore in arvores.values():
+            arvore.avancar(movimento, tabuleiro)
+    diferenca = tabuleiro.pontuacao()
+    if diferenca == 0:
+        vencedor = None   # empate
+    else:
+        vencedor = preto if diferenca > 0 else branco
+    return {'partida': indice, 'preto': preto, 'vencedor': vencedor,
+            'pontuacao': diferenca, 'jogadas': total,
+            'playouts': {l: a.playouts for l, a in arvores.items()},
+            'tempo': tempo, 'jogadas_por_lado': jogadas}
+
+def _jogar_partida(argumentos):
+    return jogar_partida(*argumentos)
+
+def executar_arena(partidas, configuracoes, tamanho=TAMANHO_TABULEIRO, komi=KOMI,
+                   processos=1, semente=0, ao_terminar=None):
+    """Joga as partidas em até `processos` processos; devolve as linhas por partida."""
+    tarefas = [(i, configuracoes, tamanho, komi, semente) for i in range(partidas)]
+    linhas = []
+    with multiprocessing.Pool(processos) as pool:
+        for linha in pool.imap_unordered(_jogar_partida, tarefas):
+            linhas.append(linha)
+            if ao_terminar is not None:
+                ao_terminar(linha)
+    return sorted(linhas, key=lambda l: l['partida'])
+
+# ----------------- Estatísticas -----------------
+def intervalo_wilson(vitorias, n, z=Z_95):
+    """Intervalo de confiança de Wilson para a proporção vitorias/n."""
+    if n == 0:
+        return 0.0, 1.0
+    p = vitorias / n
+    denominador = 1 + z * z / n
+    centro = (p + z * z / (2 * n)) / denominador
+    margem = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominador
+    return max(0.0, centro - margem), min(1.0, centro + margem)
+
+def resumir(linhas):
+    n = len(linhas)
+    vitorias = sum(1 for l in linhas if l['vencedor'] == 'A')
+    empates = sum(1 for l in linhas if l['vencedor'] is None)
+    pontos = vitorias + empates / 2
+    baixo, alto = intervalo_wilson(pontos, n)
+    resumo = {'partidas': n, 'vitorias_a': vitorias, 'empates': empates,
+              'taxa_a': pontos / n if n else 0.0, 'intervalo_95': [baixo, alto],
+              'vitorias_preto': sum(1 for l in linhas if l['vencedor'] == l['preto'])}
+    for lado in 'AB':
+        playouts = sum(l['playouts'][lado] for l in linhas)
+        tempo = sum(l['tempo'][lado] for l in linhas)
+        jogadas = sum(l['jogadas_por_lado'][lado] for l in linhas)
+        resumo[lado] = {'playouts': playouts, 'tempo': tempo, 'jogadas': jogadas,
+                        'playouts_por_segundo': playouts / tempo if tempo > 0 else 0.0,
+                        'tempo_por_jogada': tempo / jogadas if jogadas else 0.0}
+    return resumo
+
+def main():
+    parser = argparse.ArgumentParser(description="Autojogo entre duas configurações do MCTS")
+    parser.add_argument('-n', '--partidas', type=int, default=20)
+    parser.add_argument('--a', default='', help="configuração A (p.ex. iteracoes=1000)")
+    parser.add_argument('--b', default='', help="configuração B (p.ex. tempo=1,exploracao=1.4)")
+    parser.add_argument('--tamanho', type=int, default=TAMANHO_TABULEIRO)
+    parser.add_argument('--komi', type=float, default=KOMI)
+    parser.add_argument('--processos', type=int, default=os.cpu_count() or 1,
+                        help="partidas simultâneas")
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--json', metavar='ARQUIVO', help="grava partidas e resumo")
+    args = parser.parse_args()
+
+    try:
+        configuracoes = {'A': ler_configuracao(args.a), 'B': ler_configuracao(args.b)}
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"A: {descrever(configuracoes['A'])}   B: {descrever(configuracoes['B'])}   "
+          f"{args.tamanho}x{args.tamanho}, komi {args.komi:g}", flush=True)
+
+    def ao_terminar(linha):
+        print(f"partida {linha['partida']:3}  preto={linha['preto']}  "
+              f"vencedor={linha['vencedor'] or '-'}  {linha['pontuacao']:+6.1f}  "
+              f"{linha['jogadas']:4} jogadas", flush=True)
+
+    linhas = executar_arena(args.partidas, configuracoes, args.tamanho, args.komi,
+                            args.processos, args.semente, ao_terminar)
+    resumo = resumir(linhas)
+
+    baixo, alto = resumo['intervalo_95']
+    print()
+    print(f"A venceu {resumo['vitorias_a']}/{resumo['partidas']}, {resumo['empates']} empates "
+          f"= {resumo['taxa_a']:.1%} (IC 95%: {baixo:.1%} a {alto:.1%}); "
+          f"preto venceu {resumo['vitorias_preto']}")
+    for lado in 'AB':
+        r = resumo[lado]
+        print(f"{lado}: {r['playouts_por_segundo']:8.0f} playouts/s  "
+              f"{r['tempo_por_jogada']:6.3f} s/jogada  ({r['playouts']} playouts, "
+              f"{r['jogadas']} jogadas)")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'configuracoes': configuracoes, 'partidas': linhas, 'resumo': resumo},
+                      f, indent=2, ensure_ascii=False)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
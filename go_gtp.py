@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Front-end GTP (Go Text Protocol, versão 2) para o motor de go.py, sem janela
+
+Lê comandos da entrada padrão e responde na saída padrão, então pode ser
+ligado a GoGui, Sabaki, gogui-twogtp etc. As jogadas vêm do MCTS de go.py:
+por número de iterações ou, com --tempo, pelo MCTSParalelo com prazo.
+
+Uso:
+  python3 go_gtp.py                         # 1000 iterações por jogada
+  python3 go_gtp.py --iteracoes 5000
+  python3 go_gtp.py --tempo 10 --processos 4 --modo raiz
+"""
+
+import sys
+import argparse
+
+from go import (TAMANHO_TABULEIRO, VIDAS_MAX, KOMI, VAZIO, PRETO, BRANCO, PASSE,
+                RAIZ, ARVORE, Tabuleiro, MCTS, MCTSParalelo)
+
+NOME = 'go.py MCTS'
+VERSAO = '1.0'
+LETRAS = 'ABCDEFGHJKLMNOPQRSTUVWXYZ'   # GTP pula o I
+TAMANHO_MAXIMO = 25
+
+class ErroGTP(Exception):
+    """Falha de comando: vira uma resposta '? mensagem'."""
+
+
+# ---------- conversões ----------
+def ler_cor(texto):
+    texto = texto.lower()
+    if texto in ('b', 'black'):
+        return PRETO
+    if texto in ('w', 'white'):
+        return BRANCO
+    raise ErroGTP("invalid color")
+
+def ler_vertice(texto, tabuleiro):
+    """Vértice GTP ('D4', 'pass') -> ponto do tabuleiro (ou PASSE)."""
+    texto = texto.upper()
+    if texto == 'PASS':
+        return PASSE
+    try:
+        coluna = LETRAS.index(texto[0])
+        linha = tabuleiro.tamanho - int(texto[1:])   # a linha 1 do GTP é a de baixo
+    except (IndexError, ValueError):
+        raise ErroGTP("invalid vertex") from None
+    if not (0 <= linha < tabuleiro.tamanho and 0 <= coluna < tabuleiro.tamanho):
+        raise ErroGTP("invalid vertex")
+    return tabuleiro.ponto(linha, coluna)
+
+def vertice(p, tabuleiro):
+    if p == PASSE:
+        return 'pass'
+    linha, coluna = tabuleiro.coordenadas(p)
+    return f"{LETRAS[coluna]}{tabuleiro.tamanho - linha}"
+
+def texto_pontuacao(diferenca):
+    if diferenca == 0:
+        return '0'
+    return f"B+{diferenca:g}" if diferenca > 0 else f"W+{-diferenca:g}"
+
+
+# ---------- motor ----------
+class MotorGTP:
+    """Estado da partida e despacho dos comandos GTP.
+
+    A árvore do MCTS é reaproveitada entre jogadas enquanto as cores
+    alternam; `undo` e jogadas fora de vez refazem o tabuleiro a partir do
+    histórico e recomeçam a árvore.
+    """
+
+    def __init__(self, iteracoes=VIDAS_MAX, tempo=None, processos=None, modo=RAIZ):
+        self.iteracoes = iteracoes
+        self.tempo = tempo
+        self.busca = MCTSParalelo(processos, modo) if tempo else None
+        self.tamanho = TAMANHO_TABULEIRO
+        self.komi = KOMI
+        self.encerrado = False
+        self.comandos = {
+            'protocol_version': lambda args: '2',
+            'name': lambda args: NOME,
+            'version': lambda args: VERSAO,
+            'known_command': self.known_command,
+            'list_commands': lambda args: '\n'.join(self.comandos),
+            'quit': self.quit,
+            'boardsize': self.boardsize,
+            'clear_board': self.clear_board,
+            'komi': self.set_komi,
+            'play': self.play,
+            'genmove': self.genmove,
+            'undo': self.undo,
+            'showboard': self.showboard,
+            'final_score': self.final_score,
+        }
+        self.clear_board([])
+
+    def executar(self, linha):
+        """Uma linha de entrada -> resposta completa (com '\\n\\n'), ou None se vazia."""
+        linha = linha.split('#', 1)[0].replace('\t', ' ').strip()
+        if not linha:
+            return None
+        partes = linha.split()
+        identificador = ''
+        if partes[0].isdigit():
+            identificador = partes.pop(0)
+        if not partes:
+            return None
+        comando, args = partes[0], partes[1:]
+        try:
+            if comando not in self.comandos:
+                raise ErroGTP("unknown command")
+            resposta = self.comandos[comando](args)
+        except ErroGTP as e:
+            return f"?{identificador} {e}\n\n"
+        return f"={identificador} {resposta}".rstrip(' ') + "\n\n"
+
+    # ---------- partida ----------
+    def _novo_tabuleiro(self):
+        return Tabuleiro(self.tamanho, komi=self.komi)
+
+    def _refazer(self):
+        """Reconstrói tabuleiro e árvore a partir do histórico."""
+        self.tabuleiro = self._novo_tabuleiro()
+        for cor, p in self.historico:
+            self.tabuleiro.jogador_atual = cor
+            self.tabuleiro.jogar(p)
+        self.arvore = MCTS(self.tabuleiro)
+
+    def _jogar(self, cor, p):
+        # valida antes de mexer no estado: uma jogada ilegal não muda nada
+        if not self.tabuleiro.legal(p, cor):
+            raise ErroGTP("illegal move")
+        if cor != self.tabuleiro.jogador_atual:
+            # jogada fora de vez (permitida no GTP): a árvore não serve mais
+            self.tabuleiro.jogador_atual = cor
+            self.arvore = MCTS(self.tabuleiro)
+        self.tabuleiro.jogar(p)
+        self.historico.append((cor, p))
+        self.arvore.avancar(p, self.tabuleiro)
+
+    def _pensar(self):
+        if self.busca is None:
+            self.arvore.buscar(self.iteracoes)
+            return self.arvore.melhor_jogada()
+        self.busca.iniciar(self.arvore, self.tempo)
+        movimento, _, _ = self.busca.esperar()
+        return movimento
+
+    # ---------- comandos ----------
+    def quit(self, args):
+        self.encerrado = True
+        return ''
+
+    def known_command(self, args):
+        if not args:
+            raise ErroGTP("missing argument")
+        return 'true' if args[0] in self.comandos else 'false'
+
+    def boardsize(self, args):
+        try:
+            tamanho = int(args[0])
+        except (IndexError, ValueError):
+            raise ErroGTP("boardsize not an integer") from None
+        if not 2 <= tamanho <= TAMANHO_MAXIMO:
+            raise ErroGTP("unacceptable size")
+        self.tamanho = tamanho
+        return self.clear_board([])
+
+    def clear_board(self, args):
+        self.historico = []
+        self._refazer()
+        return ''
+
+    def set_komi(self, args):
+        try:
+            self.komi = float(args[0])
+        except (IndexError, ValueError):
+            raise ErroGTP("komi not a float") from None
+        self.tabuleiro.komi = self.komi
+        self.arvore.tabuleiro.komi = self.komi
+        return ''
+
+    def play(self, args):
+        if len(args) < 2:
+            raise ErroGTP("invalid color or coordinate")
+        cor = ler_cor(args[0])
+        self._jogar(cor, ler_vertice(args[1], self.tabuleiro))
+        return ''
+
+    def genmove(self, args):
+        if not args:
+            raise ErroGTP("invalid color")
+        cor = ler_cor(args[0])
+        if cor != self.tabuleiro.jogador_atual:
+            self.tabuleiro.jogador_atual = cor
+            self.arvore = MCTS(self.tabuleiro)
+        p = self._pensar()
+        self._jogar(cor, p)
+        return vertice(p, self.tabuleiro)
+
+    def undo(self, args):
+        if not self.historico:
+            raise ErroGTP("cannot undo")
+        self.historico.pop()
+        self._refazer()
+        return ''
+
+    def showboard(self, args):
+        t = self.tabuleiro
+        simbolos = {VAZIO: '.', PRETO: 'X', BRANCO: 'O'}
+        colunas = '   ' + ' '.join(LETRAS[:t.tamanho])
+        linhas = [colunas]
+        for i, fila in enumerate(t.grade):
+            numero = t.tamanho - i
+            linhas.append(f"{numero:2} " + ' '.join(simbolos[c] for c in fila) + f" {numero}")
+        linhas.append(colunas)
+        return '\n' + '\n'.join(linhas)
+
+    def final_score(self, args):
+        return texto_pontuacao(self.tabuleiro.pontuacao())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Motor de go.py pelo protocolo GTP")
+    parser.add_argument('--iteracoes', type=int, default=VIDAS_MAX,
+                        help="iterações de MCTS por jogada (sem --tempo)")
+    parser.add_argument('--tempo', type=float, help="segundos por jogada (MCTS paralelo)")
+    parser.add_argument('--processos', type=int, help="trabalhadores do MCTS paralelo")
+    parser.add_argument('--modo', choices=(RAIZ, ARVORE), default=RAIZ)
+    args = parser.parse_args()
+
+    motor = MotorGTP(args.iteracoes, args.tempo, args.processos, args.modo)
+    for linha in sys.stdin:
+        resposta = motor.executar(linha)
+        if resposta is None:
+            continue
+        sys.stdout.write(resposta)
+        sys.stdout.flush()
+        if motor.encerrado:
+            break
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
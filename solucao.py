@@ -1,434 +1,1663 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-Solucionador SAT (CDCL)
-
-Recursos:
-- Literais vigiados (watched literals)
-- Propagação unitária
-- Aprendizado de cláusulas (1-UIP) e backjump não cronológico
-- Heurística VSIDS (pontuação com decaimento)
-- Reinícios segundo a sequência de Luby
-- Pré-processamento simples (unidades e literais puros)
-- DRAT-lite (registro das cláusulas aprendidas)
-
-Uso:
-  python3 sat_cdcl_pt.py problema.cnf
-  cat problema.cnf | python3 sat_cdcl_pt.py
-"""
-
-import sys, random, time
-from collections import defaultdict, deque
-
-# ----------------- Utilidades -----------------
-def ler_dimacs(linhas):
-    numero_variaveis = numero_clausulas = 0
-    clausulas = []
-    for linha in linhas:
-        linha = linha.strip()
-        if not linha or linha.startswith('c'):
-            continue
-        if linha.startswith('p'):
-            _, fmt, numero_variaveis, numero_clausulas = linha.split()
-            numero_variaveis, numero_clausulas = int(numero_variaveis), int(numero_clausulas)
-        else:
-            lits = list(map(int, linha.split()))
-            if not lits:
-                continue
-            assert lits[-1] == 0, "Cláusula deve terminar com 0"
-            lits = lits[:-1]
-            # remove duplicatas e tautologias
-            conjunto = set(lits)
-            if any((-l) in conjunto for l in conjunto):
-                continue  # tautologia: sempre verdadeira
-            clausulas.append(list(conjunto))
-    return numero_variaveis, clausulas
-
-def variavel(lit): 
-    return abs(lit)
-
-# ----------------- Solver -----------------
-class CDCL:
-    def __init__(self, numero_variaveis, clausulas_iniciais, semente=7):
-        self.n = numero_variaveis
-        self.clausulas_originais = [list(c) for c in clausulas_iniciais]
-
-        self.clausulas = []                      # base + aprendidas
-        self.vigilancias = defaultdict(list)     # lit -> [(id_clausula, outro_lit)]
-        self.atribuicao = [0]*(self.n+1)         # -1 falso, +1 verdadeiro, 0 indefinido
-        self.nivel = [0]*(self.n+1)              # nível de decisão de cada variável
-        self.razao = [None]*(self.n+1)           # id da cláusula que implicou a variável
-        self.trilha = []                         # pilha de literais atribuídos
-        self.marcos_trilha = []                  # índices separando níveis na trilha
-
-        self.atividade = [0.0]*(self.n+1)        # VSIDS: atividade por variável
-        self.incremento_variavel = 1.0
-        self.decaimento_variavel = 0.95
-        self.conjunto_ordem = set(range(1, self.n+1))  # variáveis livres
-
-        self.aleatorio = random.Random(semente)
-        self.reinicios = 0
-        self.conflitos = 0
-        self.drats = []                          # DRAT-lite: cláusulas aprendidas
-
-        # carregar cláusulas iniciais
-        for c in self.clausulas_originais:
-            if not self.adicionar_clausula(c, aprendida=False):
-                raise RuntimeError("UNSAT imediato ao adicionar cláusulas iniciais")
-
-        # pré-processamento
-        self.preprocessar()
-
-    # ---------- Watched literals ----------
-    def adicionar_clausula(self, clausula, aprendida=True):
-        clausula = list(dict.fromkeys(clausula))  # deduplicar preservando ordem
-
-        # remover literais já satisfeitos e falsos
-        if any(self.valor(l) is True for l in clausula):
-            return True
-        clausula = [l for l in clausula if self.valor(l) is not False]
-        if not clausula:
-            return False  # cláusula vazia: conflito imediato
-
-        if len(clausula) == 1:
-            # unit: força imediatamente
-            if not self.enfileirar(clausula[0], razao=None):
-                return False
-
-        id_clausula = len(self.clausulas)
-        self.clausulas.append(clausula)
-
-        # registrar vigilâncias
-        if len(clausula) == 1:
-            self.vigilancias[clausula[0]].append((id_clausula, clausula[0]))
-        else:
-            a, b = clausula[0], clausula[1]
-            self.vigilancias[a].append((id_clausula, b))
-            self.vigilancias[b].append((id_clausula, a))
-
-        if aprendida:
-            self.drats.append(list(clausula))
-        return True
-
-    def valor(self, lit):
-        v = variavel(lit)
-        val = self.atribuicao[v]
-        if val == 0:
-            return None
-        return (val == 1) if lit > 0 else (val == -1)
-
-    # ---------- Atribuição / propagação ----------
-    def novo_nivel_decisao(self):
-        self.marcos_trilha.append(len(self.trilha))
-
-    def enfileirar(self, lit, razao):
-        v = variavel(lit)
-        val = 1 if lit > 0 else -1
-        if self.atribuicao[v] != 0:
-            return self.atribuicao[v] == val
-        self.atribuicao[v] = val
-        self.nivel[v] = len(self.marcos_trilha)
-        self.razao[v] = razao
-        if v in self.conjunto_ordem:
-            self.conjunto_ordem.remove(v)
-        self.trilha.append(lit)
-        return True
-
-    def propagar(self):
-        """Retorna id da cláusula em conflito, ou None se ok."""
-        inicio = self.marcos_trilha[-1] if self.marcos_trilha else 0
-        fila = deque(self.trilha[inicio:])
-        while fila:
-            lit = fila.popleft()
-            neg = -lit
-            lista = self.vigilancias[neg]
-            i = 0
-            while i < len(lista):
-                id_clausula, outro = lista[i]
-                clausula = self.clausulas[id_clausula]
-
-                if self.valor(outro) is True:
-                    i += 1
-                    continue
-
-                # tentar mover vigilância de -lit para outro literal não-falso
-                substituido = False
-                for l in clausula:
-                    if l == neg or l == outro:
-                        continue
-                    if self.valor(l) is not False:
-                        lista[i] = lista[-1]; lista.pop()
-                        self.vigilancias[l].append((id_clausula, outro))
-                        substituido = True
-                        break
-                if substituido:
-                    continue
-
-                # sem substituto: vira unit ou conflito
-                if self.valor(outro) is False:
-                    return id_clausula  # conflito
-                else:
-                    # unit: força 'outro'
-                    if self.enfileirar(outro, razao=id_clausula):
-                        fila.append(outro)
-                        i += 1
-                    else:
-                        return id_clausula
-        return None
-
-    # ---------- Análise de conflito (1-UIP) ----------
-    def analisar(self, id_conflito):
-        self.conflitos += 1
-        clausula = list(self.clausulas[id_conflito])
-        vistos = set()
-        aprendida = []
-        caminho = 0
-        p = None
-
-        nivel_atual = len(self.marcos_trilha)
-        for l in clausula:
-            if self.nivel[variavel(l)] == nivel_atual:
-                caminho += 1
-
-        while True:
-            # aumentar atividade das variáveis que aparecem na cláusula
-            for l in clausula:
-                self.impulsionar_atividade_variavel(variavel(l))
-
-            # voltar na trilha até encontrar literal do nível atual presente na cláusula
-            while self.trilha:
-                p = self.trilha[-1]
-                if variavel(p) in [variavel(x) for x in clausula if self.nivel[variavel(x)] == nivel_atual]:
-                    break
-                self.trilha.pop()
-
-            # construir resolvente removendo p
-            nova = []
-            for l in clausula:
-                if variavel(l) != variavel(p):
-                    if variavel(l) not in vistos:
-                        vistos.add(variavel(l))
-                        if self.nivel[variavel(l)] == nivel_atual:
-                            caminho += 1
-                        else:
-                            aprendida.append(l)
-                        nova.append(l)
-
-            id_razao = self.razao[variavel(p)]
-            caminho -= 1
-            self.trilha.pop()
-
-            if id_razao is None:
-                # p foi uma decisão: fecha cláusula aprendida com ~p
-                aprendida.append(-p)
-                break
-
-            # resolvente: (clausula \ {p}) ∪ (razao(p) \ {~p})
-            clausula = [l for l in self.clausulas[id_razao] if variavel(l) != variavel(p)] + nova
-
-            if caminho == 0:
-                aprendida.append(-p)
-                break
-
-        # normalizar: primeiro literal é do maior nível
-        niveis = [self.nivel[variavel(l)] for l in aprendida]
-        if not niveis:
-            return [], 0  # cláusula vazia -> UNSAT
-
-        maior = max(niveis)
-        idx_maior = next(i for i, nv in enumerate(niveis) if nv == maior)
-        aprendida[0], aprendida[idx_maior] = aprendida[idx_maior], aprendida[0]
-
-        # nível de salto = maior nível entre os demais literais
-        nivel_salto = 0
-        for i in range(1, len(aprendida)):
-            nivel_salto = max(nivel_salto, self.nivel[variavel(aprendida[i])])
-
-        return aprendida, nivel_salto
-
-    def cancelar_ate(self, nivel_objetivo):
-        while len(self.marcos_trilha) > nivel_objetivo:
-            inicio = self.marcos_trilha.pop()
-            while len(self.trilha) > inicio:
-                lit = self.trilha.pop()
-                v = variavel(lit)
-                self.atribuicao[v] = 0
-                self.nivel[v] = 0
-                self.razao[v] = None
-                self.conjunto_ordem.add(v)
-
-    # ---------- VSIDS ----------
-    def impulsionar_atividade_variavel(self, v):
-        self.atividade[v] += self.incremento_variavel
-        if self.atividade[v] > 1e100:
-            for i in range(1, self.n+1):
-                self.atividade[i] *= 1e-100
-            self.incremento_variavel *= 1e-100
-
-    def decair_atividade(self):
-        self.incremento_variavel /= self.decaimento_variavel
-
-    def escolher_literal_decisao(self):
-        melhor_v = None
-        melhor_atividade = -1.0
-        for v in self.conjunto_ordem:
-            if self.atividade[v] > melhor_atividade:
-                melhor_atividade = self.atividade[v]
-                melhor_v = v
-        if melhor_v is None:
-            return None
-        # fase padrão positiva
-        return melhor_v
-
-    # ---------- Reinícios (Luby) ----------
-    def luby(self, i):
-        k = 1
-        while (1 << k) - 1 < i:
-            k += 1
-        if i == (1 << k) - 1:
-            return 1 << (k - 1)
-        return self.luby(i - (1 << (k - 1)) + 1)
-
-    # ---------- Pré-processamento ----------
-    def preprocessar(self):
-        alterou = True
-        while alterou:
-            alterou = False
-            # unidades
-            unidades = []
-            for idc, c in enumerate(self.clausulas):
-                vivos = [l for l in c if self.valor(l) is not False]
-                if not vivos:
-                    raise RuntimeError("UNSAT durante pré-processamento (cláusula vazia)")
-                if len(vivos) == 1 and self.valor(vivos[0]) is None:
-                    unidades.append(vivos[0])
-
-            for u in unidades:
-                if self.enfileirar(u, razao=None):
-                    conflito = self.propagar()
-                    if conflito is not None:
-                        raise RuntimeError("UNSAT durante pré-processamento")
-                    alterou = True
-
-            # literais puros
-            if not alterou:
-                contagem = defaultdict(int)
-                for c in self.clausulas:
-                    for l in c:
-                        if self.valor(l) is None:
-                            contagem[l] += 1
-                vistos = set()
-                for l in list(contagem.keys()):
-                    v = variavel(l)
-                    if v in vistos:
-                        continue
-                    if contagem.get(l, 0) > 0 and contagem.get(-l, 0) == 0:
-                        if self.enfileirar(l, razao=None):
-                            conflito = self.propagar()
-                            if conflito is not None:
-                                raise RuntimeError("UNSAT durante pré-processamento")
-                            alterou = True
-                    elif contagem.get(-l, 0) > 0 and contagem.get(l, 0) == 0:
-                        if self.enfileirar(-l, razao=None):
-                            conflito = self.propagar()
-                            if conflito is not None:
-                                raise RuntimeError("UNSAT durante pré-processamento")
-                            alterou = True
-                    vistos.add(v)
-
-    # ---------- Loop principal ----------
-    def resolver(self, tempo_max=None):
-        inicio = time.time()
-        base_orcamento = 100
-        indice_luby = 1
-        proximo_reinicio = base_orcamento * self.luby(indice_luby)
-
-        # propagar após pré-processamento
-        conflito = self.propagar()
-        if conflito is not None:
-            return False
-
-        while True:
-            if tempo_max and time.time() - inicio > tempo_max:
-                print("INDETERMINADO: timeout", file=sys.stderr)
-                return None
-
-            # todas as variáveis atribuídas?
-            if all(self.atribuicao[i] != 0 for i in range(1, self.n+1)):
-                return True
-
-            # decisão
-            decisao = self.escolher_literal_decisao()
-            if decisao is None:
-                return True
-            self.novo_nivel_decisao()
-            if not self.enfileirar(decisao, razao=None):
-                return False
-
-            while True:
-                conflito = self.propagar()
-                if conflito is None:
-                    break
-                aprendida, nivel_salto = self.analisar(conflito)
-                self.decair_atividade()
-
-                if aprendida == []:
-                    return False  # cláusula vazia aprendida -> UNSAT
-
-                self.cancelar_ate(nivel_salto)
-                if not self.adicionar_clausula(aprendida, aprendida=True):
-                    return False
-                if not self.enfileirar(aprendida[0], razao=len(self.clausulas)-1):
-                    return False
-
-                # reinício?
-                if self.conflitos >= proximo_reinicio:
-                    self.reinicios += 1
-                    self.cancelar_ate(0)
-                    indice_luby += 1
-                    proximo_reinicio += base_orcamento * self.luby(indice_luby)
-                    break
-
-# ----------------- Execução CLI -----------------
-def main():
-    if len(sys.argv) > 1 and sys.argv[1] not in ('-', '--'):
-        with open(sys.argv[1], 'r', encoding='utf-8', errors='ignore') as f:
-            dados = f.readlines()
-    else:
-        dados = sys.stdin.readlines()
-
-    numero_variaveis, clausulas = ler_dimacs(dados)
-    solver = CDCL(numero_variaveis, clausulas)
-
-    resultado = solver.resolver()
-    if resultado is True:
-        print("SAT")
-        # modelo para 1..n
-        modelo = []
-        for v in range(1, solver.n+1):
-            val = solver.atribuicao[v]
-            if val == 0:
-                val = 1
-            modelo.append(v if val == 1 else -v)
-        # saída estilo DIMACS (linhas 'v')
-        linha = []
-        for lit in modelo:
-            linha.append(str(lit))
-            if len(linha) > 12:
-                print("v " + " ".join(linha) + " 0")
-                linha = []
-        if linha:
-            print("v " + " ".join(linha) + " 0")
-
-        if solver.drats:
-            print("c DRAT-lite (cláusulas aprendidas):")
-            for c in solver.drats:
-                print("c l", " ".join(map(str, c)), "0")
-
-    elif resultado is False:
-        print("UNSAT")
-    else:
-        print("UNKNOWN")
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Solucionador SAT (CDCL)
+
+Recursos:
+- Arena plana de cláusulas (array('i') com cabeçalhos de início/tamanho)
+- Literais vigiados (watched literals) com literal bloqueador
+- Propagação unitária sobre atribuição indexada por literal (2*var + sinal)
+- Aprendizado de cláusulas (1-UIP) com minimização recursiva e backjump não cronológico
+- Heurística VSIDS (pontuação com decaimento) sobre heap indexado
+- Phase saving (polaridade salva no backtrack)
+- Reinícios segundo a sequência de Luby ou por médias móveis de LBD (estilo glucose)
+- Redução periódica da base de cláusulas aprendidas (LBD + atividade) com compactação da arena
+- Pré-processamento: unidades, literais puros e SatELite (subsunção,
+  auto-subsunção e eliminação limitada de variáveis, com reconstrução do modelo)
+- Prova DRAT binária gravada em fluxo (arquivo ou pipe), opcional
+- Leitor DIMACS em blocos (mmap, gzip ou xz) direto para um buffer plano
+- Modo portfólio: N processos com configurações diversificadas que trocam
+  cláusulas curtas (LBD <= 2) por um anel em memória compartilhada
+- API incremental: cláusulas entre resoluções, assumpções e núcleo final
+- Estatísticas: contadores, tempo por fase, progresso periódico e JSON
+
+Uso:
+  python3 sat_cdcl_pt.py problema.cnf
+  python3 sat_cdcl_pt.py problema.cnf.xz
+  python3 sat_cdcl_pt.py --portfolio 8 problema.cnf
+  python3 sat_cdcl_pt.py --drat prova.drat problema.cnf
+  python3 sat_cdcl_pt.py --verbose 10000 --estatisticas stats.json problema.cnf
+  cat problema.cnf | python3 sat_cdcl_pt.py
+"""
+
+import sys, random, time
+import argparse, gzip, json, lzma, mmap, multiprocessing, operator, os, queue, re
+from array import array
+from collections import defaultdict
+
+try:
+    import numpy as np
+except ImportError:  # caminho vetorizado opcional
+    np = None
+
+# ----------------- Utilidades -----------------
+def variavel(lit):
+    return abs(lit)
+
+# ----------------- Leitura rápida (buffer plano) -----------------
+TAMANHO_BLOCO = 1 << 24   # bytes lidos por vez do arquivo/fluxo
+
+_CABECALHO = re.compile(rb'^[ \t]*p[ \t]+cnf[ \t]+(\d+)[ \t]+(\d+)', re.M)
+_LINHA_IGNORADA = re.compile(rb'^[ \t]*[cp][^\n]*', re.M)
+
+
+class ClausulasDimacs:
+    """Cláusulas DIMACS em um único array('i'): literais separados por 0.
+
+    `fins[i]` é o índice do 0 que fecha a cláusula i. Iterar produz listas
+    (útil para verificar modelos), mas o CDCL consome o buffer diretamente.
+    """
+
+    def __init__(self, literais, fins):
+        self.literais = literais
+        self.fins = fins
+
+    def __len__(self):
+        return len(self.fins)
+
+    def __iter__(self):
+        a = 0
+        for b in self.fins:
+            yield list(self.literais[a:b])
+            a = b + 1
+
+
+def abrir_cnf(caminho):
+    """Abre o CNF como fluxo binário: gzip/xz pelo número mágico, senão mmap."""
+    with open(caminho, 'rb') as f:
+        magica = f.read(6)
+        if magica[:2] == b'\x1f\x8b':
+            return gzip.open(caminho, 'rb')
+        if magica == b'\xfd7zXZ\x00':
+            return lzma.open(caminho, 'rb')
+        if not magica:
+            return open(caminho, 'rb')  # arquivo vazio não pode ser mapeado
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _fins_clausulas(literais):
+    """Índices dos zeros que terminam cada cláusula."""
+    if np is not None:
+        zeros = np.flatnonzero(np.frombuffer(literais, dtype=np.int32) == 0)
+        fins = array('i')
+        fins.frombytes(zeros.astype(np.int32).tobytes())
+        return fins
+    fins = array('i')
+    i = -1
+    try:
+        while True:
+            i = literais.index(0, i + 1)
+            fins.append(i)
+    except ValueError:
+        pass
+    return fins
+
+
+def ler_dimacs_rapido(fluxo, tamanho_bloco=TAMANHO_BLOCO):
+    """Lê um CNF de um fluxo binário para (numero_variaveis, ClausulasDimacs).
+
+    O texto é processado em blocos cortados em fim de linha; comentários e o
+    cabeçalho são removidos por expressão regular e os inteiros são
+    convertidos em lote, sem listas por linha nem por cláusula.
+    """
+    numero_variaveis = 0
+    literais = array('i')
+    resto = b''
+    while True:
+        bloco = fluxo.read(tamanho_bloco)
+        dados = resto + bloco if resto else bloco
+        if bloco:
+            corte = dados.rfind(b'\n') + 1
+            if corte == 0:
+                resto = dados  # linha ainda incompleta: continuar acumulando
+                continue
+            dados, resto = dados[:corte], dados[corte:]
+        fim = not bloco
+        if b'%' in dados:  # marcador de fim usado em alguns arquivos SATLIB
+            dados = dados[:dados.index(b'%')]
+            fim = True
+        if b'p' in dados:
+            m = _CABECALHO.search(dados)
+            if m:
+                numero_variaveis = int(m.group(1))
+        if b'c' in dados or b'p' in dados:
+            dados = _LINHA_IGNORADA.sub(b'', dados)
+        literais.extend(map(int, dados.split()))
+        if fim:
+            break
+
+    if literais and literais[-1] != 0:
+        literais.append(0)  # última cláusula sem terminador
+    if literais:
+        numero_variaveis = max(numero_variaveis, max(literais), -min(literais))
+    return numero_variaveis, ClausulasDimacs(literais, _fins_clausulas(literais))
+
+
+def ler_dimacs_arquivo(caminho, tamanho_bloco=TAMANHO_BLOCO):
+    fluxo = abrir_cnf(caminho)
+    try:
+        return ler_dimacs_rapido(fluxo, tamanho_bloco)
+    finally:
+        fluxo.close()
+
+# Codificação interna dos literais: x = 2*var + sinal (sinal 1 = negado).
+# Assim a negação é x ^ 1, a variável é x >> 1 e o literal indexa arrays
+# diretamente, sem abs() nem desvios.
+def codificar(lit):
+    return 2 * lit if lit > 0 else 1 - 2 * lit
+
+def decodificar(x):
+    return -(x >> 1) if x & 1 else x >> 1
+
+def codificar_buffer(literais):
+    """Codifica um array('i') de literais DIMACS inteiro (0 vira 1, nunca lido)."""
+    if np is not None:
+        x = np.frombuffer(literais, dtype=np.int32)
+        cod = array('i')
+        cod.frombytes(np.where(x > 0, 2 * x, 1 - 2 * x).astype(np.int32).tobytes())
+        return cod
+    return array('i', map(codificar, literais))
+
+# ----------------- Prova DRAT -----------------
+class EscritorDRAT:
+    """Grava cláusulas adicionadas/removidas em formato DRAT conforme são produzidas.
+
+    No formato binário cada cláusula é 'a' ou 'd' seguido dos literais em
+    varint (2*var + sinal, a mesma codificação interna do solver) e de um
+    byte 0. Os bytes se acumulam num buffer de `tamanho_buffer` antes de ir
+    para o arquivo/pipe.
+    """
+
+    def __init__(self, destino, binario=True, tamanho_buffer=1 << 16):
+        if isinstance(destino, (str, os.PathLike)):
+            self.arquivo = open(destino, 'wb')
+            self.proprio = True
+        else:
+            self.arquivo = destino          # fluxo binário já aberto (ex.: pipe)
+            self.proprio = False
+        self.binario = binario
+        self.tamanho_buffer = tamanho_buffer
+        self.buffer = bytearray()
+        self.codigos = {}                   # literal -> bytes já codificados
+
+    def _codigo(self, x):
+        if self.binario:
+            b = bytearray()
+            while x > 127:
+                b.append((x & 127) | 128)
+                x >>= 7
+            b.append(x)
+            codigo = bytes(b)
+        else:
+            codigo = b'%d ' % decodificar(x)
+        self.codigos[x] = codigo
+        return codigo
+
+    def _gravar(self, marcador, lits):
+        buffer, codigos = self.buffer, self.codigos
+        if self.binario:
+            buffer += marcador
+        elif marcador == b'd':
+            buffer += b'd '
+        for x in lits:
+            buffer += codigos.get(x) or self._codigo(x)
+        buffer += b'\x00' if self.binario else b'0\n'
+        if len(buffer) >= self.tamanho_buffer:
+            self.descarregar()
+
+    def adicionar(self, lits):
+        self._gravar(b'a', lits)
+
+    def remover(self, lits):
+        self._gravar(b'd', lits)
+
+    def descarregar(self):
+        if self.buffer:
+            self.arquivo.write(self.buffer)
+            self.buffer.clear()
+
+    def fechar(self):
+        self.descarregar()
+        if self.proprio:
+            self.arquivo.close()
+        else:
+            self.arquivo.flush()
+
+# ----------------- Estatísticas -----------------
+class EstatisticasCDCL:
+    """Contadores e cronômetros do solver.
+
+    Conflitos, reinícios e reduções continuam no próprio CDCL (dirigem os
+    agendamentos); `resumo(solver)` junta tudo num dicionário.
+    intervalo_progresso: imprime uma linha 'c ...' a cada N conflitos (0 = nunca).
+    intervalo_amostragem: a cada N conflitos registra o histograma dos
+        tamanhos das listas de vigilância (0 = nunca).
+    """
+
+    FASES = ('propagar', 'analisar', 'decidir', 'reduzir')
+
+    def __init__(self, intervalo_progresso=0, intervalo_amostragem=0, saida=sys.stderr):
+        self.propagacoes = 0
+        self.decisoes = 0
+        self.literais_aprendidos = 0             # antes da minimização
+        self.literais_minimizados = 0            # depois da minimização
+        self.tempos = dict.fromkeys(self.FASES, 0.0)
+        self.inicio = time.perf_counter()
+        self.intervalo_progresso = intervalo_progresso
+        self.intervalo_amostragem = intervalo_amostragem
+        self.histograma_vigilancias = defaultdict(int)  # 2^k -> nº de listas com tamanho < 2^k
+        self.amostras = 0
+        self.saida = saida
+
+    def apos_conflito(self, solver):
+        """Gancho chamado pelo solver a cada conflito."""
+        if self.intervalo_progresso and solver.conflitos % self.intervalo_progresso == 0:
+            print(self.linha_progresso(solver), file=self.saida)
+        if self.intervalo_amostragem and solver.conflitos % self.intervalo_amostragem == 0:
+            self.amostrar_vigilancias(solver)
+
+    def amostrar_vigilancias(self, solver):
+        self.amostras += 1
+        histograma = self.histograma_vigilancias
+        for lista in solver.vigilancias:
+            histograma[1 << (len(lista) // 2).bit_length()] += 1
+
+    def linha_progresso(self, solver):
+        decorrido = max(time.perf_counter() - self.inicio, 1e-9)
+        return (f"c {decorrido:8.1f}s conflitos={solver.conflitos} decisoes={self.decisoes} "
+                f"propagacoes={self.propagacoes} props/s={self.propagacoes / decorrido:.0f} "
+                f"conflitos/s={solver.conflitos / decorrido:.0f} aprendidas={len(solver.aprendidas)} "
+                f"reinicios={solver.reinicios} reducoes={solver.reducoes}")
+
+    def resumo(self, solver):
+        decorrido = max(time.perf_counter() - self.inicio, 1e-9)
+        return {
+            'tempo_total': decorrido,
+            'propagacoes': self.propagacoes,
+            'decisoes': self.decisoes,
+            'conflitos': solver.conflitos,
+            'reinicios': solver.reinicios,
+            'reducoes': solver.reducoes,
+            'literais_aprendidos': self.literais_aprendidos,
+            'literais_minimizados': self.literais_minimizados,
+            'aprendidas_vivas': len(solver.aprendidas),
+            'variaveis_eliminadas': solver.num_eliminadas,
+            'propagacoes_por_segundo': self.propagacoes / decorrido,
+            'conflitos_por_segundo': solver.conflitos / decorrido,
+            'tempos': dict(self.tempos),
+            'histograma_vigilancias': {str(k): v for k, v in sorted(self.histograma_vigilancias.items())},
+            'amostras_vigilancias': self.amostras,
+        }
+
+    def salvar_json(self, solver, caminho):
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump(self.resumo(solver), f, indent=2, ensure_ascii=False)
+
+# ----------------- Fila de decisão (VSIDS) -----------------
+class HeapAtividade:
+    """Max-heap indexado de variáveis, ordenado por atividade.
+
+    `posicao[v]` guarda o índice de v no heap (-1 se ausente), o que permite
+    aumentar/diminuir a chave de uma variável em O(log n).
+    """
+
+    def __init__(self, atividade):
+        self.atividade = atividade
+        self.heap = []
+        self.posicao = [-1] * len(atividade)
+
+    def __len__(self):
+        return len(self.heap)
+
+    def contem(self, v):
+        return self.posicao[v] >= 0
+
+    def inserir(self, v):
+        if self.posicao[v] >= 0:
+            return
+        self.posicao[v] = len(self.heap)
+        self.heap.append(v)
+        self._subir(self.posicao[v])
+
+    def remover_maximo(self):
+        heap = self.heap
+        topo = heap[0]
+        ultimo = heap.pop()
+        self.posicao[topo] = -1
+        if heap:
+            heap[0] = ultimo
+            self.posicao[ultimo] = 0
+            self._descer(0)
+        return topo
+
+    def aumentou(self, v):
+        """Chave de v aumentou (increase-key)."""
+        if self.posicao[v] >= 0:
+            self._subir(self.posicao[v])
+
+    def diminuiu(self, v):
+        """Chave de v diminuiu (decrease-key)."""
+        if self.posicao[v] >= 0:
+            self._descer(self.posicao[v])
+
+    def _subir(self, i):
+        heap, posicao, atividade = self.heap, self.posicao, self.atividade
+        v = heap[i]
+        a = atividade[v]
+        while i > 0:
+            pai = (i - 1) >> 1
+            u = heap[pai]
+            if atividade[u] >= a:
+                break
+            heap[i] = u
+            posicao[u] = i
+            i = pai
+        heap[i] = v
+        posicao[v] = i
+
+    def _descer(self, i):
+        heap, posicao, atividade = self.heap, self.posicao, self.atividade
+        n = len(heap)
+        v = heap[i]
+        a = atividade[v]
+        while True:
+            filho = 2 * i + 1
+            if filho >= n:
+                break
+            if filho + 1 < n and atividade[heap[filho + 1]] > atividade[heap[filho]]:
+                filho += 1
+            u = heap[filho]
+            if atividade[u] <= a:
+                break
+            heap[i] = u
+            posicao[u] = i
+            i = filho
+        heap[i] = v
+        posicao[v] = i
+
+# ----------------- Pré-processamento (SatELite) -----------------
+_NAO_SUBSUME = -1   # resultado de subsume(): C não subsume D
+_SUBSUME = -2       # C subsume D (caso contrário: literal a remover de D)
+
+
+class SimplificadorSatElite:
+    """Subsunção, auto-subsunção e eliminação limitada de variáveis (SatELite).
+
+    Trabalha sobre listas de literais codificados (2*var + sinal), com listas
+    de ocorrência por variável e assinaturas de 64 bits para descartar
+    candidatos à subsunção sem montar conjuntos. As cláusulas removidas pela
+    eliminação ficam em `pilha` como (pivô, cláusula) para reconstruir o
+    modelo das variáveis eliminadas. Com `prova`, cada cláusula derivada ou
+    removida é registrada no EscritorDRAT.
+    """
+
+    def __init__(self, clausulas, numero_variaveis, congeladas=(),
+                 limite_ocorrencias=10, limite_resolvente=20, orcamento=2_000_000,
+                 prova=None):
+        # orcamento: verificações de subsunção e resoluções permitidas (cada uma)
+        self.n = numero_variaveis
+        self.prova = None                        # as cláusulas iniciais não entram na prova
+        self.clausulas = []                      # None = removida
+        self.assinaturas = []
+        self.ocorrencias = [set() for _ in range(self.n+1)]
+        self.congelada = bytearray(self.n+1)
+        for v in congeladas:
+            self.congelada[v] = 1
+        self.eliminada = bytearray(self.n+1)
+        self.valores = bytearray(2*(self.n+1))   # literal -> 1 se fixado verdadeiro
+        self.unidades = []
+        self.pilha = []
+        self.fila = []                           # ids a usar na subsunção
+        self.ok = True
+        self.limite_ocorrencias = limite_ocorrencias
+        self.limite_resolvente = limite_resolvente
+        self.orcamento_subsuncao = orcamento
+        self.orcamento_eliminacao = orcamento
+        self.subsumidas = self.fortalecidas = 0
+        for c in clausulas:
+            self.adicionar(list(c))
+        self.prova = prova
+
+    # ---------- base ----------
+    @staticmethod
+    def assinatura(c):
+        s = 0
+        for l in c:
+            s |= 1 << ((l >> 1) & 63)
+        return s
+
+    def adicionar(self, c):
+        if len(c) == 1:
+            self.fixar(c[0])
+            return
+        if not c:
+            self.ok = False
+            return
+        if self.prova is not None:
+            self.prova.adicionar(c)
+        id_c = len(self.clausulas)
+        self.clausulas.append(c)
+        self.assinaturas.append(self.assinatura(c))
+        for l in c:
+            self.ocorrencias[l >> 1].add(id_c)
+        self.fila.append(id_c)
+
+    def remover(self, id_c, registrar=True):
+        c = self.clausulas[id_c]
+        if registrar and self.prova is not None:
+            self.prova.remover(c)
+        for l in c:
+            self.ocorrencias[l >> 1].discard(id_c)
+        self.clausulas[id_c] = None
+
+    def encurtar(self, c, lit):
+        """Tira `lit` de c no lugar; na prova, a versão curta entra antes da antiga sair."""
+        if self.prova is not None:
+            antiga = list(c)
+            c.remove(lit)
+            if c:
+                self.prova.adicionar(c)
+            self.prova.remover(antiga)
+        else:
+            c.remove(lit)
+
+    def fortalecer(self, id_c, lit):
+        """Remove `lit` da cláusula id_c (auto-subsunção ou literal falso)."""
+        c = self.clausulas[id_c]
+        self.encurtar(c, lit)
+        self.ocorrencias[lit >> 1].discard(id_c)
+        self.fortalecidas += 1
+        if len(c) == 1:
+            self.remover(id_c, registrar=False)
+            self.fixar(c[0])
+        else:
+            self.assinaturas[id_c] = self.assinatura(c)
+            self.fila.append(id_c)
+
+    def fixar(self, lit):
+        """Unit: satisfaz/encurta as cláusulas da variável (propagação em fila)."""
+        pendentes = [lit]
+        while pendentes and self.ok:
+            lit = pendentes.pop()
+            if self.valores[lit]:
+                continue
+            if self.valores[lit ^ 1]:
+                self.ok = False
+                return
+            self.valores[lit] = 1
+            self.unidades.append(lit)
+            if self.prova is not None:
+                self.prova.adicionar((lit,))
+            for id_c in list(self.ocorrencias[lit >> 1]):
+                c = self.clausulas[id_c]
+                if lit in c:
+                    self.remover(id_c)
+                    continue
+                self.encurtar(c, lit ^ 1)
+                self.ocorrencias[lit >> 1].discard(id_c)
+                if not c:
+                    self.ok = False
+                    return
+                if len(c) == 1:
+                    self.remover(id_c, registrar=False)
+                    pendentes.append(c[0])
+                else:
+                    self.assinaturas[id_c] = self.assinatura(c)
+                    self.fila.append(id_c)
+
+    # ---------- subsunção ----------
+    @staticmethod
+    def subsume(c, d):
+        """C ⊆ D → _SUBSUME; C com um literal l trocado ⊆ D → l; senão _NAO_SUBSUME."""
+        trocado = _SUBSUME
+        for l in c:
+            if l in d:
+                continue
+            if trocado == _SUBSUME and (l ^ 1) in d:
+                trocado = l
+            else:
+                return _NAO_SUBSUME
+        return trocado
+
+    def subsuncao(self):
+        """Subsunção e auto-subsunção a partir das cláusulas na fila."""
+        clausulas, assinaturas, ocorrencias = self.clausulas, self.assinaturas, self.ocorrencias
+        while self.fila and self.ok and self.orcamento_subsuncao > 0:
+            id_c = self.fila.pop()
+            c = clausulas[id_c]
+            if c is None:
+                continue
+            # variável de C com menos ocorrências: toda D candidata a contém
+            melhor = min((l >> 1 for l in c), key=lambda v: len(ocorrencias[v]))
+            sig_c = assinaturas[id_c]
+            tamanho_c = len(c)
+            for id_d in list(ocorrencias[melhor]):
+                self.orcamento_subsuncao -= 1
+                d = clausulas[id_d]
+                if id_d == id_c or d is None or len(d) < len(c) or sig_c & ~assinaturas[id_d]:
+                    continue
+                r = self.subsume(c, set(d))
+                if r == _SUBSUME:
+                    self.remover(id_d)
+                    self.subsumidas += 1
+                elif r != _NAO_SUBSUME:
+                    self.fortalecer(id_d, r ^ 1)
+                    if not self.ok:
+                        return
+                if clausulas[id_c] is None or len(c) != tamanho_c:
+                    break  # C mudou (virou unit ou foi fortalecida): reprocessar depois
+
+    # ---------- eliminação de variáveis ----------
+    def eliminar(self, v):
+        """Substitui as cláusulas de v por seus resolventes, se isso não aumentar a fórmula."""
+        pos, neg = [], []
+        for id_c in self.ocorrencias[v]:
+            (pos if 2*v in self.clausulas[id_c] else neg).append(id_c)
+        if len(pos) > self.limite_ocorrencias and len(neg) > self.limite_ocorrencias:
+            return False
+        resolventes = []
+        for id_p in pos:
+            p = [l for l in self.clausulas[id_p] if l >> 1 != v]
+            conj_p = set(p)
+            for id_n in neg:
+                self.orcamento_eliminacao -= 1
+                r = list(p)
+                for l in self.clausulas[id_n]:
+                    if l >> 1 == v or l in conj_p:
+                        continue
+                    if (l ^ 1) in conj_p:
+                        break  # tautologia
+                    r.append(l)
+                else:
+                    if len(r) > self.limite_resolvente:
+                        return False
+                    resolventes.append(r)
+                    if len(resolventes) > len(pos) + len(neg):
+                        return False
+
+        for pivo, ids in ((2*v, pos), (2*v + 1, neg)):
+            for id_c in ids:
+                self.pilha.append((pivo, list(self.clausulas[id_c])))
+        self.eliminada[v] = 1
+        # resolventes entram antes da remoção das antecedentes (ordem exigida pelo DRAT)
+        for r in resolventes:
+            self.adicionar(r)
+            if not self.ok:
+                return True
+        for id_c in pos + neg:
+            if self.clausulas[id_c] is not None:
+                self.remover(id_c)
+        return True
+
+    def executar(self, rodadas=3):
+        """Subsunção + eliminação até estabilizar (ou esgotar o orçamento). Retorna ok."""
+        self.subsuncao()
+        for _ in range(rodadas):
+            if not self.ok or self.orcamento_eliminacao <= 0:
+                break
+            candidatas = [v for v in range(1, self.n+1)
+                          if self.ocorrencias[v] and not self.congelada[v] and not self.eliminada[v]]
+            candidatas.sort(key=lambda v: len(self.ocorrencias[v]))
+            eliminou = False
+            for v in candidatas:
+                if self.orcamento_eliminacao <= 0 or not self.ok:
+                    break
+                if self.ocorrencias[v] and self.eliminar(v):
+                    eliminou = True
+                    self.subsuncao()
+            if not eliminou:
+                break
+        return self.ok
+
+    def resultado(self):
+        return [c for c in self.clausulas if c is not None]
+
+    @staticmethod
+    def reconstruir(verdade, pilha):
+        """Completa o modelo (verdade[lit] = 1 se lit verdadeiro) para as eliminadas."""
+        for pivo, c in reversed(pilha):
+            if not any(verdade[l] for l in c):
+                verdade[pivo] = 1
+                verdade[pivo ^ 1] = 0
+
+# ----------------- Solver -----------------
+class CDCL:
+    def __init__(self, numero_variaveis, clausulas_iniciais, semente=7,
+                 decaimento=0.95, reinicio='luby', fase_inicial=0, ruido_inicial=0.0,
+                 incremental=False, simplificar=True, prova=None, estatisticas=None):
+        """
+        reinicio: 'luby' (sequência de Luby) ou 'ema' (médias móveis de LBD).
+        fase_inicial: 0 (positiva), 1 (negativa) ou 'aleatoria'.
+        ruido_inicial: amplitude de atividades iniciais aleatórias (diversificação).
+        incremental: desliga simplificações que só preservam satisfatibilidade
+            (literais puros e eliminação de variáveis), para permitir novas
+            cláusulas e assumpções depois.
+        simplificar: roda o SatELite antes da busca (ignorado se incremental).
+        prova: EscritorDRAT que recebe aprendidas, remoções e a cláusula vazia.
+        estatisticas: EstatisticasCDCL (uma padrão, silenciosa, se omitido).
+        """
+        self.n = numero_variaveis
+        self.incremental = incremental
+        self.simplificar = simplificar
+        self.eliminada = bytearray(self.n+1)     # variáveis eliminadas pelo SatELite
+        self.num_eliminadas = 0
+        self.pilha_eliminacao = []               # (pivô, cláusula) para reconstruir o modelo
+        self.ok = True                           # False: fórmula UNSAT no nível 0 (permanente)
+        self.nucleo = []                         # assumpções responsáveis pelo último UNSAT
+        self.ultimo_modelo = None
+        if isinstance(clausulas_iniciais, ClausulasDimacs):
+            self.clausulas_originais = clausulas_iniciais
+        else:
+            self.clausulas_originais = [list(c) for c in clausulas_iniciais]
+
+        # Arena: todos os literais (codificados) de todas as cláusulas, contíguos.
+        # A cláusula i ocupa arena[inicio[i] : inicio[i] + tamanho[i]];
+        # as posições 0 e 1 de cada cláusula são os literais vigiados.
+        self.arena = array('i')
+        self.inicio = array('i')                 # cabeçalho: deslocamento na arena
+        self.tamanho = array('i')                # cabeçalho: número de literais
+        self.lbd = array('i')                    # cabeçalho: LBD (0 = cláusula original)
+        self.atividade_clausula = array('d')     # cabeçalho: atividade da cláusula
+        # vigilancias[x] = [id0, bloqueador0, id1, bloqueador1, ...] das cláusulas
+        # que vigiam o literal x (pares achatados, sem tuplas)
+        self.vigilancias = [[] for _ in range(2*(self.n+1))]
+        self.valores = array('b', [0]) * (2*(self.n+1))  # por literal: 1 verdadeiro, -1 falso, 0 indefinido
+        self.nivel = [0]*(self.n+1)              # nível de decisão de cada variável
+        self.razao = [-1]*(self.n+1)             # id da cláusula que implicou a variável (-1: nenhuma)
+        self.trilha = []                         # pilha de literais (codificados) atribuídos
+        self.marcos_trilha = []                  # índices separando níveis na trilha
+        self.cabeca = 0                          # próximo literal da trilha a propagar
+        self.visto = bytearray(self.n+1)         # marcas da análise de conflito
+
+        self.atividade = [0.0]*(self.n+1)        # VSIDS: atividade por variável
+        self.incremento_variavel = 1.0
+        self.decaimento_variavel = decaimento
+        self.aleatorio = random.Random(semente)
+        if ruido_inicial:
+            for v in range(1, self.n+1):
+                self.atividade[v] = self.aleatorio.random() * ruido_inicial
+        self.ordem = HeapAtividade(self.atividade)     # variáveis candidatas à decisão
+        for v in range(1, self.n+1):
+            self.ordem.inserir(v)
+        # fase salva (sinal do último valor; 0 = positivo)
+        if fase_inicial == 'aleatoria':
+            self.fase = bytearray(self.aleatorio.getrandbits(1) for _ in range(self.n+1))
+        else:
+            self.fase = bytearray([fase_inicial]) * (self.n+1)
+        self.fase_inicial = fase_inicial
+
+        # reinícios
+        if reinicio not in ('luby', 'ema'):
+            raise ValueError(f"Política de reinício desconhecida: {reinicio}")
+        self.politica_reinicio = reinicio
+        self.base_orcamento = 100                # Luby: conflitos por unidade da sequência
+        self.indice_luby = 1
+        self.proximo_reinicio = self.base_orcamento * self.luby(self.indice_luby)
+        self.ema_rapida = self.ema_lenta = 0.0   # EMA: médias móveis do LBD
+        self.conflitos_no_reinicio = 0
+        self.reinicios = 0
+        self.conflitos = 0
+        self.prova = prova                       # None: sem registro (custo zero)
+        self.estatisticas = estatisticas if estatisticas is not None else EstatisticasCDCL()
+
+        # base de cláusulas aprendidas
+        self.aprendidas = []                     # ids das aprendidas vivas
+        self.incremento_clausula = 1.0
+        self.decaimento_clausula = 0.999
+        self.lbd_cola = 2                        # LBD <= lbd_cola: "glue", nunca removida
+        self.intervalo_reducao = 2000.0          # conflitos até a próxima redução
+        self.fator_reducao = 1.1                 # crescimento geométrico do intervalo
+        self.proxima_reducao = self.intervalo_reducao
+        self.reducoes = 0
+
+        # troca de cláusulas (portfólio): exportar(lits) recebe aprendidas curtas,
+        # importar() devolve cláusulas DIMACS de outros solvers (nos reinícios)
+        self.exportar = None
+        self.importar = None
+        self.lbd_exportacao = 2
+
+        # carregar cláusulas iniciais
+        if isinstance(clausulas_iniciais, ClausulasDimacs):
+            if not self.carregar_buffer(clausulas_iniciais):
+                self.marcar_unsat()
+                raise RuntimeError("UNSAT imediato ao adicionar cláusulas iniciais")
+        else:
+            for c in self.clausulas_originais:
+                if not self.adicionar_clausula(c):
+                    self.marcar_unsat()
+                    raise RuntimeError("UNSAT imediato ao adicionar cláusulas iniciais")
+
+        # pré-processamento
+        self.preprocessar()
+
+    # ---------- Arena / watched literals ----------
+    def adicionar_clausula(self, clausula):
+        """Adiciona uma cláusula (literais DIMACS) no nível 0. Retorna False se gerar conflito.
+
+        Pode ser chamada entre resoluções: o solver volta ao nível 0 e
+        variáveis novas são criadas sob demanda.
+        """
+        if not self.ok:
+            return False
+        self.cancelar_ate(0)
+        clausula = list(dict.fromkeys(clausula))  # deduplicar preservando ordem
+        # antes da tautologia: suas variáveis também entram no modelo
+        self.garantir_variaveis(max(map(abs, clausula), default=0))
+        if any((-l) in clausula for l in clausula):
+            return True  # tautologia
+        if self.num_eliminadas and any(self.eliminada[abs(l)] for l in clausula):
+            raise ValueError("Cláusula usa variável eliminada no pré-processamento "
+                             "(use incremental=True)")
+
+        # remover literais já satisfeitos e falsos
+        if any(self.valor(l) is True for l in clausula):
+            return True
+        clausula = [codificar(l) for l in clausula if self.valor(l) is not False]
+        if not clausula:
+            return self.marcar_unsat()  # cláusula vazia: conflito imediato
+
+        if len(clausula) == 1:
+            # unit: força imediatamente (não precisa de vigilância)
+            return self.enfileirar(clausula[0], -1) or self.marcar_unsat()
+
+        self.anexar_clausula(clausula)
+        return True
+
+    def garantir_variaveis(self, n):
+        """Estende as estruturas por variável até n (variáveis novas ficam livres)."""
+        if n <= self.n:
+            return
+        extra = n - self.n
+        self.vigilancias.extend([] for _ in range(2*extra))
+        self.valores.extend(array('b', [0]) * (2*extra))
+        self.nivel.extend([0]*extra)
+        self.razao.extend([-1]*extra)
+        self.visto.extend(bytes(extra))
+        self.eliminada.extend(bytes(extra))
+        self.atividade.extend([0.0]*extra)      # mesma lista usada pelo heap
+        self.ordem.posicao.extend([-1]*extra)
+        fase = self.fase_inicial
+        for v in range(self.n+1, n+1):
+            self.fase.append(self.aleatorio.getrandbits(1) if fase == 'aleatoria' else fase)
+            self.ordem.inserir(v)
+        self.n = n
+
+    def anexar_clausula(self, lits, aprendida=False, lbd=0):
+        """Grava literais codificados na arena e registra as duas vigilâncias."""
+        ini = len(self.arena)
+        self.arena.extend(lits)
+        id_clausula = self.registrar_clausula(ini, len(lits), lbd)
+        if aprendida:
+            self.aprendidas.append(id_clausula)
+            if self.prova is not None:
+                self.prova.adicionar(lits)
+        return id_clausula
+
+    def marcar_unsat(self):
+        """UNSAT no nível 0 (permanente): fecha a prova com a cláusula vazia."""
+        if self.ok and self.prova is not None:
+            self.prova.adicionar(())
+            self.prova.descarregar()
+        self.ok = False
+        return False
+
+    def registrar_clausula(self, ini, tamanho, lbd=0):
+        """Cria o cabeçalho de uma cláusula já gravada na arena e vigia as posições 0 e 1."""
+        id_clausula = len(self.inicio)
+        self.inicio.append(ini)
+        self.tamanho.append(tamanho)
+        self.lbd.append(lbd)
+        self.atividade_clausula.append(0.0)
+        a, b = self.arena[ini], self.arena[ini+1]
+        self.vigilancias[a] += (id_clausula, b)
+        self.vigilancias[b] += (id_clausula, a)
+        return id_clausula
+
+    def carregar_buffer(self, clausulas):
+        """Carrega um ClausulasDimacs: o buffer codificado vira a própria arena.
+
+        Cada cláusula fica no lugar em que foi lida (os zeros separadores
+        apenas sobram na arena até a primeira compactação). Só cláusulas com
+        literais repetidos são regravadas; tautologias ficam sem cabeçalho.
+        Retorna False se houver cláusula vazia ou units contraditórias.
+        """
+        literais = clausulas.literais
+        self.arena = arena = codificar_buffer(literais)
+        negar = operator.neg
+        vigilancias = self.vigilancias
+        novo_inicio = self.inicio.append
+        novo_tamanho = self.tamanho.append
+        a = 0
+        for b in clausulas.fins:
+            t = b - a
+            if t >= 2:
+                c = literais[a:b]
+                distintos = set(c)
+                if distintos.isdisjoint(map(negar, c)):
+                    if len(distintos) < t:
+                        # repetidos: regrava deduplicada no mesmo espaço
+                        dedup = array('i', map(codificar, dict.fromkeys(c)))
+                        arena[a:a + len(dedup)] = dedup
+                        t = len(dedup)
+                    if t == 1:
+                        if not self.enfileirar(arena[a], -1):
+                            return False
+                    else:
+                        # mesmo que registrar_clausula, sem a chamada por cláusula
+                        id_clausula = len(self.inicio)
+                        novo_inicio(a)
+                        novo_tamanho(t)
+                        x, y = arena[a], arena[a+1]
+                        vigilancias[x] += (id_clausula, y)
+                        vigilancias[y] += (id_clausula, x)
+            elif t == 1:
+                if not self.enfileirar(arena[a], -1):
+                    return False
+            else:
+                return False  # cláusula vazia
+            a = b + 1
+        # cláusulas originais: LBD 0 e atividade 0
+        self.lbd = array('i', [0]) * len(self.inicio)
+        self.atividade_clausula = array('d', [0.0]) * len(self.inicio)
+        return True
+
+    def literais(self, id_clausula):
+        ini = self.inicio[id_clausula]
+        return self.arena[ini:ini + self.tamanho[id_clausula]]
+
+    def valor(self, lit):
+        val = self.valores[codificar(lit)]
+        if val == 0:
+            return None
+        return val == 1
+
+    # ---------- Atribuição / propagação ----------
+    def novo_nivel_decisao(self):
+        self.marcos_trilha.append(len(self.trilha))
+
+    def enfileirar(self, lit, razao):
+        val = self.valores[lit]
+        if val != 0:
+            return val == 1
+        self.valores[lit] = 1
+        self.valores[lit ^ 1] = -1
+        v = lit >> 1
+        self.nivel[v] = len(self.marcos_trilha)
+        self.razao[v] = razao
+        self.trilha.append(lit)
+        return True
+
+    def propagar(self):
+        """Retorna id da cláusula em conflito, ou None se ok."""
+        valores = self.valores
+        arena = self.arena
+        inicio = self.inicio
+        tamanho = self.tamanho
+        vigilancias = self.vigilancias
+        trilha = self.trilha
+        nivel = self.nivel
+        razao = self.razao
+        nivel_atual = len(self.marcos_trilha)
+        cabeca_inicial = self.cabeca
+
+        while self.cabeca < len(trilha):
+            falso = trilha[self.cabeca] ^ 1
+            self.cabeca += 1
+            lista = vigilancias[falso]
+            i = j = 0
+            fim_lista = len(lista)
+            while i < fim_lista:
+                id_clausula = lista[i]
+                bloqueador = lista[i+1]
+                i += 2
+                # bloqueador verdadeiro: cláusula satisfeita sem tocar na arena
+                if valores[bloqueador] == 1:
+                    lista[j] = id_clausula; lista[j+1] = bloqueador; j += 2
+                    continue
+
+                # garantir que o literal falso fique na posição 1
+                ini = inicio[id_clausula]
+                primeiro = arena[ini]
+                if primeiro == falso:
+                    primeiro = arena[ini+1]
+                    arena[ini] = primeiro
+                    arena[ini+1] = falso
+                if primeiro != bloqueador and valores[primeiro] == 1:
+                    lista[j] = id_clausula; lista[j+1] = primeiro; j += 2
+                    continue
+
+                # tentar mover a vigilância para outro literal não-falso
+                k = ini + 2
+                fim = ini + tamanho[id_clausula]
+                while k < fim:
+                    l = arena[k]
+                    if valores[l] != -1:
+                        arena[ini+1] = l
+                        arena[k] = falso
+                        vigilancias[l] += (id_clausula, primeiro)
+                        break
+                    k += 1
+                else:
+                    # sem substituto: vira unit ou conflito
+                    lista[j] = id_clausula; lista[j+1] = primeiro; j += 2
+                    if valores[primeiro] == -1:
+                        lista[j:j + fim_lista - i] = lista[i:fim_lista]
+                        j += fim_lista - i
+                        del lista[j:]
+                        self.estatisticas.propagacoes += self.cabeca - cabeca_inicial
+                        self.cabeca = len(trilha)
+                        return id_clausula  # conflito
+                    # unit: força 'primeiro'
+                    valores[primeiro] = 1
+                    valores[primeiro ^ 1] = -1
+                    v = primeiro >> 1
+                    nivel[v] = nivel_atual
+                    razao[v] = id_clausula
+                    trilha.append(primeiro)
+            del lista[j:]
+        self.estatisticas.propagacoes += self.cabeca - cabeca_inicial
+        return None
+
+    # ---------- Análise de conflito (1-UIP) ----------
+    def analisar(self, id_conflito):
+        """Retorna (cláusula aprendida minimizada, nível de salto).
+
+        A trilha é percorrida por índice (sem desempilhar) e as variáveis
+        marcadas ficam em `self.visto`, um bytearray persistente que é limpo
+        ao final: a análise é linear no tamanho da trilha.
+        """
+        self.conflitos += 1
+        arena = self.arena
+        inicio = self.inicio
+        tamanho = self.tamanho
+        nivel = self.nivel
+        razao = self.razao
+        trilha = self.trilha
+        visto = self.visto
+        nivel_atual = len(self.marcos_trilha)
+
+        aprendida = [0]          # posição 0 reservada para o literal UIP
+        caminho = 0
+        p = -1
+        indice = len(trilha) - 1
+        id_clausula = id_conflito
+
+        while True:
+            if self.lbd[id_clausula]:
+                self.impulsionar_atividade_clausula(id_clausula)
+            ini = inicio[id_clausula]
+            # numa razão, a posição 0 é o próprio literal implicado (p)
+            for k in range(ini if p == -1 else ini + 1, ini + tamanho[id_clausula]):
+                q = arena[k]
+                v = q >> 1
+                if not visto[v] and nivel[v] > 0:
+                    visto[v] = 1
+                    self.impulsionar_atividade_variavel(v)
+                    if nivel[v] >= nivel_atual:
+                        caminho += 1
+                    else:
+                        aprendida.append(q)
+
+            # voltar na trilha (sem desempilhar) até o próximo literal marcado
+            while not visto[trilha[indice] >> 1]:
+                indice -= 1
+            p = trilha[indice]
+            indice -= 1
+            visto[p >> 1] = 0
+            caminho -= 1
+            if caminho == 0:
+                break
+            id_clausula = razao[p >> 1]
+
+        aprendida[0] = p ^ 1
+
+        # minimização recursiva: remove literais implicados pelos demais
+        # (auto-subsunção contra as cláusulas razão); no mesmo passo acha o
+        # literal de maior nível, que define o salto e vai para a posição 1
+        abstrato = 0
+        for i in range(1, len(aprendida)):
+            abstrato |= 1 << (nivel[aprendida[i] >> 1] & 31)
+        limpar = list(aprendida)
+        j = 1
+        idx_maior = 1
+        nivel_salto = 0
+        for i in range(1, len(aprendida)):
+            l = aprendida[i]
+            if razao[l >> 1] == -1 or not self.literal_redundante(l, abstrato, limpar):
+                aprendida[j] = l
+                if nivel[l >> 1] > nivel_salto:
+                    nivel_salto = nivel[l >> 1]
+                    idx_maior = j
+                j += 1
+        self.estatisticas.literais_aprendidos += len(aprendida)
+        self.estatisticas.literais_minimizados += j
+        del aprendida[j:]
+        if j > 1:
+            aprendida[1], aprendida[idx_maior] = aprendida[idx_maior], aprendida[1]
+
+        for l in limpar:
+            visto[l >> 1] = 0
+        return aprendida, nivel_salto
+
+    def literal_redundante(self, lit, abstrato, limpar):
+        """Verifica se ~lit é implicado pelos literais marcados da aprendida.
+
+        `abstrato` é o conjunto (em bits) dos níveis presentes na cláusula:
+        uma razão com variável de outro nível não pode ser absorvida.
+        """
+        arena = self.arena
+        inicio = self.inicio
+        tamanho = self.tamanho
+        nivel = self.nivel
+        razao = self.razao
+        visto = self.visto
+        pilha = [lit]
+        topo = len(limpar)
+        while pilha:
+            c = razao[pilha.pop() >> 1]
+            ini = inicio[c]
+            for k in range(ini + 1, ini + tamanho[c]):
+                q = arena[k]
+                v = q >> 1
+                if visto[v] or nivel[v] == 0:
+                    continue
+                if razao[v] != -1 and (1 << (nivel[v] & 31)) & abstrato:
+                    visto[v] = 1
+                    pilha.append(q)
+                    limpar.append(q)
+                else:
+                    for q in limpar[topo:]:
+                        visto[q >> 1] = 0
+                    del limpar[topo:]
+                    return False
+        return True
+
+    def cancelar_ate(self, nivel_objetivo):
+        if len(self.marcos_trilha) <= nivel_objetivo:
+            return
+        inicio = self.marcos_trilha[nivel_objetivo]
+        valores = self.valores
+        razao = self.razao
+        fase = self.fase
+        ordem = self.ordem
+        for lit in self.trilha[inicio:]:
+            valores[lit] = 0
+            valores[lit ^ 1] = 0
+            v = lit >> 1
+            razao[v] = -1
+            fase[v] = lit & 1            # phase saving
+            if ordem.posicao[v] < 0:     # reinserção preguiçosa no heap
+                ordem.inserir(v)
+        del self.trilha[inicio:]
+        del self.marcos_trilha[nivel_objetivo:]
+        self.cabeca = inicio
+
+    # ---------- VSIDS ----------
+    def impulsionar_atividade_variavel(self, v):
+        self.atividade[v] += self.incremento_variavel
+        if self.atividade[v] > 1e100:
+            # reescala uniforme: a ordem relativa (e o heap) não muda
+            for i in range(1, self.n+1):
+                self.atividade[i] *= 1e-100
+            self.incremento_variavel *= 1e-100
+        self.ordem.aumentou(v)
+
+    def decair_atividade(self):
+        self.incremento_variavel /= self.decaimento_variavel
+        self.incremento_clausula /= self.decaimento_clausula
+
+    # ---------- Base de cláusulas aprendidas ----------
+    def impulsionar_atividade_clausula(self, id_clausula):
+        atividade = self.atividade_clausula
+        atividade[id_clausula] += self.incremento_clausula
+        if atividade[id_clausula] > 1e20:
+            for c in self.aprendidas:
+                atividade[c] *= 1e-20
+            self.incremento_clausula *= 1e-20
+
+    def calcular_lbd(self, lits):
+        """Literal block distance: número de níveis de decisão distintos."""
+        nivel = self.nivel
+        return len({nivel[l >> 1] for l in lits})
+
+    def travada(self, id_clausula):
+        """A cláusula é a razão de uma atribuição atual (não pode ser removida).
+
+        Razões do nível 0 não contam: a análise nunca as consulta.
+        """
+        l = self.arena[self.inicio[id_clausula]]
+        v = l >> 1
+        return self.valores[l] == 1 and self.razao[v] == id_clausula and self.nivel[v] > 0
+
+    def reduzir_base(self):
+        """Remove metade das aprendidas não-glue (as menos ativas) e compacta a arena."""
+        self.reducoes += 1
+        self.intervalo_reducao *= self.fator_reducao
+        self.proxima_reducao = self.conflitos + self.intervalo_reducao
+
+        lbd, tamanho = self.lbd, self.tamanho
+        candidatas = [c for c in self.aprendidas
+                      if lbd[c] > self.lbd_cola and tamanho[c] > 2 and not self.travada(c)]
+        candidatas.sort(key=self.atividade_clausula.__getitem__)
+        removidas = set(candidatas[:len(candidatas) // 2])
+        if self.prova is not None:
+            for c in removidas:
+                self.prova.remover(self.literais(c))
+        if removidas:
+            self.compactar(removidas)
+
+    def compactar(self, removidas):
+        """Reconstrói arena, cabeçalhos, razões e vigilâncias sem os ids removidos.
+
+        Só pode ser chamada com a propagação em ponto fixo (sem conflito
+        pendente): os literais vigiados são sempre as posições 0 e 1.
+        """
+        arena, inicio, tamanho = self.arena, self.inicio, self.tamanho
+        novo_id = array('i', [-1]) * len(inicio)
+        nova_arena = array('i')
+        novo_inicio = array('i')
+        novo_tamanho = array('i')
+        novo_lbd = array('i')
+        nova_atividade = array('d')
+        for c in range(len(inicio)):
+            if c in removidas:
+                continue
+            novo_id[c] = len(novo_inicio)
+            ini = inicio[c]
+            novo_inicio.append(len(nova_arena))
+            novo_tamanho.append(tamanho[c])
+            novo_lbd.append(self.lbd[c])
+            nova_atividade.append(self.atividade_clausula[c])
+            nova_arena.extend(arena[ini:ini + tamanho[c]])
+
+        self.arena, self.inicio, self.tamanho = nova_arena, novo_inicio, novo_tamanho
+        self.lbd, self.atividade_clausula = novo_lbd, nova_atividade
+        self.aprendidas = [novo_id[c] for c in self.aprendidas if c not in removidas]
+
+        razao, nivel = self.razao, self.nivel
+        for lit in self.trilha:
+            v = lit >> 1
+            if nivel[v] == 0:
+                razao[v] = -1   # fato permanente: a razão pode ter sido removida
+            elif razao[v] >= 0:
+                razao[v] = novo_id[razao[v]]
+
+        vigilancias = self.vigilancias
+        for lista in vigilancias:
+            lista.clear()
+        for c in range(len(novo_inicio)):
+            ini = novo_inicio[c]
+            a, b = nova_arena[ini], nova_arena[ini+1]
+            vigilancias[a] += (c, b)
+            vigilancias[b] += (c, a)
+
+    def escolher_literal_decisao(self):
+        # variáveis atribuídas continuam no heap até serem retiradas aqui
+        ordem = self.ordem
+        valores = self.valores
+        while len(ordem):
+            v = ordem.remover_maximo()
+            if valores[2 * v] == 0 and not self.eliminada[v]:
+                # polaridade: fase salva (inicialmente positiva)
+                return 2 * v | self.fase[v]
+        return None
+
+    # ---------- Reinícios (Luby / EMA) ----------
+    def luby(self, i):
+        k = 1
+        while (1 << k) - 1 < i:
+            k += 1
+        if i == (1 << k) - 1:
+            return 1 << (k - 1)
+        return self.luby(i - (1 << (k - 1)) + 1)
+
+    def registrar_lbd(self, lbd):
+        """Atualiza as médias móveis (rápida: 1/32, lenta: 1/4096) do LBD."""
+        if self.conflitos == 1:
+            self.ema_rapida = self.ema_lenta = float(lbd)
+        self.ema_rapida += (lbd - self.ema_rapida) / 32.0
+        self.ema_lenta += (lbd - self.ema_lenta) / 4096.0
+
+    def deve_reiniciar(self):
+        if self.politica_reinicio == 'luby':
+            return self.conflitos >= self.proximo_reinicio
+        # glucose: aprendidas recentes piores que a média de longo prazo
+        return (self.conflitos - self.conflitos_no_reinicio >= 50
+                and 0.8 * self.ema_rapida > self.ema_lenta)
+
+    def reiniciar(self):
+        """Volta ao nível 0 e importa cláusulas compartilhadas. Retorna False se UNSAT."""
+        self.reinicios += 1
+        self.conflitos_no_reinicio = self.conflitos
+        self.cancelar_ate(0)
+        if self.politica_reinicio == 'luby':
+            self.indice_luby += 1
+            self.proximo_reinicio += self.base_orcamento * self.luby(self.indice_luby)
+        if self.importar is not None:
+            for c in self.importar():
+                if self.num_eliminadas and any(self.eliminada[abs(l)] for l in c):
+                    continue
+                if not self.adicionar_clausula(c):
+                    return False
+            if self.propagar() is not None:
+                return False
+        return True
+
+    # ---------- Pré-processamento ----------
+    def preprocessar(self):
+        valores = self.valores
+        alterou = True
+        while alterou:
+            alterou = False
+            # unidades
+            if self.propagar() is not None:
+                self.marcar_unsat()
+                raise RuntimeError("UNSAT durante pré-processamento")
+
+            if self.incremental:
+                break  # literais puros não sobrevivem a cláusulas futuras
+            if self.simplificar:
+                # a eliminação de variáveis já cobre os literais puros
+                self.simplificar_satelite()
+                break
+
+            # literais puros (contados apenas nas cláusulas ainda não satisfeitas)
+            contagem = defaultdict(int)
+            for id_clausula in range(len(self.inicio)):
+                lits = self.literais(id_clausula)
+                if any(valores[l] == 1 for l in lits):
+                    continue
+                for l in lits:
+                    if valores[l] == 0:
+                        contagem[l] += 1
+            for l in list(contagem.keys()):
+                if valores[l] == 0 and contagem.get(l ^ 1, 0) == 0:
+                    self.enfileirar(l, -1)
+                    alterou = True
+
+    def simplificar_satelite(self):
+        """Roda o SatELite sobre as cláusulas originais e reconstrói a arena."""
+        valores = self.valores
+        arena, inicio, tamanho = self.arena, self.inicio, self.tamanho
+        prova = self.prova
+        clausulas = []
+        for id_clausula in range(len(inicio)):
+            ini = inicio[id_clausula]
+            lits = arena[ini:ini + tamanho[id_clausula]]
+            if self.trilha and any(valores[l] == 1 for l in lits):
+                continue
+            if not self.trilha:
+                clausulas.append(lits.tolist())
+                continue
+            curta = [l for l in lits if valores[l] == 0]
+            if prova is not None and len(curta) < len(lits):
+                prova.adicionar(curta)
+                prova.remover(lits)
+            clausulas.append(curta)
+
+        simp = SimplificadorSatElite(clausulas, self.n, prova=prova)
+        if not simp.executar():
+            self.marcar_unsat()
+            raise RuntimeError("UNSAT durante pré-processamento")
+
+        self.arena = array('i')
+        self.inicio = array('i')
+        self.tamanho = array('i')
+        self.lbd = array('i')
+        self.atividade_clausula = array('d')
+        self.aprendidas = []
+        for lista in self.vigilancias:
+            lista.clear()
+        razao = self.razao
+        for lit in self.trilha:
+            razao[lit >> 1] = -1   # os ids antigos apontam para a arena descartada
+        for c in simp.resultado():
+            self.anexar_clausula(c)
+        for lit in simp.unidades:
+            if not simp.eliminada[lit >> 1]:  # a reconstrução do modelo cuida das eliminadas
+                self.enfileirar(lit, -1)
+        if self.propagar() is not None:
+            self.marcar_unsat()
+            raise RuntimeError("UNSAT durante pré-processamento")
+
+        self.eliminada = simp.eliminada
+        self.num_eliminadas = sum(simp.eliminada)
+        self.pilha_eliminacao = simp.pilha
+
+    # ---------- Modelo / núcleo ----------
+    def salvar_modelo(self):
+        """Guarda a atribuição atual como modelo (variáveis livres recebem valor verdadeiro)."""
+        valores = self.valores
+        if self.pilha_eliminacao:
+            verdade = bytearray(2*(self.n+1))
+            for v in range(1, self.n+1):
+                verdade[2*v + (valores[2*v + 1] == 1)] = 1
+            SimplificadorSatElite.reconstruir(verdade, self.pilha_eliminacao)
+            self.ultimo_modelo = [v if verdade[2*v] else -v for v in range(1, self.n+1)]
+        else:
+            self.ultimo_modelo = [v if valores[2*v + 1] != 1 else -v for v in range(1, self.n+1)]
+        return True
+
+    def modelo(self):
+        """Literais DIMACS 1..n do último resultado SAT."""
+        return self.ultimo_modelo
+
+    def analisar_final(self, p):
+        """Assumpções (DIMACS) que, juntas, implicam ~p, sendo p a assumpção falsa."""
+        nucleo = [decodificar(p)]
+        if not self.marcos_trilha:
+            return nucleo
+        arena, inicio, tamanho = self.arena, self.inicio, self.tamanho
+        nivel, razao, visto, trilha = self.nivel, self.razao, self.visto, self.trilha
+        visto[p >> 1] = 1
+        for i in range(len(trilha) - 1, self.marcos_trilha[0] - 1, -1):
+            x = trilha[i]
+            v = x >> 1
+            if not visto[v]:
+                continue
+            c = razao[v]
+            if c == -1:
+                nucleo.append(decodificar(x))  # decisão acima do nível 0: uma assumpção
+            else:
+                ini = inicio[c]
+                for k in range(ini + 1, ini + tamanho[c]):
+                    if nivel[arena[k] >> 1] > 0:
+                        visto[arena[k] >> 1] = 1
+            visto[v] = 0
+        visto[p >> 1] = 0
+        return nucleo
+
+    # ---------- Loop principal ----------
+    def resolver(self, tempo_max=None, assumpcoes=()):
+        """True (SAT), False (UNSAT) ou None (timeout).
+
+        Pode ser chamado várias vezes: aprendidas, atividades e fases são
+        mantidas. `assumpcoes` (literais DIMACS) valem só para esta chamada;
+        num UNSAT sob assumpções, `self.nucleo` recebe as que o causaram.
+        """
+        inicio = time.time()
+        estatisticas = self.estatisticas
+        tempos = estatisticas.tempos
+        relogio = time.perf_counter
+        self.nucleo = []
+        if not self.ok:
+            return False
+        self.cancelar_ate(0)
+        assumpcoes = [codificar(l) for l in assumpcoes]
+        if assumpcoes:
+            self.garantir_variaveis(max(x >> 1 for x in assumpcoes))
+
+        # propagar após pré-processamento / novas cláusulas
+        conflito = self.propagar()
+        if conflito is not None:
+            return self.marcar_unsat()
+
+        while True:
+            if tempo_max and time.time() - inicio > tempo_max:
+                print("INDETERMINADO: timeout", file=sys.stderr)
+                return None
+
+            # redução da base de aprendidas (propagação em ponto fixo aqui)
+            if self.conflitos >= self.proxima_reducao:
+                t0 = relogio()
+                self.reduzir_base()
+                tempos['reduzir'] += relogio() - t0
+
+            # assumpções são as primeiras decisões, uma por nível
+            decisao = None
+            while len(self.marcos_trilha) < len(assumpcoes):
+                p = assumpcoes[len(self.marcos_trilha)]
+                if self.valores[p] == 1:
+                    self.novo_nivel_decisao()  # já vale: nível vazio
+                elif self.valores[p] == -1:
+                    self.nucleo = self.analisar_final(p)
+                    return False
+                else:
+                    decisao = p
+                    break
+
+            if decisao is None:
+                # todas as variáveis atribuídas?
+                if len(self.trilha) + self.num_eliminadas == self.n:
+                    return self.salvar_modelo()
+                t0 = relogio()
+                decisao = self.escolher_literal_decisao()
+                tempos['decidir'] += relogio() - t0
+                if decisao is None:
+                    return self.salvar_modelo()
+            estatisticas.decisoes += 1
+            self.novo_nivel_decisao()
+            self.enfileirar(decisao, -1)
+
+            while True:
+                t0 = relogio()
+                conflito = self.propagar()
+                tempos['propagar'] += relogio() - t0
+                if conflito is None:
+                    break
+                if not self.marcos_trilha:
+                    return self.marcar_unsat()  # conflito no nível 0 -> UNSAT
+
+                t0 = relogio()
+                aprendida, nivel_salto = self.analisar(conflito)
+                tempos['analisar'] += relogio() - t0
+                self.decair_atividade()
+                estatisticas.apos_conflito(self)
+
+                lbd = self.calcular_lbd(aprendida)
+                self.registrar_lbd(lbd)
+                if self.exportar is not None and lbd <= self.lbd_exportacao:
+                    self.exportar([decodificar(x) for x in aprendida])
+                self.cancelar_ate(nivel_salto)
+                if len(aprendida) == 1:
+                    if self.prova is not None:
+                        self.prova.adicionar(aprendida)
+                    self.enfileirar(aprendida[0], -1)
+                else:
+                    id_clausula = self.anexar_clausula(aprendida, aprendida=True, lbd=lbd)
+                    self.enfileirar(aprendida[0], id_clausula)
+
+                # reinício?
+                if self.deve_reiniciar():
+                    if not self.reiniciar():
+                        return self.marcar_unsat()
+                    break
+
+# ----------------- Portfólio paralelo -----------------
+class AnelClausulas:
+    """Buffer circular de cláusulas em memória compartilhada (multiprocessing.Array).
+
+    dados[0] é o cursor de escrita (total de inteiros já escritos); cada
+    cláusula ocupa [autor, tamanho, lits...] a partir de dados[1]. Um leitor
+    que ficou mais de uma volta para trás pula para o cursor atual.
+    """
+
+    def __init__(self, capacidade=1 << 16, contexto=multiprocessing):
+        self.capacidade = capacidade
+        self.dados = contexto.Array('i', capacidade + 1)
+
+    def publicar(self, autor, lits):
+        if len(lits) + 2 > self.capacidade:
+            return
+        dados, cap = self.dados, self.capacidade
+        with dados.get_lock():
+            cursor = dados[0]
+            for k, x in enumerate((autor, len(lits), *lits)):
+                dados[1 + (cursor + k) % cap] = x
+            dados[0] = cursor + len(lits) + 2
+
+    def coletar(self, autor, cursor):
+        """Retorna (cláusulas de outros autores desde cursor, novo cursor)."""
+        dados, cap = self.dados, self.capacidade
+        clausulas = []
+        with dados.get_lock():
+            fim = dados[0]
+            if fim - cursor > cap:
+                return clausulas, fim
+            while cursor < fim:
+                quem = dados[1 + cursor % cap]
+                t = dados[1 + (cursor + 1) % cap]
+                if quem != autor:
+                    clausulas.append([dados[1 + (cursor + 2 + k) % cap] for k in range(t)])
+                cursor += t + 2
+        return clausulas, cursor
+
+
+def configuracao_portfolio(indice):
+    """Configuração diversificada do trabalhador `indice` (o 0 é o solver padrão)."""
+    if indice == 0:
+        return {}
+    decaimentos = (0.95, 0.85, 0.99, 0.90, 0.80, 0.975)
+    fases = (0, 1, 'aleatoria')
+    return {
+        'semente': 7 + indice,
+        'decaimento': decaimentos[indice % len(decaimentos)],
+        'reinicio': 'ema' if indice % 2 else 'luby',
+        'fase_inicial': fases[indice % len(fases)],
+        'ruido_inicial': 1e-3,
+    }
+
+
+def _trabalhador_portfolio(indice, numero_variaveis, clausulas, config, anel, resultados, tempo_max):
+    try:
+        solver = CDCL(numero_variaveis, clausulas, **config)
+    except RuntimeError:
+        resultados.put((indice, False, None))
+        return
+    cursor = [0]
+    solver.exportar = lambda lits: anel.publicar(indice, lits)
+    def importar():
+        clausulas_novas, cursor[0] = anel.coletar(indice, cursor[0])
+        return clausulas_novas
+    solver.importar = importar
+    resultado = solver.resolver(tempo_max)
+    resultados.put((indice, resultado, solver.modelo() if resultado else None))
+
+
+def resolver_portfolio(numero_variaveis, clausulas, trabalhadores, tempo_max=None, **opcoes):
+    """Roda `trabalhadores` solvers em processos; a primeira resposta SAT/UNSAT vence.
+
+    `opcoes` são repassadas ao construtor de todos os CDCL.
+
+    Retorna (resultado, modelo, índice do vencedor); resultado None se todos
+    esgotaram o tempo.
+    """
+    contexto = multiprocessing.get_context()
+    anel = AnelClausulas(contexto=contexto)
+    resultados = contexto.Queue()
+    processos = [
+        contexto.Process(target=_trabalhador_portfolio, daemon=True,
+                         args=(i, numero_variaveis, clausulas, {**opcoes, **configuracao_portfolio(i)},
+                               anel, resultados, tempo_max))
+        for i in range(trabalhadores)
+    ]
+    for p in processos:
+        p.start()
+    try:
+        pendentes = trabalhadores
+        while pendentes:
+            try:
+                indice, resultado, modelo = resultados.get(timeout=0.5)
+            except queue.Empty:
+                if not any(p.is_alive() for p in processos) and resultados.empty():
+                    break  # todos morreram sem responder
+                continue
+            pendentes -= 1
+            if resultado is not None:
+                return resultado, modelo, indice
+        return None, None, None
+    finally:
+        for p in processos:
+            if p.is_alive():
+                p.terminate()
+        for p in processos:
+            p.join()
+
+# ----------------- Execução CLI -----------------
+def main():
+    parser = argparse.ArgumentParser(description="Solucionador SAT (CDCL)")
+    parser.add_argument('arquivo', nargs='?', default='-', help="CNF (DIMACS, .gz ou .xz); '-' = stdin")
+    parser.add_argument('--portfolio', type=int, default=1, metavar='N',
+                        help="número de processos com configurações diversificadas")
+    parser.add_argument('--tempo', type=float, default=None, help="tempo máximo em segundos")
+
+    parser.add_argument('--sem-simplificar', action='store_true',
+                        help="desliga o pré-processamento SatELite")
+    parser.add_argument('--drat', metavar='ARQUIVO',
+                        help="grava a prova DRAT binária ('-' = stdout; ignorado no portfólio)")
+    parser.add_argument('--drat-texto', action='store_true', help="prova DRAT em texto")
+    parser.add_argument('--drat-buffer', type=int, default=1 << 16, metavar='BYTES',
+                        help="tamanho do buffer da prova")
+    parser.add_argument('--verbose', type=int, default=0, metavar='N',
+                        help="linha de progresso a cada N conflitos (stderr)")
+    parser.add_argument('--estatisticas', metavar='ARQUIVO',
+                        help="grava as estatísticas em JSON ao terminar")
+    parser.add_argument('--amostrar-vigilancias', type=int, default=0, metavar='N',
+                        help="histograma dos tamanhos das listas de vigilância a cada N conflitos")
+    args = parser.parse_args()
+
+    if args.arquivo not in ('-', '--'):
+        numero_variaveis, clausulas = ler_dimacs_arquivo(args.arquivo)
+    else:
+        numero_variaveis, clausulas = ler_dimacs_rapido(sys.stdin.buffer)
+
+    solver = None
+    if args.portfolio > 1:
+        resultado, modelo, vencedor = resolver_portfolio(numero_variaveis, clausulas,
+                                                          args.portfolio, args.tempo,
+                                                          simplificar=not args.sem_simplificar)
+        if resultado is not None:
+            print(f"c portfólio: trabalhador {vencedor} respondeu primeiro")
+    else:
+        prova = None
+        if args.drat:
+            destino = sys.stdout.buffer if args.drat == '-' else args.drat
+            prova = EscritorDRAT(destino, binario=not args.drat_texto,
+                                 tamanho_buffer=args.drat_buffer)
+        estatisticas = EstatisticasCDCL(args.verbose, args.amostrar_vigilancias)
+        try:
+            solver = CDCL(numero_variaveis, clausulas, simplificar=not args.sem_simplificar,
+                          prova=prova, estatisticas=estatisticas)
+            resultado = solver.resolver(args.tempo)
+        except RuntimeError:
+            resultado = False
+        finally:
+            if prova is not None:
+                prova.fechar()
+        modelo = solver.modelo() if resultado else None
+        if solver is not None:
+            if args.verbose:
+                print(estatisticas.linha_progresso(solver), file=sys.stderr)
+            if args.estatisticas:
+                estatisticas.salvar_json(solver, args.estatisticas)
+
+    if resultado is True:
+        print("SAT")
+        # modelo para 1..n
+        # saída estilo DIMACS (linhas 'v')
+        linha = []
+        for lit in modelo:
+            linha.append(str(lit))
+            if len(linha) > 12:
+                print("v " + " ".join(linha) + " 0")
+                linha = []
+        if linha:
+            print("v " + " ".join(linha) + " 0")
+
+    elif resultado is False:
+        print("UNSAT")
+    else:
+        print("UNKNOWN")
+
+if __name__ == "__main__":
+    main()
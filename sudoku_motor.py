@@ -0,0 +1,546 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Motores rápidos de Sudoku com a mesma interface do SudokuCSP
+
+- SudokuBits: domínios como inteiros de N² bits num vetor de N⁴ casas,
+  tabelas de pares/unidades pré-calculadas por tamanho, MRV por contagem
+  de bits, propagação de singles nus e ocultos e desfazer por trilha.
+- SudokuDLX: Algoritmo X de Knuth com dancing links (cobertura exata de
+  4·N⁴ colunas; 324 no 9x9), em vetores de índices em vez de objetos.
+
+Todos recebem a matriz N²xN² (0 = vazio; 9x9, 16x16 ou 25x25) e oferecem
+resolver() -> bool, como_matriz() e os contadores `nos` e `retrocessos`;
+os dois novos também têm contar_solucoes(limite). MOTORES mapeia
+nome -> classe, para escolher o mais rápido por classe de quebra-cabeça.
+resolver_arquivo resolve um arquivo inteiro (um quebra-cabeça por linha)
+num pool de processos.
+
+Uso:
+  python3 sudoku_motor.py 53..7....6..195....98....6.8...6...3... --motor dlx
+  python3 sudoku_motor.py <81, 256 ou 625 caracteres> --comparar
+"""
+
+from __future__ import annotations
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, TextIO, Tuple
+from collections import deque
+import argparse
+import multiprocessing
+import queue
+import sys
+import time
+
+from algoritmoSoduku_python import (SudokuCSP, ler_tabuleiro_de_string, imprimir,
+                                    ordem_do_lado, para_string)
+
+
+# -------------------- Tabelas -------------------- #
+
+class _ContagemBits:
+    """Contagem de bits sob demanda, para quando a tabela seria grande demais (25x25)."""
+    def __getitem__(self, m: int) -> int:
+        return bin(m).count('1')
+
+
+class Tabelas(NamedTuple):
+    ordem: int
+    lado: int
+    casas: int
+    todos: int
+    unidades: Tuple[Tuple[int, ...], ...]
+    unidades_da_casa: Tuple[Tuple[int, ...], ...]
+    pares: Tuple[Tuple[int, ...], ...]
+    contagem: Sequence[int]  # contagem[m] = bits ligados em m
+
+
+_TABELAS: Dict[int, Tabelas] = {}
+
+def tabelas(ordem: int = 3) -> Tabelas:
+    """Unidades, pares e contagem de bits do tabuleiro ordem² x ordem², calculados uma vez."""
+    if ordem not in _TABELAS:
+        lado = ordem * ordem
+        linhas = [tuple(l * lado + c for c in range(lado)) for l in range(lado)]
+        colunas = [tuple(l * lado + c for l in range(lado)) for c in range(lado)]
+        blocos = [tuple((bl + i) * lado + bc + j for i in range(ordem) for j in range(ordem))
+                  for bl in range(0, lado, ordem) for bc in range(0, lado, ordem)]
+        unidades = tuple(linhas + colunas + blocos)
+        casas = lado * lado
+        unidades_da_casa = tuple(tuple(u for u, unidade in enumerate(unidades) if i in unidade)
+                                 for i in range(casas))
+        pares = tuple(tuple(sorted({j for u in unidades_da_casa[i] for j in unidades[u]} - {i}))
+                      for i in range(casas))
+        todos = (1 << lado) - 1
+        if lado <= 16:
+            contagem: Sequence[int] = tuple(bin(m).count('1') for m in range(todos + 1))
+        else:
+            contagem = _ContagemBits()
+        _TABELAS[ordem] = Tabelas(ordem, lado, casas, todos, unidades,
+                                  unidades_da_casa, pares, contagem)
+    return _TABELAS[ordem]
+
+
+# -------------------- Bits + trilha -------------------- #
+
+class SudokuBits:
+    def __init__(self, tabuleiro: List[List[int]]) -> None:
+        t = self.tabelas = tabelas(ordem_do_lado(len(tabuleiro)))
+        self.lado = t.lado
+        self.dominios: List[int] = [t.todos] * t.casas
+        self.trilha: List[Tuple[int, int]] = []  # (casa, domínio anterior)
+        self.solucao: Optional[List[int]] = None
+        self.nos = 0
+        self.retrocessos = 0  # valores tentados que não levaram a solução
+        self.consistente = True
+        for i in range(t.casas):
+            v = tabuleiro[i // t.lado][i % t.lado]
+            if v and not self._atribuir(i, 1 << (v - 1)):
+                self.consistente = False
+                break
+        self.trilha.clear()  # a propagação das pistas nunca é desfeita
+
+    def _atribuir(self, i: int, bit: int) -> bool:
+        """Deixa só `bit` no domínio da casa i, propagando."""
+        outros = self.dominios[i] & ~bit
+        while outros:
+            b = outros & -outros
+            if not self._eliminar(i, b):
+                return False
+            outros ^= b
+        return True
+
+    def _eliminar(self, i: int, bit: int) -> bool:
+        """Tira `bit` do domínio de i; False se algum domínio ou unidade ficar sem saída."""
+        dominios = self.dominios
+        d = dominios[i]
+        if not d & bit:
+            return True
+        d ^= bit
+        if not d:
+            return False
+        self.trilha.append((i, dominios[i]))
+        dominios[i] = d
+        t = self.tabelas
+        # single nu: o valor que sobrou sai dos pares
+        if not d & (d - 1):
+            for j in t.pares[i]:
+                if not self._eliminar(j, d):
+                    return False
+        # single oculto: `bit` só cabe em um lugar da unidade
+        unidades = t.unidades
+        for u in t.unidades_da_casa[i]:
+            lugar = -1
+            for j in unidades[u]:
+                if dominios[j] & bit:
+                    if lugar >= 0:
+                        break
+                    lugar = j
+            else:
+                if lugar < 0:
+                    return False
+                if dominios[lugar] != bit and not self._atribuir(lugar, bit):
+                    return False
+        return True
+
+    def _desfazer(self, marca: int) -> None:
+        trilha, dominios = self.trilha, self.dominios
+        while len(trilha) > marca:
+            i, d = trilha.pop()
+            dominios[i] = d
+
+    def _escolher(self) -> int:
+        """Casa não resolvida com menos candidatos (MRV); -1 se todas resolvidas."""
+        contagem = self.tabelas.contagem
+        melhor, menor = -1, self.lado + 1
+        for i, d in enumerate(self.dominios):
+            n = contagem[d]
+            if 1 < n < menor:
+                melhor, menor = i, n
+                if n == 2:
+                    break
+        return melhor
+
+    def _buscar(self, limite: int) -> int:
+        """Conta soluções até `limite`; guarda a primeira e deixa o estado como estava."""
+        self.nos += 1
+        i = self._escolher()
+        if i < 0:
+            if self.solucao is None:
+                self.solucao = self.dominios[:]
+            return 1
+        total = 0
+        marca = len(self.trilha)
+        d = self.dominios[i]
+        while d and total < limite:
+            bit = d & -d
+            d ^= bit
+            achadas = self._buscar(limite - total) if self._atribuir(i, bit) else 0
+            if not achadas:
+                self.retrocessos += 1
+            total += achadas
+            self._desfazer(marca)
+        return total
+
+    def resolver(self) -> bool:
+        return self.consistente and self._buscar(1) == 1
+
+    def contar_solucoes(self, limite: int = 2) -> int:
+        return self._buscar(limite) if self.consistente else 0
+
+    def como_matriz(self) -> List[List[int]]:
+        lado = self.lado
+        M = [[0] * lado for _ in range(lado)]
+        for i, d in enumerate(self.solucao or self.dominios):
+            if not d & (d - 1):   # um só candidato
+                M[i // lado][i % lado] = d.bit_length()
+        return M
+
+
+# -------------------- Dancing links -------------------- #
+
+# Linha r = casa*lado + (d-1); colunas (1..4*casas, 0 é a raiz):
+# casa preenchida, dígito na linha, dígito na coluna, dígito no bloco.
+
+def _colunas_da_linha(r: int, ordem: int = 3) -> Tuple[int, int, int, int]:
+    lado = ordem * ordem
+    casas = lado * lado
+    casa, d = divmod(r, lado)
+    l, c = divmod(casa, lado)
+    b = (l // ordem) * ordem + c // ordem
+    return (1 + casa, 1 + casas + l * lado + d, 1 + 2 * casas + c * lado + d,
+            1 + 3 * casas + b * lado + d)
+
+_MODELOS: Dict[int, tuple] = {}
+
+def _modelo_dlx(ordem: int):
+    """Vetores L, R, U, D, C, LINHA e S da matriz de cobertura completa (um por tamanho)."""
+    if ordem in _MODELOS:
+        return _MODELOS[ordem]
+    lado = ordem * ordem
+    n = 4 * lado * lado + 1
+    L = [i - 1 for i in range(n)]
+    R = [i + 1 for i in range(n)]
+    L[0], R[n - 1] = n - 1, 0
+    U = list(range(n))
+    D = list(range(n))
+    C = list(range(n))
+    LINHA = [-1] * n
+    S = [0] * n
+    for r in range(lado ** 3):
+        primeiro = len(C)
+        for k, col in enumerate(_colunas_da_linha(r, ordem)):
+            no = primeiro + k
+            L.append(primeiro + (k - 1) % 4)
+            R.append(primeiro + (k + 1) % 4)
+            U.append(U[col])
+            D.append(col)
+            D[U[col]] = no
+            U[col] = no
+            C.append(col)
+            LINHA.append(r)
+            S[col] += 1
+    _MODELOS[ordem] = (L, R, U, D, C, LINHA, S)
+    return _MODELOS[ordem]
+
+
+class SudokuDLX:
+    def __init__(self, tabuleiro: List[List[int]]) -> None:
+        self.lado = lado = len(tabuleiro)
+        ordem = ordem_do_lado(lado)
+        L, R, U, D, C, LINHA, S = _modelo_dlx(ordem)
+        # a estrutura muda durante a busca: cada instância usa a sua cópia
+        self.L, self.R, self.U, self.D, self.S = L[:], R[:], U[:], D[:], S[:]
+        self.C, self.LINHA = C, LINHA   # só leitura
+        self.pistas: List[int] = []
+        self.escolhidas: List[int] = []
+        self.solucao: Optional[List[int]] = None
+        self.nos = 0
+        self.retrocessos = 0  # valores tentados que não levaram a solução
+        self.consistente = True
+        cobertas = set()
+        for i in range(lado * lado):
+            v = tabuleiro[i // lado][i % lado]
+            if not v:
+                continue
+            r = i * lado + v - 1
+            colunas = _colunas_da_linha(r, ordem)
+            if cobertas.intersection(colunas):   # pistas em conflito
+                self.consistente = False
+                break
+            cobertas.update(colunas)
+            self.pistas.append(r)
+            for col in colunas:
+                self._cobrir(col)
+
+    def _cobrir(self, c: int) -> None:
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        R[L[c]] = R[c]
+        L[R[c]] = L[c]
+        i = D[c]
+        while i != c:
+            j = R[i]
+            while j != i:
+                D[U[j]] = D[j]
+                U[D[j]] = U[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def _descobrir(self, c: int) -> None:
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+        i = U[c]
+        while i != c:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                D[U[j]] = j
+                U[D[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[c]] = c
+        L[R[c]] = c
+
+    def _buscar(self, limite: int) -> int:
+        self.nos += 1
+        R, S = self.R, self.S
+        if R[0] == 0:
+            if self.solucao is None:
+                self.solucao = self.pistas + self.escolhidas
+            return 1
+        # coluna com menos linhas (o MRV do Algoritmo X)
+        c, menor = R[0], S[R[0]]
+        j = R[c]
+        while j != 0 and menor > 1:
+            if S[j] < menor:
+                c, menor = j, S[j]
+            j = R[j]
+        if menor == 0:
+            return 0
+        L, D, C = self.L, self.D, self.C
+        self._cobrir(c)
+        total = 0
+        r = D[c]
+        while r != c and total < limite:
+            self.escolhidas.append(self.LINHA[r])
+            j = R[r]
+            while j != r:
+                self._cobrir(C[j])
+                j = R[j]
+            achadas = self._buscar(limite - total)
+            if not achadas:
+                self.retrocessos += 1
+            total += achadas
+            j = L[r]
+            while j != r:
+                self._descobrir(C[j])
+                j = L[j]
+            self.escolhidas.pop()
+            r = D[r]
+        self._descobrir(c)
+        return total
+
+    def resolver(self) -> bool:
+        return self.consistente and self._buscar(1) == 1
+
+    def contar_solucoes(self, limite: int = 2) -> int:
+        return self._buscar(limite) if self.consistente else 0
+
+    def como_matriz(self) -> List[List[int]]:
+        lado = self.lado
+        M = [[0] * lado for _ in range(lado)]
+        for r in (self.solucao if self.solucao is not None else self.pistas):
+            casa, d = divmod(r, lado)
+            M[casa // lado][casa % lado] = d + 1
+        return M
+
+
+# -------------------- Seleção do motor -------------------- #
+
+MOTORES: Dict[str, type] = {'bits': SudokuBits, 'dlx': SudokuDLX, 'csp': SudokuCSP}
+
+def resolver(tabuleiro: List[List[int]], motor: str = 'bits') -> Optional[List[List[int]]]:
+    """Resolve com o motor escolhido; devolve a matriz resolvida ou None."""
+    solucionador = MOTORES[motor](tabuleiro)
+    return solucionador.como_matriz() if solucionador.resolver() else None
+
+
+# -------------------- Lote -------------------- #
+
+TAMANHO_LOTE = 256  # quebra-cabeças por tarefa do pool
+
+# (número da linha, entrada, solução ou None, retrocessos, erro)
+Resultado = Tuple[int, str, Optional[str], int, str]
+
+def solucao_valida(tabuleiro: List[List[int]], M: List[List[int]]) -> bool:
+    """M é uma grade completa válida e respeita as pistas de `tabuleiro`."""
+    lado = len(tabuleiro)
+    t = tabelas(ordem_do_lado(lado))
+    digitos = list(range(1, lado + 1))
+    for unidade in t.unidades:
+        if sorted(M[i // lado][i % lado] for i in unidade) != digitos:
+            return False
+    return all(tabuleiro[l][c] in (0, M[l][c]) for l in range(lado) for c in range(lado))
+
+def ler_quebra_cabecas(arquivo: TextIO) -> Iterator[Tuple[int, str]]:
+    """(número da linha, texto) de cada linha útil, sem carregar o arquivo.
+
+    Aceita também o formato 'quebra_cabeca,solucao' (só o primeiro campo é
+    lido); linhas vazias e comentários (#) são ignorados.
+    """
+    for numero, linha in enumerate(arquivo, 1):
+        texto = linha.split(',', 1)[0].strip()
+        if texto and not texto.startswith('#'):
+            yield numero, texto
+
+def em_lotes(itens: Iterable, tamanho: int) -> Iterator[list]:
+    lote = []
+    for item in itens:
+        lote.append(item)
+        if len(lote) == tamanho:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+def resolver_lote(motor: str, lote: List[Tuple[int, str]]) -> List[Resultado]:
+    """Corpo da tarefa do pool: resolve e valida cada quebra-cabeça do lote."""
+    classe = MOTORES[motor]
+    resultados = []
+    for numero, texto in lote:
+        try:
+            tab = ler_tabuleiro_de_string(texto)
+        except ValueError as e:
+            resultados.append((numero, texto, None, 0, str(e)))
+            continue
+        solucionador = classe(tab)
+        solucao, erro = None, ''
+        if solucionador.resolver():
+            M = solucionador.como_matriz()
+            if solucao_valida(tab, M):
+                solucao = para_string(M)
+            else:
+                erro = 'solução inválida'
+        resultados.append((numero, texto, solucao, solucionador.retrocessos, erro))
+    return resultados
+
+def faixa(retrocessos: int) -> int:
+    """Faixa do histograma: 0, 1, 2-3, 4-7, ... (potências de 2)."""
+    return retrocessos.bit_length()
+
+def nome_faixa(k: int) -> str:
+    if k <= 1:
+        return str(k)
+    return f"{1 << (k - 1)}-{(1 << k) - 1}"
+
+def resolver_arquivo(entrada: TextIO, saida: TextIO, motor: str = 'bits',
+                     processos: Optional[int] = None, tamanho_lote: int = TAMANHO_LOTE,
+                     ordenado: bool = True) -> Dict:
+    """Resolve cada linha de `entrada` e escreve 'entrada,solucao' em `saida`.
+
+    No máximo 2 lotes por processo ficam em voo, então a memória não
+    depende do tamanho do arquivo. Com `ordenado` a saída segue a ordem da
+    entrada; sem ele, cada lote é escrito assim que fica pronto. Quem não
+    tem solução sai com o segundo campo vazio; linhas inválidas vão para o
+    resumo (e para stderr). Devolve o resumo com contagens, quebra-cabeças/s
+    e o histograma de retrocessos {faixa: quantidade}.
+    """
+    processos = processos or multiprocessing.cpu_count()
+    janela = 2 * processos
+    resumo = {'quebra_cabecas': 0, 'resolvidos': 0, 'sem_solucao': 0, 'erros': 0,
+              'retrocessos': 0, 'histograma': {}}
+
+    def escrever(resultados: List[Resultado]) -> None:
+        histograma = resumo['histograma']
+        for numero, texto, solucao, retrocessos, erro in resultados:
+            resumo['quebra_cabecas'] += 1
+            if erro:
+                resumo['erros'] += 1
+                print(f"linha {numero}: {erro}", file=sys.stderr)
+                continue
+            if solucao is None:
+                resumo['sem_solucao'] += 1
+            else:
+                resumo['resolvidos'] += 1
+            resumo['retrocessos'] += retrocessos
+            k = faixa(retrocessos)
+            histograma[k] = histograma.get(k, 0) + 1
+            saida.write(f"{texto},{solucao or ''}\n")
+
+    inicio = time.perf_counter()
+    lotes = em_lotes(ler_quebra_cabecas(entrada), tamanho_lote)
+    with multiprocessing.Pool(processos) as pool:
+        if ordenado:
+            pendentes = deque()
+            for lote in lotes:
+                pendentes.append(pool.apply_async(resolver_lote, (motor, lote)))
+                if len(pendentes) >= janela:
+                    escrever(pendentes.popleft().get())
+            while pendentes:
+                escrever(pendentes.popleft().get())
+        else:
+            prontos: queue.Queue = queue.Queue()
+            em_voo = 0
+
+            def proximo() -> None:
+                resultado = prontos.get()
+                if isinstance(resultado, BaseException):
+                    raise resultado
+                escrever(resultado)
+
+            for lote in lotes:
+                pool.apply_async(resolver_lote, (motor, lote),
+                                 callback=prontos.put, error_callback=prontos.put)
+                em_voo += 1
+                if em_voo >= janela:
+                    proximo()
+                    em_voo -= 1
+            for _ in range(em_voo):
+                proximo()
+    resumo['tempo'] = time.perf_counter() - inicio
+    resumo['por_segundo'] = resumo['quebra_cabecas'] / resumo['tempo'] if resumo['tempo'] > 0 else 0.0
+    return resumo
+
+def imprimir_resumo(resumo: Dict, arquivo: TextIO = sys.stderr) -> None:
+    print(f"{resumo['quebra_cabecas']} quebra-cabeças em {resumo['tempo']:.2f}s "
+          f"({resumo['por_segundo']:.0f}/s): {resumo['resolvidos']} resolvidos, "
+          f"{resumo['sem_solucao']} sem solução, {resumo['erros']} erros", file=arquivo)
+    histograma = resumo['histograma']
+    if histograma:
+        total = sum(histograma.values())
+        print("retrocessos por quebra-cabeça:", file=arquivo)
+        for k in range(max(histograma) + 1):
+            n = histograma.get(k, 0)
+            barra = '#' * round(40 * n / total)
+            print(f"  {nome_faixa(k):>11} {n:9}  {barra}", file=arquivo)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Resolve um Sudoku com o motor escolhido")
+    parser.add_argument('sudoku', help="81, 256 ou 625 caracteres ('.' ou '0' como vazio)")
+    parser.add_argument('--motor', choices=sorted(MOTORES), default='bits')
+    parser.add_argument('--comparar', action='store_true',
+                        help="roda todos os motores e compara tempo e nós")
+    args = parser.parse_args()
+
+    try:
+        tab = ler_tabuleiro_de_string(args.sudoku)
+    except ValueError as e:
+        parser.error(str(e))
+
+    solucao = None
+    for nome in (sorted(MOTORES) if args.comparar else [args.motor]):
+        inicio = time.perf_counter()
+        solucionador = MOTORES[nome](tab)
+        ok = solucionador.resolver()
+        decorrido = time.perf_counter() - inicio
+        print(f"{nome:5} {'resolvido' if ok else 'sem solução':12} "
+              f"{decorrido * 1000:9.2f} ms  {solucionador.nos:7} nós")
+        if ok and solucao is None:
+            solucao = solucionador.como_matriz()
+    if solucao is None:
+        return 1
+    print()
+    imprimir(solucao)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
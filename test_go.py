@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+"""Testes de regras do tabuleiro de go.py (capturas, ko, superko, liberdades)."""
+
+import random
+
+from go import VAZIO, PRETO, BRANCO, BORDA, PASSE, Tabuleiro
+
+
+def _jogar(t, *lances):
+    """Joga (linha, coluna) ou PASSE em sequência, alternando as cores."""
+    for lance in lances:
+        assert t.jogar(PASSE if lance == PASSE else t.ponto(*lance))
+
+
+def _ko(superko=True):
+    """5x5 com o ko em (1, 1) logo depois de o preto capturar em (1, 2)."""
+    t = Tabuleiro(5, superko=superko)
+    _jogar(t, (0, 1), (0, 2), (1, 0), (1, 3), (2, 1), (2, 2), (4, 4), (1, 1), (1, 2))
+    return t
+
+
+def _conferir(t):
+    """Grupos, liberdades e lista de vazios batem com uma busca direta."""
+    largura = t.largura
+    vazios = [p for p in range(len(t.cores)) if t.cores[p] == VAZIO]
+    assert sorted(t.vazios) == vazios
+    assert all(t.vazios[t.indice_vazio[p]] == p for p in vazios)
+    vistos = set()
+    for p in range(len(t.cores)):
+        cor = t.cores[p]
+        if cor not in (PRETO, BRANCO) or p in vistos:
+            continue
+        grupo, libs, pilha = {p}, set(), [p]
+        while pilha:
+            s = pilha.pop()
+            for q in (s - 1, s + 1, s - largura, s + largura):
+                if t.cores[q] == VAZIO:
+                    libs.add(q)
+                elif t.cores[q] == cor and q not in grupo:
+                    grupo.add(q)
+                    pilha.append(q)
+        vistos |= grupo
+        raiz = t.grupo(p)
+        assert all(t.grupo(s) == raiz for s in grupo)
+        assert set(t.pedras(p)) == grupo
+        assert t.tamanho_grupo[raiz] == len(grupo)
+        assert t.liberdades[raiz] == sum(1 << q for q in libs)
+
+
+def test_captura():
+    t = Tabuleiro(5)
+    _jogar(t, (0, 1), (0, 0), (1, 0))
+    assert t.cores[t.ponto(0, 0)] == VAZIO
+    assert t.capturas[PRETO] == 1
+    assert t.ponto(0, 0) in t.vazios
+    assert t.num_liberdades(t.ponto(0, 1)) == 3
+    _conferir(t)
+
+
+def test_suicidio():
+    t = Tabuleiro(5)
+    _jogar(t, (0, 1), (4, 4), (1, 0))
+    assert t.jogador_atual == BRANCO
+    assert not t.legal(t.ponto(0, 0))
+    assert not t.jogar(t.ponto(0, 0))
+    assert t.jogador_atual == BRANCO
+    # com a captura deixa de ser suicídio
+    assert t.legal(t.ponto(0, 0), PRETO)
+
+
+def test_ko_simples():
+    t = _ko()
+    assert t.cores[t.ponto(1, 1)] == VAZIO
+    assert t.ko == t.ponto(1, 1)
+    assert not t.jogar(t.ponto(1, 1))
+    # depois de uma troca de lances em outro lugar o ko pode ser retomado
+    _jogar(t, (4, 0), (4, 2), (1, 1))
+    assert t.cores[t.ponto(1, 2)] == VAZIO
+
+
+def test_superko_posicional_apos_copiar():
+    t = _ko()
+    copia = t.copiar()
+    _jogar(copia, PASSE, PASSE)   # o passe limpa o ko simples
+    assert copia.ko == 0
+    # retomar repetiria a posição de antes da captura, guardada antes da cópia
+    assert not copia.legal(copia.ponto(1, 1))
+    sem_superko = _ko(superko=False)
+    _jogar(sem_superko, PASSE, PASSE)
+    assert sem_superko.legal(sem_superko.ponto(1, 1))
+    # o conjunto compartilhado só é duplicado por quem joga
+    hashes = set(t.hashes)
+    _jogar(copia, (3, 3))
+    assert t.hashes == hashes
+    assert copia.hash in copia.hashes and copia.hash not in t.hashes
+
+
+def test_liberdades_em_partidas_aleatorias():
+    for semente in range(5):
+        r = random.Random(semente)
+        t = Tabuleiro(7)
+        for _ in range(150):
+            legais = [p for p in t.vazios if t.legal(p)]
+            if not legais:
+                break
+            t.jogar(r.choice(legais))
+            _conferir(t)
+            if r.random() < 0.1:
+                t = t.copiar()
+        assert all(c == BORDA for c in t.cores[:t.largura])
+
+
+def test_empate_com_komi_inteiro():
+    t = Tabuleiro(5, komi=0)
+    assert t.pontuacao() == 0
+    assert t.vencedor() == VAZIO
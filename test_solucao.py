@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""Testes de regressão do solucionador SAT (solucao.py)."""
+
+import random
+
+from solucao import CDCL
+
+
+def _formula_com_unidades(semente):
+    """3-SAT aleatório, binárias de enchimento e unidades no nível 0."""
+    r = random.Random(semente)
+    clausulas = [[r.choice((-1, 1)) * r.randint(1, 80) for _ in range(3)] for _ in range(340)]
+    clausulas += [[1000 + i, 5000 + i] for i in range(300)]
+    clausulas += [[-9001, 9002], [9001]]
+    return clausulas
+
+
+def test_reducao_apos_satelite_com_unidades():
+    # o SatELite reconstrói a arena com literais do nível 0 na trilha; as
+    # razões antigas não podem sobreviver até a compactação da redução
+    for semente in (2, 3):
+        clausulas = _formula_com_unidades(semente)
+        solver = CDCL(9002, clausulas)
+        solver.intervalo_reducao = solver.proxima_reducao = 50
+        resultado = solver.resolver()
+        assert solver.reducoes > 0
+        assert resultado == CDCL(9002, clausulas, simplificar=False).resolver()
+        if resultado:
+            modelo = set(solver.modelo())
+            assert all(any(l in modelo for l in c) for c in clausulas)
+
+
+def test_variavel_so_em_tautologia_entra_no_modelo():
+    solver = CDCL(0, [], incremental=True)
+    solver.adicionar_clausula([1, 2])
+    solver.adicionar_clausula([3, -3])
+    assert solver.resolver()
+    assert sorted(map(abs, solver.modelo())) == [1, 2, 3]
@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+"""
+Busca do motor de xadrez (sem pygame)
+
+Negamax com poda alpha-beta sobre xadrez_motor.Posicao (fazer/desfazer no
+lugar) e tabela de transposição indexada pela chave Zobrist.
+
+- Aprofundamento iterativo com orçamento de tempo (`pensar`); a variação
+  principal da iteração anterior volta pela tabela e é tentada primeiro
+- Ordenação: lance da tabela, capturas MVV-LVA, lances matadores (killers)
+  e heurística de histórico para os lances quietos
+- Quiescência sobre capturas nas folhas; xeque na folha estende um ply
+- Busca paralela na raiz (`BuscaParalela`): os lances da raiz são divididos
+  entre processos e a coordenação roda numa thread, fora do laço da interface
+
+Valores são do ponto de vista do lado a jogar; mates valem MATE - ply.
+"""
+
+import multiprocessing, os, queue, threading, time
+
+from xadrez_avaliacao import avaliar
+from xadrez_motor import EN_PASSANT, PEAO, Posicao
+
+MATE = 100000
+INFINITO = 10 * MATE
+LIMITE_MATE = MATE - 1000
+
+# tipo do valor guardado
+EXATO, INFERIOR, SUPERIOR = 0, 1, 2
+
+MAX_PLY = 64
+VERIFICAR_A_CADA = 1023   # nós entre consultas ao relógio (máscara)
+
+# faixas da pontuação de ordenação
+ORDEM_TABELA = 1 << 30
+ORDEM_CAPTURA = 1 << 24
+ORDEM_MATADOR = 1 << 22
+LIMITE_HISTORIA = 1 << 20
+
+
+def _para_tabela(valor, ply):
+    # mates guardados como distância a partir do nó, não da raiz
+    if valor > LIMITE_MATE:
+        return valor + ply
+    if valor < -LIMITE_MATE:
+        return valor - ply
+    return valor
+
+def _da_tabela(valor, ply):
+    if valor > LIMITE_MATE:
+        return valor - ply
+    if valor < -LIMITE_MATE:
+        return valor + ply
+    return valor
+
+# ----------------- Tabela de transposição -----------------
+class TabelaTransposicao:
+    """Tabela de tamanho fixo (2**bits entradas) com substituição por profundidade.
+
+    Cada entrada é (chave, profundidade, valor, tipo, lance, idade). Entradas de
+    uma busca anterior sempre podem ser substituídas; da busca atual, só por
+    outra de profundidade maior ou igual.
+    """
+
+    def __init__(self, bits=20):
+        self.mascara = (1 << bits) - 1
+        self.entradas = [None] * (1 << bits)
+        self.idade = 0
+        self.consultas = 0
+        self.acertos = 0
+
+    def nova_busca(self):
+        self.idade += 1
+
+    def limpar(self):
+        self.entradas = [None] * (self.mascara + 1)
+        self.idade = 0
+
+    def consultar(self, chave):
+        self.consultas += 1
+        entrada = self.entradas[chave & self.mascara]
+        if entrada is not None and entrada[0] == chave:
+            self.acertos += 1
+            return entrada
+        return None
+
+    def guardar(self, chave, profundidade, valor, tipo, lance):
+        i = chave & self.mascara
+        entrada = self.entradas[i]
+        if entrada is None or entrada[5] != self.idade or profundidade >= entrada[1]:
+            self.entradas[i] = (chave, profundidade, valor, tipo, lance, self.idade)
+
+# ----------------- Busca -----------------
+class TempoEsgotado(Exception):
+    """Interrompe a busca quando o prazo acaba."""
+
+
+class Busca:
+    """Alpha-beta sobre uma posição; tabela e histórico persistem entre chamadas."""
+
+    def __init__(self, posicao, avaliar=avaliar, tabela=None):
+        self.posicao = posicao
+        self.avaliar = avaliar
+        self.tabela = tabela if tabela is not None else TabelaTransposicao()
+        self.nos = 0
+        self.melhor_lance = 0
+        self.prazo = float('inf')
+        self.matadores = [[0, 0] for _ in range(MAX_PLY + 1)]
+        self.historia = [[0] * 64 for _ in range(15)]   # [peça][destino]
+        self.lances_raiz = None   # restringe a raiz a estes lances (busca paralela)
+        self.parar = None         # Event opcional: interrompe como o fim do prazo
+
+    def _preparar(self, prazo):
+        self.tabela.nova_busca()
+        self.nos = 0
+        self.melhor_lance = 0
+        self.prazo = prazo
+        self.matadores = [[0, 0] for _ in range(MAX_PLY + 1)]
+        for linha in self.historia:       # envelhece o histórico da busca anterior
+            for i in range(64):
+                linha[i] >>= 2
+
+    def buscar(self, profundidade, alpha=-INFINITO, beta=INFINITO):
+        """Busca em profundidade fixa; devolve (valor, lance), lance 0 se não houver lances."""
+        self._preparar(float('inf'))
+        valor = self.alfabeta(profundidade, alpha, beta, 0)
+        return valor, self.melhor_lance
+
+    def pensar(self, tempo, profundidade_max=MAX_PLY, ao_iterar=None):
+        """Aprofundamento iterativo por até `tempo` segundos.
+
+        Devolve (valor, lance, profundidade) da última iteração completa.
+        ao_iterar(profundidade, valor, lance, nos, decorrido) é chamado ao fim
+        de cada iteração.
+        """
+        inicio = time.perf_counter()
+        self._preparar(inicio + tempo)
+        pos = self.posicao
+        tamanho = len(pos.historico)
+        resultado = (0, 0, 0)
+        for profundidade in range(1, profundidade_max + 1):
+            try:
+                valor = self.alfabeta(profundidade, -INFINITO, INFINITO, 0)
+            except TempoEsgotado:
+                pos.desfazer_ate(tamanho)
+                break
+            resultado = (valor, self.melhor_lance, profundidade)
+            decorrido = time.perf_counter() - inicio
+            if ao_iterar is not None:
+                ao_iterar(profundidade, valor, self.melhor_lance, self.nos, decorrido)
+            # sem lances, mate encontrado, ou a próxima iteração não caberia no prazo
+            if not self.melhor_lance or abs(valor) > LIMITE_MATE or decorrido > tempo / 2:
+                break
+        if not resultado[1]:
+            # nem a primeira iteração terminou: qualquer lance legal serve
+            legais = pos.lances_legais()
+            resultado = (resultado[0], legais[0] if legais else 0, 0)
+        return resultado
+
+    def variacao_principal(self, profundidade=MAX_PLY):
+        """Sequência de melhores lances lida da tabela a partir da posição atual."""
+        pos = self.posicao
+        tamanho = len(pos.historico)
+        variacao, vistas = [], set()
+        while len(variacao) < profundidade and pos.hash not in vistas:
+            vistas.add(pos.hash)
+            entrada = self.tabela.consultar(pos.hash)
+            if entrada is None or entrada[4] not in pos.gerar():
+                break
+            if not pos.fazer(entrada[4]):
+                pos.desfazer()
+                break
+            variacao.append(entrada[4])
+        pos.desfazer_ate(tamanho)
+        return variacao
+
+    def ordenar(self, lances, lance_tabela, ply):
+        casas = self.posicao.casas
+        matador1, matador2 = self.matadores[ply]
+        historia = self.historia
+
+        def pontuar(m):
+            if m == lance_tabela:
+                return ORDEM_TABELA
+            d = m >> 6 & 63
+            vitima = casas[d] & 7
+            if vitima or m >> 15 == EN_PASSANT:
+                # MVV-LVA: vítima mais valiosa primeiro, depois atacante mais barato
+                return ORDEM_CAPTURA + (vitima or PEAO) * 8 - (casas[m & 63] & 7)
+            promocao = m >> 12 & 7
+            if promocao:
+                return ORDEM_CAPTURA + promocao * 8
+            if m == matador1:
+                return ORDEM_MATADOR + 1
+            if m == matador2:
+                return ORDEM_MATADOR
+            return historia[casas[m & 63]][d]
+
+        lances.sort(key=pontuar, reverse=True)
+
+    def _registrar_corte(self, m, profundidade, ply):
+        """Lance quieto que causou corte beta vira matador e ganha histórico."""
+        casas = self.posicao.casas
+        if casas[m >> 6 & 63] or m >> 12 & 7 or m >> 15 == EN_PASSANT:
+            return
+        matadores = self.matadores[ply]
+        if matadores[0] != m:
+            matadores[1] = matadores[0]
+            matadores[0] = m
+        linha = self.historia[casas[m & 63]]
+        linha[m >> 6 & 63] += profundidade * profundidade
+        if linha[m >> 6 & 63] > LIMITE_HISTORIA:
+            for tabela in self.historia:
+                for i in range(64):
+                    tabela[i] >>= 1
+
+    def _verificar_tempo(self):
+        if time.perf_counter() > self.prazo or (self.parar is not None and self.parar.is_set()):
+            raise TempoEsgotado
+
+    def alfabeta(self, profundidade, alpha, beta, ply):
+        pos = self.posicao
+        if profundidade <= 0:
+            if ply >= MAX_PLY or not pos.em_xeque():
+                return self.quiescencia(alpha, beta, ply)
+            profundidade = 1    # em xeque na folha: estende
+        self.nos += 1
+        if not self.nos & VERIFICAR_A_CADA:
+            self._verificar_tempo()
+        chave = pos.hash
+        alpha_original = alpha
+        lance_tabela = 0
+        entrada = self.tabela.consultar(chave)
+        if entrada is not None:
+            if ply and entrada[1] >= profundidade:
+                valor, tipo = _da_tabela(entrada[2], ply), entrada[3]
+                if tipo == EXATO or (tipo == INFERIOR and valor >= beta) \
+                        or (tipo == SUPERIOR and valor <= alpha):
+                    return valor
+            lance_tabela = entrada[4]
+        lances = pos.gerar()
+        if not ply and self.lances_raiz is not None:
+            lances = [m for m in lances if m in self.lances_raiz]
+        self.ordenar(lances, lance_tabela, ply)
+
+        melhor, melhor_lance = -INFINITO, 0
+        for m in lances:
+            if pos.fazer(m):
+                valor = -self.alfabeta(profundidade - 1, -beta, -alpha, ply + 1)
+                pos.desfazer()
+                if valor > melhor:
+                    melhor, melhor_lance = valor, m
+                    if valor > alpha:
+                        alpha = valor
+                        if alpha >= beta:
+                            self._registrar_corte(m, profundidade, ply)
+                            break
+            else:
+                pos.desfazer()
+        if not melhor_lance:
+            # sem lances legais: mate ou afogamento
+            return -MATE + ply if pos.em_xeque() else 0
+
+        if melhor <= alpha_original:
+            tipo = SUPERIOR
+        elif melhor >= beta:
+            tipo = INFERIOR
+        else:
+            tipo = EXATO
+        self.tabela.guardar(chave, profundidade, _para_tabela(melhor, ply), tipo, melhor_lance)
+        if ply == 0:
+            self.melhor_lance = melhor_lance
+        return melhor
+
+    def quiescencia(self, alpha, beta, ply):
+        """Só capturas (e promoções) até a posição ficar quieta."""
+        pos = self.posicao
+        self.nos += 1
+        if not self.nos & VERIFICAR_A_CADA:
+            self._verificar_tempo()
+        parado = self.avaliar(pos)
+        if parado >= beta or ply >= MAX_PLY:
+            return parado
+        if parado > alpha:
+            alpha = parado
+        lances = pos.gerar(somente_capturas=True)
+        self.ordenar(lances, 0, ply)
+        for m in lances:
+            if pos.fazer(m):
+                valor = -self.quiescencia(-beta, -alpha, ply + 1)
+                pos.desfazer()
+                if valor > alpha:
+                    if valor >= beta:
+                        return valor
+                    alpha = valor
+            else:
+                pos.desfazer()
+        return alpha
+
+# ----------------- Busca paralela na raiz -----------------
+FOLGA = 1.0   # segundos além do prazo antes de abandonar os trabalhadores
+
+PROFUNDIDADE_RETORNO = 2   # entradas da tabela devolvidas pelos trabalhadores
+
+def _trabalhador_raiz(indice, fen, lances, tempo, fila, parar, bits, sementes, historia):
+    # a tabela parte das entradas ocupadas da tabela persistente (só elas
+    # atravessam para o processo, não o vetor inteiro)
+    tabela = TabelaTransposicao(bits)
+    for chave, profundidade, valor, tipo, lance, _ in sementes:
+        tabela.guardar(chave, profundidade, valor, tipo, lance)
+    busca = Busca(Posicao(fen), tabela=tabela)
+    busca.historia = historia
+    busca.lances_raiz = set(lances)
+    busca.parar = parar
+
+    def relatar(profundidade, valor, lance, nos, decorrido):
+        fila.put((indice, profundidade, valor, lance, nos, None))
+
+    busca.pensar(tempo, ao_iterar=relatar)
+    # terminou: devolve o que aprendeu nesta busca para a tabela persistente;
+    # a entrada da raiz fica de fora, pois só cobre os lances deste trabalhador
+    idade, raiz = tabela.idade, busca.posicao.hash
+    novas = [e for e in tabela.entradas
+             if e is not None and e[5] == idade and e[1] >= PROFUNDIDADE_RETORNO
+             and e[0] != raiz]
+    fila.put((indice, None, None, None, busca.nos, (novas, busca.historia)))
+
+
+class BuscaParalela:
+    """Divide os lances da raiz entre processos, cada um com aprofundamento
+    iterativo próprio, e escolhe o melhor na maior profundidade que todos
+    completaram.
+
+    `iniciar` volta na hora: uma thread coordena os processos e põe
+    (valor, lance, profundidade, nos) em `resultados`, com o valor do ponto
+    de vista do lado a jogar. `cancelar` interrompe tudo sem publicar nada.
+
+    A tabela de transposição e o histórico persistem entre as jogadas: os
+    trabalhadores partem deles e, ao terminar, devolvem as entradas novas
+    (profundidade >= PROFUNDIDADE_RETORNO) e o histórico, somados aqui.
+    """
+
+    def __init__(self, processos=None, tabela=None):
+        self.processos = processos or os.cpu_count() or 1
+        self.tabela = tabela if tabela is not None else TabelaTransposicao()
+        self.historia = [[0] * 64 for _ in range(15)]
+        self.resultados = queue.Queue()
+        self._thread = None
+        self._parar = None
+        self._cancelada = False
+
+    def em_andamento(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def iniciar(self, fen, tempo):
+        if self.em_andamento():
+            raise RuntimeError("já existe uma busca em andamento")
+        self._cancelada = False
+        self._parar = multiprocessing.Event()
+        self._thread = threading.Thread(target=self._coordenar, args=(fen, tempo), daemon=True)
+        self._thread.start()
+
+    def resultado(self):
+        """Resultado pronto ou None (não bloqueia)."""
+        try:
+            return self.resultados.get_nowait()
+        except queue.Empty:
+            return None
+
+    def cancelar(self):
+        self._cancelada = True
+        if self._parar is not None:
+            self._parar.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _coordenar(self, fen, tempo):
+        pos = Posicao(fen)
+        lances = pos.lances_legais()
+        if not lances:
+            self.resultados.put((0, 0, 0, 0))
+            return
+        ordenadora = Busca(pos, tabela=self.tabela)
+        ordenadora.historia = self.historia
+        entrada = self.tabela.consultar(pos.hash)
+        ordenadora.ordenar(lances, entrada[4] if entrada is not None else 0, 0)
+        # distribuição alternada: os lances promissores ficam em processos diferentes
+        n = min(self.processos, len(lances))
+        grupos = [lances[i::n] for i in range(n)]
+        fila = multiprocessing.Queue()
+        bits = self.tabela.mascara.bit_length()
+        sementes = [e for e in self.tabela.entradas if e is not None]
+        trabalhadores = [multiprocessing.Process(target=_trabalhador_raiz, daemon=True,
+                                                 args=(i, fen, grupos[i], tempo, fila, self._parar,
+                                                       bits, sementes, self.historia))
+                         for i in range(n)]
+        for p in trabalhadores:
+            p.start()
+
+        por_profundidade = [{} for _ in range(n)]
+        mate = None
+        aprendido = []
+        nos = [0] * n
+        ativos = n
+        prazo = time.perf_counter() + tempo + FOLGA
+        while ativos and not self._cancelada:
+            try:
+                i, profundidade, valor, lance, contagem, retorno = fila.get(
+                    timeout=max(0.01, prazo - time.perf_counter()))
+            except queue.Empty:
+                if time.perf_counter() > prazo:
+                    break
+                continue
+            nos[i] = contagem
+            if profundidade is None:
+                ativos -= 1
+                aprendido.append(retorno)
+            elif mate is None:
+                por_profundidade[i][profundidade] = (valor, lance)
+                if valor > LIMITE_MATE:
+                    # mate a favor: os demais lances não vão superar; os
+                    # trabalhadores param e só falta receber o que aprenderam
+                    mate = por_profundidade[i]
+                    self._parar.set()
+        self._parar.set()
+        for p in trabalhadores:
+            p.join(FOLGA)
+            if p.is_alive():
+                p.terminate()
+        if self._cancelada:
+            return
+        self._incorporar(aprendido)
+
+        com_resultado = [mate] if mate is not None else [d for d in por_profundidade if d]
+        if not com_resultado:
+            self.resultados.put((0, lances[0], 0, sum(nos)))
+            return
+        profundidade = min(max(d) for d in com_resultado)
+        valor, lance = max((d[profundidade] for d in com_resultado), key=lambda r: r[0])
+        self.resultados.put((valor, lance, profundidade, sum(nos)))
+
+    def _incorporar(self, aprendido):
+        """Soma na tabela e no histórico persistentes o que os trabalhadores devolveram."""
+        tabela = self.tabela
+        tabela.nova_busca()   # a mesma idade com que os trabalhadores gravaram
+        for entradas, historia in aprendido:
+            for chave, profundidade, valor, tipo, lance, _ in entradas:
+                tabela.guardar(chave, profundidade, valor, tipo, lance)
+        if aprendido:
+            # os trabalhadores partiram do mesmo histórico envelhecido
+            self.historia = [[max(valores) for valores in zip(*linhas)]
+                             for linhas in zip(*(h for _, h in aprendido))]
@@ -0,0 +1,472 @@
+# -*- coding: utf-8 -*-
+"""
+Núcleo do motor de xadrez (sem pygame)
+
+Posição em 64 casas (casa = y*8 + x, com y = 0 no topo, igual a
+Jogo.tabuleiro[y][x]) e tabelas pré-calculadas: saltos do cavalo e do rei,
+ataques de peão e raios das peças deslizantes por casa. Com as tabelas o
+teste de borda some do laço interno, que é o que o 0x88 resolveria.
+
+A posição mantém uma chave Zobrist de 64 bits e as somas da avaliação
+(material + tabelas peça-casa de xadrez_avaliacao) atualizadas
+incrementalmente em `fazer` e restauradas em `desfazer`.
+
+Lances são inteiros (origem | destino << 6 | promoção << 12 | especial << 15)
+e `fazer`/`desfazer` alteram a posição no lugar, guardando só o necessário
+para voltar; a busca não copia nada por nó.
+
+Cores: AZUL (0) joga de baixo para cima e corresponde às brancas da notação
+FEN; VERMELHO (1) joga de cima para baixo (pretas).
+"""
+
+import random
+
+from xadrez_avaliacao import FASE_TIPO, PST_EG, PST_MG, VALOR_EG, VALOR_MG
+
+AZUL, VERMELHO = 0, 1
+CORES = ('azul', 'vermelho')
+
+VAZIA = 0
+PEAO, CAVALO, BISPO, TORRE, RAINHA, REI = range(1, 7)
+NOMES = (None, 'peao', 'cavalo', 'bispo', 'torre', 'rainha', 'rei')
+TIPOS = {nome: tipo for tipo, nome in enumerate(NOMES) if nome}
+LETRAS = '.pnbrqk'
+
+# tipo especial do lance
+NORMAL, DUPLO, EN_PASSANT, ROQUE = range(4)
+
+# direitos de roque (bits)
+AZUL_CURTO, AZUL_LONGO, VERMELHO_CURTO, VERMELHO_LONGO = 1, 2, 4, 8
+
+FEN_INICIAL = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
+
+
+def peca(tipo, cor):
+    return tipo | cor << 3
+
+def lance(origem, destino, promocao=0, especial=NORMAL):
+    return origem | destino << 6 | promocao << 12 | especial << 15
+
+def nome_casa(casa):
+    return 'abcdefgh'[casa & 7] + str(8 - (casa >> 3))
+
+def casa_de_nome(nome):
+    return (8 - int(nome[1])) * 8 + 'abcdefgh'.index(nome[0])
+
+def lance_uci(m):
+    """Lance em notação UCI ('e2e4', 'e7e8q')."""
+    promocao = m >> 12 & 7
+    return nome_casa(m & 63) + nome_casa(m >> 6 & 63) + (LETRAS[promocao] if promocao else '')
+
+# ----------------- Tabelas pré-calculadas -----------------
+def _saltos(deltas):
+    tabela = []
+    for casa in range(64):
+        x, y = casa & 7, casa >> 3
+        tabela.append(tuple((y + dy) * 8 + x + dx for dx, dy in deltas
+                            if 0 <= x + dx < 8 and 0 <= y + dy < 8))
+    return tuple(tabela)
+
+def _raios(direcoes):
+    tabela = []
+    for casa in range(64):
+        x, y = casa & 7, casa >> 3
+        raios = []
+        for dx, dy in direcoes:
+            raio = []
+            nx, ny = x + dx, y + dy
+            while 0 <= nx < 8 and 0 <= ny < 8:
+                raio.append(ny * 8 + nx)
+                nx += dx
+                ny += dy
+            if raio:
+                raios.append(tuple(raio))
+        tabela.append(tuple(raios))
+    return tuple(tabela)
+
+SALTOS_CAVALO = _saltos(((1, 2), (1, -2), (-1, 2), (-1, -2), (2, 1), (2, -1), (-2, 1), (-2, -1)))
+SALTOS_REI = _saltos(((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)))
+RAIOS_TORRE = _raios(((-1, 0), (1, 0), (0, -1), (0, 1)))
+RAIOS_BISPO = _raios(((-1, -1), (-1, 1), (1, -1), (1, 1)))
+RAIOS_RAINHA = tuple(t + b for t, b in zip(RAIOS_TORRE, RAIOS_BISPO))
+# ATAQUES_PEAO[cor][casa]: casas atacadas por um peão da cor em `casa`
+ATAQUES_PEAO = (_saltos(((-1, -1), (1, -1))), _saltos(((-1, 1), (1, 1))))
+# ORIGENS_PEAO[cor][casa]: de onde um peão da cor atacaria `casa`
+ORIGENS_PEAO = (ATAQUES_PEAO[VERMELHO], ATAQUES_PEAO[AZUL])
+
+# direitos que sobrevivem a um lance que sai de / chega em cada casa
+MASCARA_ROQUE = [15] * 64
+MASCARA_ROQUE[60] &= ~(AZUL_CURTO | AZUL_LONGO)          # e1
+MASCARA_ROQUE[63] &= ~AZUL_CURTO                         # h1
+MASCARA_ROQUE[56] &= ~AZUL_LONGO                         # a1
+MASCARA_ROQUE[4] &= ~(VERMELHO_CURTO | VERMELHO_LONGO)   # e8
+MASCARA_ROQUE[7] &= ~VERMELHO_CURTO                      # h8
+MASCARA_ROQUE[0] &= ~VERMELHO_LONGO                      # a8
+MASCARA_ROQUE = tuple(MASCARA_ROQUE)
+
+# ----------------- Avaliação incremental -----------------
+# PESO_MG[peça][casa]: material + PST, positivo para o azul e negativo para o
+# vermelho (casa espelhada), de modo que as somas ficam do ponto de vista do azul
+def _pesos(valores, pst):
+    pesos = [(0,) * 64] * 15
+    for tipo in range(PEAO, REI + 1):
+        pesos[tipo] = tuple(valores[tipo] + pst[tipo][casa] for casa in range(64))
+        pesos[tipo | VERMELHO << 3] = tuple(-valores[tipo] - pst[tipo][casa ^ 56]
+                                            for casa in range(64))
+    return tuple(pesos)
+
+PESO_MG = _pesos(VALOR_MG, PST_MG)
+PESO_EG = _pesos(VALOR_EG, PST_EG)
+FASE_PECA = tuple(FASE_TIPO[codigo & 7] if codigo & 7 <= REI else 0 for codigo in range(15))
+
+# ----------------- Zobrist -----------------
+# semente fixa: chaves iguais entre execuções e entre processos
+_gerador = random.Random(20240601)
+ZOBRIST_PECA = tuple(tuple(_gerador.getrandbits(64) for _ in range(64)) for _ in range(15))
+ZOBRIST_ROQUE = tuple(_gerador.getrandbits(64) for _ in range(16))
+ZOBRIST_EP = tuple(_gerador.getrandbits(64) for _ in range(8))     # por coluna
+ZOBRIST_LADO = _gerador.getrandbits(64)
+del _gerador
+
+# ----------------- Posição -----------------
+class Posicao:
+    """Tabuleiro, lado a jogar, roque, en passant e pilha para desfazer."""
+
+    def __init__(self, fen=FEN_INICIAL):
+        self.casas = [VAZIA] * 64
+        self.reis = [-1, -1]
+        # (lance, capturada, roque, ep, meio_lances, hash, mg, eg, fase)
+        self.historico = []
+        self.carregar_fen(fen)
+
+    # ---------- FEN ----------
+    def carregar_fen(self, fen):
+        campos = fen.split()
+        if len(campos) < 4:
+            raise ValueError(f"FEN incompleta: {fen!r}")
+        casas = self.casas
+        casas[:] = [VAZIA] * 64
+        self.reis[:] = [-1, -1]
+        linhas = campos[0].split('/')
+        if len(linhas) != 8:
+            raise ValueError(f"FEN deve ter 8 fileiras: {fen!r}")
+        for y, linha in enumerate(linhas):
+            x = 0
+            for ch in linha:
+                if ch.isdigit():
+                    x += int(ch)
+                    continue
+                tipo = LETRAS.find(ch.lower())
+                if tipo <= 0 or x > 7:
+                    raise ValueError(f"FEN inválida: {fen!r}")
+                cor = AZUL if ch.isupper() else VERMELHO
+                casas[y * 8 + x] = peca(tipo, cor)
+                if tipo == REI:
+                    self.reis[cor] = y * 8 + x
+                x += 1
+            if x != 8:
+                raise ValueError(f"fileira com {x} casas na FEN: {fen!r}")
+        self.lado = AZUL if campos[1] == 'w' else VERMELHO
+        self.roque = 0
+        for ch, bit in zip('KQkq', (AZUL_CURTO, AZUL_LONGO, VERMELHO_CURTO, VERMELHO_LONGO)):
+            if ch in campos[2]:
+                self.roque |= bit
+        self.ep = casa_de_nome(campos[3]) if campos[3] != '-' else -1
+        self.meio_lances = int(campos[4]) if len(campos) > 4 else 0
+        self.lance_numero = int(campos[5]) if len(campos) > 5 else 1
+        self.historico.clear()
+        self.hash = self.calcular_hash()
+        self.mg, self.eg, self.fase = self.calcular_avaliacao()
+
+    def calcular_avaliacao(self):
+        """Somas (mg, eg, fase) calculadas do zero (as incrementais devem coincidir)."""
+        mg = eg = fase = 0
+        for casa, p in enumerate(self.casas):
+            if p:
+                mg += PESO_MG[p][casa]
+                eg += PESO_EG[p][casa]
+                fase += FASE_PECA[p]
+        return mg, eg, fase
+
+    def calcular_hash(self):
+        """Chave Zobrist calculada do zero (a incremental deve coincidir)."""
+        h = ZOBRIST_ROQUE[self.roque]
+        for casa, p in enumerate(self.casas):
+            if p:
+                h ^= ZOBRIST_PECA[p][casa]
+        if self.ep >= 0:
+            h ^= ZOBRIST_EP[self.ep & 7]
+        if self.lado == VERMELHO:
+            h ^= ZOBRIST_LADO
+        return h
+
+    def fen(self):
+        fileiras = []
+        for y in range(8):
+            texto, vazias = '', 0
+            for x in range(8):
+                p = self.casas[y * 8 + x]
+                if not p:
+                    vazias += 1
+                    continue
+                if vazias:
+                    texto += str(vazias)
+                    vazias = 0
+                letra = LETRAS[p & 7]
+                texto += letra.upper() if p >> 3 == AZUL else letra
+            fileiras.append(texto + (str(vazias) if vazias else ''))
+        roque = ''.join(ch for ch, bit in zip('KQkq', (AZUL_CURTO, AZUL_LONGO,
+                                                        VERMELHO_CURTO, VERMELHO_LONGO))
+                        if self.roque & bit) or '-'
+        ep = nome_casa(self.ep) if self.ep >= 0 else '-'
+        return (f"{'/'.join(fileiras)} {'w' if self.lado == AZUL else 'b'} {roque} {ep} "
+                f"{self.meio_lances} {self.lance_numero}")
+
+    # ---------- ataques ----------
+    def atacada(self, casa, cor):
+        """True se alguma peça da `cor` ataca `casa`."""
+        casas = self.casas
+        alvo = PEAO | cor << 3
+        for o in ORIGENS_PEAO[cor][casa]:
+            if casas[o] == alvo:
+                return True
+        alvo = CAVALO | cor << 3
+        for o in SALTOS_CAVALO[casa]:
+            if casas[o] == alvo:
+                return True
+        alvo = REI | cor << 3
+        for o in SALTOS_REI[casa]:
+            if casas[o] == alvo:
+                return True
+        rainha = RAINHA | cor << 3
+        alvo = TORRE | cor << 3
+        for raio in RAIOS_TORRE[casa]:
+            for o in raio:
+                p = casas[o]
+                if p:
+                    if p == alvo or p == rainha:
+                        return True
+                    break
+        alvo = BISPO | cor << 3
+        for raio in RAIOS_BISPO[casa]:
+            for o in raio:
+                p = casas[o]
+                if p:
+                    if p == alvo or p == rainha:
+                        return True
+                    break
+        return False
+
+    def em_xeque(self, cor=None):
+        cor = self.lado if cor is None else cor
+        return self.atacada(self.reis[cor], cor ^ 1)
+
+    # ---------- geração ----------
+    def gerar(self, somente_capturas=False):
+        """Lances pseudo-legais do lado a jogar (o rei pode ficar em xeque).
+
+        Com somente_capturas, gera capturas e promoções a rainha (quiescência).
+        """
+        casas = self.casas
+        cor = self.lado
+        lances = []
+        adicionar = lances.append
+        if cor == AZUL:
+            passo, linha_inicial, linha_promocao = -8, 6, 0
+        else:
+            passo, linha_inicial, linha_promocao = 8, 1, 7
+        ataques_peao = ATAQUES_PEAO[cor]
+        for o in range(64):
+            p = casas[o]
+            if not p or p >> 3 != cor:
+                continue
+            tipo = p & 7
+            if tipo == PEAO:
+                d = o + passo
+                promove = d >> 3 == linha_promocao
+                if not casas[d]:
+                    if promove:
+                        adicionar(o | d << 6 | RAINHA << 12)
+                        if not somente_capturas:
+                            for promocao in (CAVALO, TORRE, BISPO):
+                                adicionar(o | d << 6 | promocao << 12)
+                    elif not somente_capturas:
+                        adicionar(o | d << 6)
+                        if o >> 3 == linha_inicial and not casas[d + passo]:
+                            adicionar(o | (d + passo) << 6 | DUPLO << 15)
+                for d in ataques_peao[o]:
+                    q = casas[d]
+                    if q and q >> 3 != cor:
+                        if promove:
+                            for promocao in (RAINHA, CAVALO, TORRE, BISPO):
+                                adicionar(o | d << 6 | promocao << 12)
+                        else:
+                            adicionar(o | d << 6)
+                    elif d == self.ep:
+                        adicionar(o | d << 6 | EN_PASSANT << 15)
+            elif tipo == CAVALO or tipo == REI:
+                for d in (SALTOS_CAVALO if tipo == CAVALO else SALTOS_REI)[o]:
+                    q = casas[d]
+                    if q:
+                        if q >> 3 != cor:
+                            adicionar(o | d << 6)
+                    elif not somente_capturas:
+                        adicionar(o | d << 6)
+            else:
+                raios = RAIOS_TORRE if tipo == TORRE else RAIOS_BISPO if tipo == BISPO else RAIOS_RAINHA
+                for raio in raios[o]:
+                    for d in raio:
+                        q = casas[d]
+                        if q:
+                            if q >> 3 != cor:
+                                adicionar(o | d << 6)
+                            break
+                        if not somente_capturas:
+                            adicionar(o | d << 6)
+        if not somente_capturas and self.roque:
+            self._gerar_roques(adicionar)
+        return lances
+
+    def _gerar_roques(self, adicionar):
+        casas, roque = self.casas, self.roque
+        if self.lado == AZUL:
+            rei, curto, longo, inimiga = 60, AZUL_CURTO, AZUL_LONGO, VERMELHO
+        else:
+            rei, curto, longo, inimiga = 4, VERMELHO_CURTO, VERMELHO_LONGO, AZUL
+        if roque & curto and not casas[rei + 1] and not casas[rei + 2]:
+            if not (self.atacada(rei, inimiga) or self.atacada(rei + 1, inimiga)
+                    or self.atacada(rei + 2, inimiga)):
+                adicionar(rei | (rei + 2) << 6 | ROQUE << 15)
+        if roque & longo and not casas[rei - 1] and not casas[rei - 2] and not casas[rei - 3]:
+            if not (self.atacada(rei, inimiga) or self.atacada(rei - 1, inimiga)
+                    or self.atacada(rei - 2, inimiga)):
+                adicionar(rei | (rei - 2) << 6 | ROQUE << 15)
+
+    def lances_legais(self):
+        legais = []
+        for m in self.gerar():
+            if self.fazer(m):
+                legais.append(m)
+            self.desfazer()
+        return legais
+
+    def encontrar_lance(self, origem, destino, promocao=0):
+        """Lance legal origem->destino (promoção a rainha se não indicada) ou None."""
+        alvo = promocao or RAINHA
+        for m in self.lances_legais():
+            if m & 63 == origem and m >> 6 & 63 == destino and m >> 12 & 7 in (0, alvo):
+                return m
+        return None
+
+    # ---------- fazer / desfazer ----------
+    def fazer(self, m):
+        """Aplica o lance no lugar; devolve False se deixou o próprio rei em xeque
+        (a posição fica alterada mesmo assim: chame `desfazer`)."""
+        casas = self.casas
+        o = m & 63
+        d = m >> 6 & 63
+        especial = m >> 15
+        cor = self.lado
+        p = casas[o]
+        capturada = casas[d]
+        h, mg, eg = self.hash, self.mg, self.eg
+        self.historico.append((m, capturada, self.roque, self.ep, self.meio_lances, h,
+                               mg, eg, self.fase))
+        h ^= ZOBRIST_LADO ^ ZOBRIST_ROQUE[self.roque] ^ ZOBRIST_PECA[p][o]
+        mg -= PESO_MG[p][o]
+        eg -= PESO_EG[p][o]
+        if self.ep >= 0:
+            h ^= ZOBRIST_EP[self.ep & 7]
+        casas[o] = VAZIA
+        if capturada:
+            h ^= ZOBRIST_PECA[capturada][d]
+            mg -= PESO_MG[capturada][d]
+            eg -= PESO_EG[capturada][d]
+            self.fase -= FASE_PECA[capturada]
+        elif especial == EN_PASSANT:
+            alvo = d + 8 if cor == AZUL else d - 8
+            capturada = casas[alvo]
+            casas[alvo] = VAZIA
+            h ^= ZOBRIST_PECA[capturada][alvo]
+            mg -= PESO_MG[capturada][alvo]
+            eg -= PESO_EG[capturada][alvo]
+        elif especial == ROQUE:
+            de, para = (o + 3, o + 1) if d > o else (o - 4, o - 1)
+            torre = casas[de]
+            casas[para] = torre
+            casas[de] = VAZIA
+            h ^= ZOBRIST_PECA[torre][de] ^ ZOBRIST_PECA[torre][para]
+            mg += PESO_MG[torre][para] - PESO_MG[torre][de]
+            eg += PESO_EG[torre][para] - PESO_EG[torre][de]
+        promocao = m >> 12 & 7
+        if promocao:
+            nova = promocao | cor << 3
+            self.fase += FASE_PECA[nova]
+        else:
+            nova = p
+        casas[d] = nova
+        h ^= ZOBRIST_PECA[nova][d]
+        self.mg = mg + PESO_MG[nova][d]
+        self.eg = eg + PESO_EG[nova][d]
+        if p & 7 == REI:
+            self.reis[cor] = d
+        self.roque = roque = self.roque & MASCARA_ROQUE[o] & MASCARA_ROQUE[d]
+        h ^= ZOBRIST_ROQUE[roque]
+        if especial == DUPLO:
+            self.ep = (o + d) >> 1
+            h ^= ZOBRIST_EP[o & 7]
+        else:
+            self.ep = -1
+        self.hash = h
+        self.meio_lances = 0 if capturada or p & 7 == PEAO else self.meio_lances + 1
+        if cor == VERMELHO:
+            self.lance_numero += 1
+        self.lado = cor ^ 1
+        return not self.atacada(self.reis[cor], cor ^ 1)
+
+    def desfazer(self):
+        (m, capturada, self.roque, self.ep, self.meio_lances, self.hash,
+         self.mg, self.eg, self.fase) = self.historico.pop()
+        self.lado = cor = self.lado ^ 1
+        casas = self.casas
+        o = m & 63
+        d = m >> 6 & 63
+        especial = m >> 15
+        p = PEAO | cor << 3 if m >> 12 & 7 else casas[d]
+        casas[o] = p
+        casas[d] = capturada
+        if especial == EN_PASSANT:
+            casas[d + 8 if cor == AZUL else d - 8] = PEAO | (cor ^ 1) << 3
+        elif especial == ROQUE:
+            if d > o:
+                casas[o + 3] = casas[o + 1]
+                casas[o + 1] = VAZIA
+            else:
+                casas[o - 4] = casas[o - 1]
+                casas[o - 1] = VAZIA
+        if p & 7 == REI:
+            self.reis[cor] = o
+        if cor == VERMELHO:
+            self.lance_numero -= 1
+
+    def desfazer_ate(self, tamanho):
+        """Desfaz lances (inclusive nulos) até o histórico voltar a `tamanho`."""
+        while len(self.historico) > tamanho:
+            if self.historico[-1][0]:
+                self.desfazer()
+            else:
+                self.desfazer_nulo()
+
+    def fazer_nulo(self):
+        """Passa a vez (lance nulo); desfazer com `desfazer_nulo`."""
+        self.historico.append((0, VAZIA, self.roque, self.ep, self.meio_lances, self.hash,
+                               self.mg, self.eg, self.fase))
+        self.hash ^= ZOBRIST_LADO
+        if self.ep >= 0:
+            self.hash ^= ZOBRIST_EP[self.ep & 7]
+            self.ep = -1
+        self.lado ^= 1
+
+    def desfazer_nulo(self):
+        _, _, self.roque, self.ep, self.meio_lances, self.hash, *_ = self.historico.pop()
+        self.lado ^= 1
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Perft do gerador de lances (xadrez_motor), sem abrir janela
+
+Conta as folhas da árvore de lances legais até a profundidade N nas posições
+padrão de teste e compara com os totais conhecidos; também mede nós/s.
+Jogo.obter_movimentos_validos usa este mesmo gerador, então isto serve de
+portão para qualquer mudança de desempenho.
+
+Uso:
+  python3 xadrez_perft.py                      # todas as posições, profundidade 3
+  python3 xadrez_perft.py -p 5 --posicao kiwipete
+  python3 xadrez_perft.py --fen "8/8/8/8/8/8/8/K6k w - - 0 1" -p 4 --divide
+"""
+
+import sys, time
+import argparse
+
+from xadrez_motor import FEN_INICIAL, Posicao, lance_uci
+
+# nome -> (FEN, totais conhecidos por profundidade 1, 2, ...)
+POSICOES = {
+    'inicial': (FEN_INICIAL,
+                (20, 400, 8902, 197281, 4865609, 119060324)),
+    'kiwipete': ('r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+                 (48, 2039, 97862, 4085603, 193690690)),
+    'posicao3': ('8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1',
+                 (14, 191, 2812, 43238, 674624, 11030083)),
+    'posicao4': ('r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1',
+                 (6, 264, 9467, 422333, 15833292)),
+    'posicao5': ('rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8',
+                 (44, 1486, 62379, 2103487, 89941194)),
+    'posicao6': ('r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10',
+                 (46, 2079, 89890, 3894594, 164075551)),
+}
+
+
+def perft(pos, profundidade):
+    """Número de folhas legais a `profundidade` lances da posição."""
+    if profundidade == 0:
+        return 1
+    total = 0
+    for m in pos.gerar():
+        if pos.fazer(m):
+            total += perft(pos, profundidade - 1) if profundidade > 1 else 1
+        pos.desfazer()
+    return total
+
+def dividir(pos, profundidade):
+    """Folhas por lance da raiz (para achar o lance com contagem errada)."""
+    folhas = {}
+    for m in pos.lances_legais():
+        pos.fazer(m)
+        folhas[lance_uci(m)] = perft(pos, profundidade - 1)
+        pos.desfazer()
+    return folhas
+
+def medir(fen, profundidade):
+    """(folhas, segundos) de perft na posição."""
+    pos = Posicao(fen)
+    inicio = time.perf_counter()
+    total = perft(pos, profundidade)
+    decorrido = time.perf_counter() - inicio
+    if pos.fen() != Posicao(fen).fen():
+        raise AssertionError(f"fazer/desfazer não restaurou a posição: {pos.fen()}")
+    return total, decorrido
+
+def main():
+    parser = argparse.ArgumentParser(description="Perft e nós/s do gerador de lances")
+    parser.add_argument('-p', '--profundidade', type=int, default=3)
+    parser.add_argument('--posicao', choices=sorted(POSICOES), action='append',
+                        help="posição padrão (repetível; padrão: todas)")
+    parser.add_argument('--fen', help="posição própria (sem total de referência)")
+    parser.add_argument('--divide', action='store_true', help="folhas por lance da raiz")
+    args = parser.parse_args()
+
+    if args.fen:
+        casos = [('fen', args.fen, ())]
+    else:
+        casos = [(nome, *POSICOES[nome]) for nome in (args.posicao or POSICOES)]
+
+    falhas = 0
+    nos_total, tempo_total = 0, 0.0
+    for nome, fen, esperados in casos:
+        if args.divide:
+            pos = Posicao(fen)
+            for uci, n in sorted(dividir(pos, args.profundidade).items()):
+                print(f"  {uci}: {n}")
+        for profundidade in range(1, args.profundidade + 1):
+            total, decorrido = medir(fen, profundidade)
+            nos_total += total
+            tempo_total += decorrido
+            if profundidade <= len(esperados):
+                esperado = esperados[profundidade - 1]
+                situacao = 'ok' if total == esperado else f'FALHOU (esperado {esperado})'
+                falhas += total != esperado
+            else:
+                situacao = 'sem referência'
+            nps = total / decorrido if decorrido > 0 else 0.0
+            print(f"{nome:10} p={profundidade} folhas={total:>10} {decorrido:8.2f}s "
+                  f"{nps:>10.0f} nós/s  {situacao}")
+    if tempo_total > 0:
+        print(f"total: {nos_total} folhas em {tempo_total:.2f}s ({nos_total / tempo_total:.0f} nós/s)")
+    return 1 if falhas else 0
+
+if __name__ == "__main__":
+    sys.exit(main())